@@ -1,16 +1,15 @@
 import os
 import json
 from crewai import Agent, Task
-from usefulTools.llm_repository import ClaudeSonnet
-from langchain_anthropic import ChatAnthropic
+from usefulTools.llm_repository import ClaudeSonnet, get_anthropic_client, get_llm
+from usefulTools.llm_cache import cached_messages_create
 from usefulTools.search_tools import search_api_tool
-import anthropic
 import config
 
 def generate_agents_and_tasks(research_topic):
-    client = anthropic.Anthropic(api_key=config.ANTHROPIC_API_KEY)
+    client = get_anthropic_client()
     model_name = "claude-3-5-sonnet-20240620"  # or whatever the correct model name is
-    llm = ChatAnthropic(model=model_name, anthropic_api_key=config.ANTHROPIC_API_KEY)
+    llm = get_llm("ClaudeSonnet", model=model_name, max_tokens=4096)
 
     # Generate agents
     agent_generation_prompt = f"""Given the research topic: '{research_topic}', determine the optimal number of expert agents needed (between 3 and 5) and generate a title and description for each agent that will contribute to successfully researching this topic. 
@@ -19,7 +18,7 @@ def generate_agents_and_tasks(research_topic):
     Also, indicate whether each agent would benefit from having a search tool (yes/no).
     """
 
-    agent_generation_message = client.messages.create(
+    agent_generation_message = cached_messages_create(client,
         model=model_name,
         max_tokens=8192,
         temperature=0.5,
@@ -56,7 +55,7 @@ def generate_agents_and_tasks(research_topic):
     for i, agent_info in enumerate(agents, 1):
         backstory_prompt = f"Generate a 2-3 sentence backstory for Agent {i}, a {agent_info['title']}. The backstory should align with their role in researching the topic: '{research_topic}'. Do not include a specific name, just refer to them as 'Agent {i}'."
         
-        backstory_message = client.messages.create(
+        backstory_message = cached_messages_create(client,
             model=model_name,
             max_tokens=8192,
             temperature=0.5,
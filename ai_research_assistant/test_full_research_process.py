@@ -1,12 +1,13 @@
 import json
 import os
 from crewai import Agent, Task, Crew, Process
-from langchain_anthropic import ChatAnthropic
 import sys
 
 # Ensure this path points to the directory containing your agent_generator.py
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from ai_research_assistant.agent_generator import generate_agents_and_tasks
+from usefulTools.llm_repository import get_llm
+from usefulTools.llm_usage import write_usage_report
 
 def serialize_agent(agent):
     return {
@@ -33,7 +34,7 @@ def load_from_file(filename):
     with open(filename, 'r') as f:
         data = json.load(f)
     
-    llm = ChatAnthropic(model="claude-3-5-sonnet-20240620")
+    llm = get_llm("ClaudeSonnet", model="claude-3-5-sonnet-20240620", max_tokens=4096)
     
     agents = [
         Agent(
@@ -104,6 +105,9 @@ def main():
         with open(results_filename, 'w') as f:
             f.write(result)
         print(f"\nResults saved to {results_filename}")
+
+        usage_json, usage_table = write_usage_report(f"{research_topic.replace(' ', '_')}")
+        print(f"LLM usage report saved to {usage_json} and {usage_table}")
     else:
         print("Research process cancelled.")
 
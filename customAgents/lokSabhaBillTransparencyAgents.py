@@ -10,6 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 from usefulTools.search_tools import search_tool, youtube_tool, search_api_tool
 from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.crew_checkpoint import kickoff_with_checkpoints
 
 os.environ["GROQ_API_KEY"] = config.GROQ_API_KEY
 os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
@@ -94,14 +95,14 @@ def run_bill_analysis(pdf_path):
     pdf_content = read_pdf(pdf_path)
     agents, tasks = create_agents_and_tasks(pdf_content)
 
-    crew = Crew(
-        agents=agents,
-        tasks=tasks,
+    # Re-running on the same PDF after a failure resumes at the first unfinished task
+    output = kickoff_with_checkpoints(
+        "bill_analysis",
+        agents,
+        tasks,
         verbose=True,
         process=Process.sequential
     )
-
-    output = crew.kickoff()
     return output
 
 if __name__ == '__main__':
@@ -1,8 +1,9 @@
-import requests
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import config
+from usefulTools.rate_limiter import send_with_rate_limit
 
 def google_custom_search(query, api_key=config.GOOGLE_API_KEY, cx='16a98b7fb85c346d4', num_results=10):
     base_url = "https://www.googleapis.com/customsearch/v1"
@@ -14,7 +15,7 @@ def google_custom_search(query, api_key=config.GOOGLE_API_KEY, cx='16a98b7fb85c3
         'num': min(num_results, 10)  # API allows max 10 results per query
     }
     
-    response = requests.get(base_url, params=params)
+    response = send_with_rate_limit("GET", base_url, api_key, params=params)
     data = response.json()
     
     results = []
@@ -5,23 +5,20 @@ import requests
 import sys
 import os
 from crewai import Agent, Task, Crew, Process
-from langchain_openai import ChatOpenAI
 from tkinter import messagebox
 from tavilySearchEngine import process_search_results
 import io
 from agentCreator import generate_agent_details
 import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from usefulTools.llm_repository import get_llm
 from custom_dialogs import LargeTextInputDialog  # Import the custom dialog for search queries
 
 # Existing configurations and API keys
 OPENAI_API_KEY = config.OPENAI_API_KEY
 os.environ["GROQ_API_KEY"] = config.GROQ_API_KEY
 
-llm_GROQ = ChatOpenAI(
-    openai_api_base="https://api.groq.com/openai/v1",
-    openai_api_key=os.getenv("GROQ_API_KEY"),
-    model_name="llama3-70b-8192"
-)
+llm_GROQ = get_llm("GROQ")
 
 class GUIApp(tk.Tk):
     def __init__(self):
@@ -29,21 +26,9 @@ class GUIApp(tk.Tk):
         self.title("AI Agent Manager")
         self.geometry("800x600")
         self.llms = {
-            "GPT4o": ChatOpenAI(
-                openai_api_base="https://api.openai.com/v1/chat/completions",
-                openai_api_key=config.OPENAI_API_KEY,
-                model_name="gpt-4o"
-            ),
-            "Claude": ChatOpenAI(
-                openai_api_base="https://api.claude.com/v1",
-                openai_api_key=config.ANTHROPIC_API_KEY,
-                model_name="claude-3-haiku-20240307"
-            ),
-            "GROQ": ChatOpenAI(
-                openai_api_base="https://api.groq.com/openai/v1",
-                openai_api_key=config.ANTHROPIC_API_KEY,
-                model_name="llama3-70b-8192"
-            )
+            "GPT4o": get_llm("GPT4o"),
+            "Claude": get_llm("ClaudeHaiku"),
+            "GROQ": llm_GROQ
         }
         self.agents = []
         # self.goal = "Get a couple experts who can speak about the evolution of European sexuality over the last 500 years on my podcast"
@@ -9,9 +9,10 @@ Handles audio transcription, agent responses, and workflow orchestration.
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import tempfile
 import os
+import sys
 import json
 import uuid
 from datetime import datetime
@@ -23,6 +24,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Local imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from usefulTools.llm_governor import get_governor, priority_scope
+from usefulTools.prompt_cache import prompt_cache_stats
 from whisper_integration import WhisperTranscriber
 from personal_assistant_system import PersonalAssistantWorkflow, PersonalAssistantAgents
 from airtable_integration import AirtableManager
@@ -87,6 +91,85 @@ def get_conversational_response(transcription: str) -> str:
         logger.error(f"Conversational response error: {e}")
         return f"I understand you said: '{transcription}'. Let me help you with that. Which project lane should I focus on - Podcasting, Distillery Lab, Podcast Bots AI, or something else?"
 
+def store_chat_response(session_id: str, message: str, response: str) -> Dict[str, Any]:
+    """Record a chat exchange in the session and build the /chat response body"""
+    if session_id not in sessions:
+        sessions[session_id] = {"created_at": datetime.now().isoformat()}
+    
+    sessions[session_id].update({
+        "user_message": message,
+        "agent_response": response,
+        "chat_timestamp": datetime.now().isoformat(),
+        "status": "awaiting_approval"
+    })
+    
+    return {
+        "success": True,
+        "session_id": session_id,
+        "response": response,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def store_refined_response(session_id: str, refinement: str, refined_response: str) -> Dict[str, Any]:
+    """Record a refinement in the session and build the /refine response body"""
+    session = sessions[session_id]
+    session.update({
+        "refined_response": refined_response,
+        "refinement_history": session.get("refinement_history", []) + [{
+            "refinement": refinement,
+            "response": refined_response,
+            "timestamp": datetime.now().isoformat()
+        }],
+        "status": "refined",
+        "refinement_timestamp": datetime.now().isoformat()
+    })
+    
+    return {
+        "success": True,
+        "session_id": session_id,
+        "refined_response": refined_response,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def sse_response(chunks, fallback: str, on_complete) -> StreamingResponse:
+    """
+    Stream text chunks to the client as Server-Sent Events.
+    
+    Emits a "token" event per chunk and finally a "done" event whose data is
+    on_complete(full_text), the same body the blocking endpoint returns. If the
+    stream fails before any text, the fallback text is sent instead, as the
+    blocking endpoints do; a later failure adds an "error" event before "done".
+    """
+    def events():
+        parts = []
+        try:
+            for text in chunks:
+                parts.append(text)
+                yield sse_event("token", {"text": text})
+        except Exception as e:
+            logger.error(f"Streaming error: {e}")
+            if parts:
+                yield sse_event("error", {"detail": str(e)})
+            else:
+                parts.append(fallback)
+                yield sse_event("token", {"text": fallback})
+        finally:
+            # A disconnected client closes events(); free the stream's LLM slot with it
+            close = getattr(chunks, "close", None)
+            if close:
+                close()
+        yield sse_event("done", on_complete("".join(parts)))
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # =============================================================================
 # API ENDPOINTS
 # =============================================================================
@@ -101,8 +184,10 @@ async def root():
         "endpoints": {
             "transcribe": "POST /transcribe - Upload audio for transcription",
             "chat": "POST /chat - Get conversational response",
+            "chat_stream": "POST /chat/stream - Stream the conversational response (Server-Sent Events)",
             "approve": "POST /approve - Approve and trigger full workflow",
-            "sessions": "GET /sessions - View active sessions"
+            "sessions": "GET /sessions - View active sessions",
+            "llm_metrics": "GET /metrics/llm - LLM queue depth, wait times and prompt cache hit ratio"
         }
     }
 
@@ -191,31 +276,42 @@ async def chat_with_assistant(request_data: dict):
         if not message:
             raise HTTPException(status_code=400, detail="Message is required")
         
-        # Get conversational response
-        response = get_conversational_response(message)
+        # Get conversational response; chat is served ahead of crew and batch LLM calls
+        with priority_scope("interactive"):
+            response = get_conversational_response(message)
         
         # Store in session
-        if session_id not in sessions:
-            sessions[session_id] = {"created_at": datetime.now().isoformat()}
-        
-        sessions[session_id].update({
-            "user_message": message,
-            "agent_response": response,
-            "chat_timestamp": datetime.now().isoformat(),
-            "status": "awaiting_approval"
-        })
-        
-        return {
-            "success": True,
-            "session_id": session_id,
-            "response": response,
-            "timestamp": datetime.now().isoformat()
-        }
+        return store_chat_response(session_id, message, response)
         
     except Exception as e:
         logger.error(f"Chat error: {e}")
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
 
+@app.post("/chat/stream")
+async def chat_with_assistant_stream(request_data: dict):
+    """
+    Stream the conversational response as Server-Sent Events
+    
+    Args:
+        request_data: JSON with 'message' and optional 'session_id'
+        
+    Returns:
+        text/event-stream of "token" events ({"text": ...}) followed by a
+        "done" event carrying the same body as /chat
+    """
+    message = request_data.get("message", "")
+    session_id = request_data.get("session_id", f"session_{uuid.uuid4().hex[:8]}")
+    
+    if not message:
+        raise HTTPException(status_code=400, detail="Message is required")
+    
+    # The stream keeps the interactive priority even though it is consumed later
+    with priority_scope("interactive"):
+        chunks = assistant_workflow.stream_personal_assistant_response(message)
+    
+    fallback = f"I understand you said: '{message}'. Let me help you with that. Which project lane should I focus on - Podcasting, Distillery Lab, Podcast Bots AI, or something else?"
+    return sse_response(chunks, fallback, lambda response: store_chat_response(session_id, message, response))
+
 @app.post("/approve")
 async def approve_and_execute(request_data: dict):
     """
@@ -243,7 +339,8 @@ async def approve_and_execute(request_data: dict):
             raise HTTPException(status_code=400, detail="No input to process")
         
         # Trigger full workflow (all 3 agents)
-        workflow_result = assistant_workflow.process_speech_input(original_input)
+        with priority_scope("crew"):
+            workflow_result = assistant_workflow.process_speech_input(original_input)
         
         # Create tasks in Airtable if configured
         task_results = None
@@ -404,31 +501,53 @@ async def refine_understanding(request_data: dict):
         """
         
         # Get refined response from the agent
-        refined_response = assistant_workflow.refine_understanding(conversation_context, refinement)
+        with priority_scope("interactive"):
+            refined_response = assistant_workflow.refine_understanding(conversation_context, refinement)
         
         # Update session with refined understanding
-        session.update({
-            "refined_response": refined_response,
-            "refinement_history": session.get("refinement_history", []) + [{
-                "refinement": refinement,
-                "response": refined_response,
-                "timestamp": datetime.now().isoformat()
-            }],
-            "status": "refined",
-            "refinement_timestamp": datetime.now().isoformat()
-        })
-        
-        return {
-            "success": True,
-            "session_id": session_id,
-            "refined_response": refined_response,
-            "timestamp": datetime.now().isoformat()
-        }
+        return store_refined_response(session_id, refinement, refined_response)
         
     except Exception as e:
         logger.error(f"Refinement error: {e}")
         raise HTTPException(status_code=500, detail=f"Refinement failed: {str(e)}")
 
+@app.post("/refine/stream")
+async def refine_understanding_stream(request_data: dict):
+    """
+    Stream the refined response as Server-Sent Events
+    
+    Args:
+        request_data: JSON with 'session_id', 'conversation_context', and 'refinement'
+        
+    Returns:
+        text/event-stream of "token" events followed by a "done" event
+        carrying the same body as /refine
+    """
+    session_id = request_data.get("session_id")
+    conversation_context = request_data.get("conversation_context", "")
+    refinement = request_data.get("refinement", "")
+    
+    if not session_id or session_id not in sessions:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    if not refinement:
+        raise HTTPException(status_code=400, detail="Refinement text is required")
+    
+    with priority_scope("interactive"):
+        chunks = assistant_workflow.stream_refined_understanding(conversation_context, refinement)
+    
+    fallback = f"I understand you want to add: '{refinement}'. Let me incorporate this into my understanding and provide a more complete response."
+    return sse_response(chunks, fallback, lambda response: store_refined_response(session_id, refinement, response))
+
+@app.get("/metrics/llm")
+async def get_llm_metrics():
+    """LLM governor metrics (in-flight calls, queue depth and wait times per priority class) and prompt cache hit ratio"""
+    return {
+        "governor": get_governor().metrics(),
+        "prompt_cache": prompt_cache_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.get("/sessions")
 async def get_sessions():
     """Get all active sessions (for debugging)"""
@@ -6,7 +6,7 @@ import TranscriptionDisplay from './components/TranscriptionDisplay'
 import AgentResponse from './components/AgentResponse'
 import ApprovalSection from './components/ApprovalSection'
 import SessionInfo from './components/SessionInfo'
-import { generateSessionId } from './utils/helpers'
+import { generateSessionId, readServerSentEvents } from './utils/helpers'
 
 const API_BASE_URL = 'http://localhost:8000'
 
@@ -82,10 +82,10 @@ function App() {
     }
   }
 
-  // Get conversational response from agent
+  // Get conversational response from agent, rendering tokens as they stream in
   const getAgentResponse = async (text) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/chat`, {
+      const response = await fetch(`${API_BASE_URL}/chat/stream`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -100,14 +100,28 @@ function App() {
         throw new Error(`HTTP error! status: ${response.status}`)
       }
       
-      const result = await response.json()
+      let result = null
+      let streamed = ''
+      setAgentResponse('')
       
-      if (result.success) {
+      await readServerSentEvents(response, (event, data) => {
+        if (event === 'token') {
+          streamed += data.text
+          setAgentResponse(streamed)
+          setCurrentStatus('streaming_response')
+        } else if (event === 'done') {
+          result = data
+        } else if (event === 'error') {
+          console.error('Agent response stream error:', data.detail)
+        }
+      })
+      
+      if (result && result.success) {
         setAgentResponse(result.response)
         setShowApproval(true)
         setCurrentStatus('awaiting_approval')
       } else {
-        throw new Error(result.message || 'Agent response failed')
+        throw new Error((result && result.message) || 'Agent response failed')
       }
       
     } catch (err) {
@@ -301,6 +315,8 @@ function App() {
         return 'Processing your audio...'
       case 'getting_response':
         return 'Getting agent response...'
+      case 'streaming_response':
+        return 'Agent is responding...'
       case 'awaiting_approval':
         return 'Review the response and choose an action'
       case 'executing':
@@ -320,6 +336,7 @@ function App() {
         return 'text-red-500'
       case 'transcribing':
       case 'getting_response':
+      case 'streaming_response':
       case 'executing':
         return 'text-blue-500'
       case 'completed':
@@ -9,6 +9,7 @@ const SessionInfo = ({ sessionId, status }) => {
         return <div className="w-3 h-3 bg-red-500 rounded-full animate-pulse" />
       case 'transcribing':
       case 'getting_response':
+      case 'streaming_response':
       case 'executing':
         return <div className="w-3 h-3 bg-blue-500 rounded-full animate-pulse" />
       case 'completed':
@@ -30,6 +31,8 @@ const SessionInfo = ({ sessionId, status }) => {
         return 'Transcribing'
       case 'getting_response':
         return 'Processing'
+      case 'streaming_response':
+        return 'Responding'
       case 'awaiting_approval':
         return 'Awaiting Approval'
       case 'executing':
@@ -46,3 +46,30 @@ export const convertBlobToArrayBuffer = (blob) => {
     reader.readAsArrayBuffer(blob)
   })
 }
+
+// Read a text/event-stream response, calling onEvent(event, data) per event
+export const readServerSentEvents = async (response, onEvent) => {
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+    
+    let boundary
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+      
+      let event = 'message'
+      let data = ''
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7)
+        else if (line.startsWith('data: ')) data += line.slice(6)
+      }
+      if (data) onEvent(event, JSON.parse(data))
+    }
+  }
+}
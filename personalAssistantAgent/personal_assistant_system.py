@@ -25,7 +25,7 @@ import sys
 import json
 import logging
 import uuid
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from pydantic import BaseModel, Field
 
 # Configure logging
@@ -35,7 +35,9 @@ logger = logging.getLogger(__name__)
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
-from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.llm_repository import get_anthropic_client
+from usefulTools.llm_router import llm_for
+from usefulTools.llm_streaming import stream_text
 from usefulTools.search_tools import serper_search_tool
 
 # Set up environment variables
@@ -139,7 +141,7 @@ PROJECT_LANES = {
 
 class PersonalAssistantAgents:
     def __init__(self):
-        self.llm = ClaudeSonnet
+        self.llm = llm_for("synthesize")
         self.conversation_history: List[ConversationContext] = []
         
     def create_personal_assistant_agent(self) -> Agent:
@@ -371,15 +373,9 @@ class PersonalAssistantWorkflow:
         
         print(f"Session saved to: {filepath}")
     
-    def get_personal_assistant_response(self, user_speech: str) -> str:
-        """Get just the personal assistant's conversational response"""
-        try:
-            # Create personal assistant agent
-            personal_assistant = self.agents.create_personal_assistant_agent()
-            
-            # Create a simple conversation task
-            conversation_task = Task(
-                description=f"""The user just said: "{user_speech}"
+    def _conversation_task_text(self, user_speech: str) -> tuple:
+        """Description and expected output of the conversational response task"""
+        description = f"""The user just said: "{user_speech}"
                 
                 As Rajeev's intelligent personal assistant, respond conversationally and helpfully:
                 
@@ -394,9 +390,8 @@ class PersonalAssistantWorkflow:
                 4. SUGGEST: What specific actions or next steps would be helpful?
                 
                 Be conversational, proactive, and demonstrate understanding of his work context.
-                Don't just repeat what he said - add value and insight.""",
-                agent=personal_assistant,
-                expected_output="""A conversational response that shows understanding and provides value:
+                Don't just repeat what he said - add value and insight."""
+        expected_output = """A conversational response that shows understanding and provides value:
                 1. Acknowledge what he said with understanding
                 2. Identify the relevant project lane and why
                 3. Suggest specific next steps or actions
@@ -404,6 +399,20 @@ class PersonalAssistantWorkflow:
                 5. Demonstrate knowledge of his ongoing work
                 
                 Be natural and conversational - like a smart assistant who knows his work well."""
+        return description, expected_output
+
+    def get_personal_assistant_response(self, user_speech: str) -> str:
+        """Get just the personal assistant's conversational response"""
+        try:
+            # Create personal assistant agent
+            personal_assistant = self.agents.create_personal_assistant_agent()
+            
+            # Create a simple conversation task
+            description, expected_output = self._conversation_task_text(user_speech)
+            conversation_task = Task(
+                description=description,
+                agent=personal_assistant,
+                expected_output=expected_output
             )
             
             # Execute just this single task
@@ -421,15 +430,9 @@ class PersonalAssistantWorkflow:
             logger.error(f"Personal assistant response error: {e}")
             return f"I understand you said: '{user_speech}'. Let me help you with that. Which project lane should I focus on - Podcasting, Distillery Lab, Podcast Bots AI, or something else?"
 
-    def refine_understanding(self, conversation_context: str, refinement: str) -> str:
-        """Refine the agent's understanding with additional context"""
-        try:
-            # Create personal assistant agent
-            personal_assistant = self.agents.create_personal_assistant_agent()
-            
-            # Create a refinement task
-            refinement_task = Task(
-                description=f"""You are refining your understanding based on additional context from the user.
+    def _refinement_task_text(self, conversation_context: str, refinement: str) -> tuple:
+        """Description and expected output of the refinement task"""
+        description = f"""You are refining your understanding based on additional context from the user.
                 
                 CONVERSATION CONTEXT:
                 {conversation_context}
@@ -443,9 +446,8 @@ class PersonalAssistantWorkflow:
                 4. Updated suggestions and next steps based on the complete picture
                 
                 Be conversational and show that you've thoughtfully incorporated the new information.
-                Focus on building upon your previous response rather than starting over.""",
-                agent=personal_assistant,
-                expected_output="""A refined conversational response that shows:
+                Focus on building upon your previous response rather than starting over."""
+        expected_output = """A refined conversational response that shows:
                 1. Acknowledgment of the additional information
                 2. Updated understanding incorporating both previous and new context
                 3. Refined project lane identification if needed
@@ -453,6 +455,20 @@ class PersonalAssistantWorkflow:
                 5. Any new clarifying questions based on the complete picture
                 
                 Be natural and conversational - show that you're building on the conversation."""
+        return description, expected_output
+
+    def refine_understanding(self, conversation_context: str, refinement: str) -> str:
+        """Refine the agent's understanding with additional context"""
+        try:
+            # Create personal assistant agent
+            personal_assistant = self.agents.create_personal_assistant_agent()
+            
+            # Create a refinement task
+            description, expected_output = self._refinement_task_text(conversation_context, refinement)
+            refinement_task = Task(
+                description=description,
+                agent=personal_assistant,
+                expected_output=expected_output
             )
             
             # Execute the refinement task
@@ -470,6 +486,36 @@ class PersonalAssistantWorkflow:
             logger.error(f"Refinement error: {e}")
             return f"I understand you want to add: '{refinement}'. Let me incorporate this into my understanding and provide a more complete response."
 
+    def _stream_personal_assistant(self, description: str, expected_output: str) -> Iterator[str]:
+        """
+        Stream the personal assistant agent's answer to a task as text chunks.
+
+        Sends the agent's persona and the task in a single streamed call
+        (usefulTools/llm_streaming.py) instead of running a one-task crew, so
+        the first tokens arrive in well under a second. Errors surface while
+        iterating; callers fall back to the blocking methods' messages.
+        """
+        personal_assistant = self.agents.create_personal_assistant_agent()
+        return stream_text(
+            get_anthropic_client(),
+            model=self.agents.llm.model,
+            max_tokens=self.agents.llm.max_tokens,
+            temperature=self.agents.llm.temperature,
+            system=f"You are {personal_assistant.role}. {personal_assistant.backstory}\n\nYour personal goal is: {personal_assistant.goal}",
+            messages=[{
+                "role": "user",
+                "content": f"{description}\n\nThis is the expected criteria for your final answer: {expected_output}"
+            }]
+        )
+
+    def stream_personal_assistant_response(self, user_speech: str) -> Iterator[str]:
+        """Streaming version of get_personal_assistant_response"""
+        return self._stream_personal_assistant(*self._conversation_task_text(user_speech))
+
+    def stream_refined_understanding(self, conversation_context: str, refinement: str) -> Iterator[str]:
+        """Streaming version of refine_understanding"""
+        return self._stream_personal_assistant(*self._refinement_task_text(conversation_context, refinement))
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
@@ -1,5 +1,4 @@
 from crewai import Agent, Task, Crew, Process
-from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 import sys
 import os
@@ -19,13 +18,9 @@ os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
 os.environ["OPENAI_API_KEY"] = config.OPENAI_API_KEY
 
 from usefulTools.search_tools import google_twitter_tool, search_tool
-from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.llm_repository import ClaudeSonnet, get_llm
 
-llm = ChatOpenAI(
-    openai_api_base="https://api.groq.com/openai/v1",
-    openai_api_key=os.getenv("GROQ_API_KEY"),
-    model_name="llama3-70b-8192"
-)
+llm = get_llm("GROQ")
 
 
 def create_research_agent(guest_name, profession):
@@ -8,6 +8,9 @@ from voice_recognition import VoiceRecognition
 # Add the parent directory to the system path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
+from usefulTools.llm_repository import get_anthropic_client
+from usefulTools.llm_retry import CircuitOpenError
+from usefulTools.prompt_cache import cacheable
 
 # Set environment variables
 os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
@@ -23,48 +26,38 @@ def extract_text_from_pdf(pdf_path):
 class PDFChatbot:
     def __init__(self, pdf_path):
         self.text = extract_text_from_pdf(pdf_path)
-        self.client = anthropic.Anthropic()
-        self.system_prompt = (
-            "You are an AI assistant tasked with answering questions about a specific PDF document. "
-            "The content of the PDF has been provided to you. Please use this information to answer "
-            "user questions accurately and concisely."
-        )
-        self.conversation_history = [
+        self.client = get_anthropic_client()
+        # The document is the same on every turn, so it goes in the system prompt
+        # as a cacheable block instead of being re-read at full price each time
+        self.system_prompt = [
             {
-                "role": "user",
-                "content": f"Here's the content of the PDF:\n\n{self.text[:10000]}\n\nPlease use this information to answer my questions. If you need more context, let me know."
+                "type": "text",
+                "text": (
+                    "You are an AI assistant tasked with answering questions about a specific PDF document. "
+                    "The content of the PDF has been provided to you. Please use this information to answer "
+                    "user questions accurately and concisely. If you need information from later parts of "
+                    "the document, say so."
+                )
             },
-            {
-                "role": "assistant",
-                "content": "I understand. I've processed the first part of the PDF content you provided. I'm ready to answer any questions you have about it. What would you like to know? If you need information from later parts of the document, please let me know."
-            }
+            cacheable(f"Here's the content of the PDF:\n\n{self.text[:10000]}")
         ]
+        self.conversation_history = []
         self.voice_recognition = VoiceRecognition()
 
     def answer_question(self, question):
         self.conversation_history.append({"role": "user", "content": question})
-        
-        max_retries = 5
-        base_delay = 1
-        
-        for attempt in range(max_retries):
-            try:
-                response = self.client.messages.create(
-                    model="claude-3-5-sonnet-20240620",
-                    max_tokens=1000,
-                    temperature=0.9,
-                    system=self.system_prompt,
-                    messages=self.conversation_history[-5:]  # Only send the last 5 messages
-                )
-                answer = response.content[0].text
-                self.conversation_history.append({"role": "assistant", "content": answer})
-                return answer
-            except anthropic.RateLimitError as e:
-                if attempt == max_retries - 1:
-                    raise e
-                delay = base_delay * (2 ** attempt)
-                print(f"Rate limit reached. Retrying in {delay} seconds...")
-                time.sleep(delay)
+
+        # Rate limits and overloads are retried inside the client (usefulTools/llm_retry.py)
+        response = self.client.messages.create(
+            model="claude-3-5-sonnet-20240620",
+            max_tokens=1000,
+            temperature=0.9,
+            system=self.system_prompt,
+            messages=self.conversation_history[-5:]  # Only send the last 5 messages
+        )
+        answer = response.content[0].text
+        self.conversation_history.append({"role": "assistant", "content": answer})
+        return answer
 
     def voice_chat(self):
         print("Voice chat mode activated. Speak your questions.")
@@ -88,7 +81,7 @@ class PDFChatbot:
             try:
                 answer = self.answer_question(question)
                 print(f"\nAI: {answer}")
-            except anthropic.RateLimitError:
+            except (anthropic.RateLimitError, CircuitOpenError):
                 print("Rate limit exceeded. Please wait a moment before asking another question.")
                 time.sleep(60)  # Wait for 60 seconds before allowing another question
 
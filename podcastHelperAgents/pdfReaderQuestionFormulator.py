@@ -7,8 +7,6 @@ from langchain.utilities import SerpAPIWrapper
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
-from anthropic import APIStatusError
-import time
 from usefulTools.search_tools import search_tool, youtube_tool,search_api_tool
 from usefulTools.llm_repository import ClaudeSonnet
 
@@ -17,23 +15,6 @@ os.environ["SERPAPI_API_KEY"] = config.SERPAPI_API_KEY
 
 
 
-def retry_on_overload(func, max_retries=5, initial_wait=1):
-    def wrapper(*args, **kwargs):
-        retries = 0
-        while retries < max_retries:
-            try:
-                return func(*args, **kwargs)
-            except APIStatusError as e:
-                if 'overloaded_error' in str(e):
-                    wait_time = initial_wait * (2 ** retries)
-                    print(f"API overloaded. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    retries += 1
-                else:
-                    raise
-        raise Exception("Max retries reached. API still overloaded.")
-    return wrapper
-
 def chunk_pdf(file_path, chunk_size=18):
     chunks = []
     with open(file_path, 'rb') as file:
@@ -46,7 +27,8 @@ def chunk_pdf(file_path, chunk_size=18):
             chunks.append(chunk_text)
     return chunks
 
-@retry_on_overload
+# Overloads and rate limits are retried per request by the LLM client
+# (usefulTools/llm_retry.py), so a failure no longer reruns the whole crew
 def kickoff_crew(crew):
     return crew.kickoff()
 
@@ -1,13 +1,18 @@
 import os
+import re
 import sys
 # Add parent directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from crewai import Agent, Task, Crew, Process
 from usefulTools.search_tools import serper_search_tool, serper_scholar_tool
 import config
-from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.llm_repository import get_llm
+from usefulTools.prompt_cache import cacheable_scope
+from usefulTools.crew_pool import run_crews, report_failures
+from usefulTools.crew_dag import kickoff_task_graph
 os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
 # Initialize LLM instances
+llm = get_llm("ClaudeSonnet")
 
 
 def split_transcript_into_chunks(transcript, chunk_size=4):
@@ -36,8 +41,13 @@ def split_transcript_into_chunks(transcript, chunk_size=4):
     
     return chunks
 
-def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
-    """Create podcast editing agents and tasks for a specific chunk."""
+def create_agents_and_tasks():
+    """
+    Create the podcast editing agents and tasks once for all chunks.
+    Task descriptions use {transcript_chunk}, {chunk_number} and {total_chunks},
+    which are filled in from the kickoff inputs of each chunk. Visual enhancement
+    builds on the context analysis; content research only needs the chunk itself.
+    """
     
     context_analyzer = Agent(
         role="Context Analyzer",
@@ -47,7 +57,7 @@ def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
                     and context. Skilled at identifying key themes, important references,
                     and moments that could benefit from visual support.""",
         tools=[serper_search_tool],
-        llm=ClaudeSonnet
+        llm=llm
     )
 
     visual_enhancement_specialist = Agent(
@@ -58,7 +68,7 @@ def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
                     Skilled at identifying moments where visual elements can strengthen the narrative
                     and improve viewer engagement.""",
         tools=[serper_search_tool],
-        llm=ClaudeSonnet
+        llm=llm
     )
 
     content_researcher = Agent(
@@ -69,11 +79,11 @@ def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
                     content from various sources. Experienced in identifying credible visual
                     and academic resources that can enhance video content.""",
         tools=[serper_search_tool, serper_scholar_tool],
-        llm=ClaudeSonnet
+        llm=llm
     )
 
     context_analysis = Task(
-        description=f"""Analyze this chunk ({chunk_number}/{total_chunks}) of the podcast transcript:
+        description="""Analyze this chunk ({chunk_number}/{total_chunks}) of the podcast transcript:
 
             1. Conversation Context
                 - Main topics being discussed
@@ -100,7 +110,7 @@ def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
     )
 
     visual_enhancement = Task(
-        description=f"""Based on the conversation context in this chunk ({chunk_number}/{total_chunks}),
+        description="""Based on the conversation context in this chunk ({chunk_number}/{total_chunks}),
             suggest specific visual enhancements:
             1. B-roll Opportunities
                 - Identify moments where B-roll footage could enhance the narrative
@@ -114,6 +124,7 @@ def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
             Transcript chunk to analyze:
             {transcript_chunk}""",
         agent=visual_enhancement_specialist,
+        context=[context_analysis],
         expected_output="""Visual enhancement suggestions with:
             1. B-ROLL NEEDS
                - [Timestamp] Description of needed B-roll
@@ -127,7 +138,7 @@ def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
     )
 
     content_research = Task(
-        description=f"""Research and identify specific supplementary content for this chunk ({chunk_number}/{total_chunks}):
+        description="""Research and identify specific supplementary content for this chunk ({chunk_number}/{total_chunks}):
             1. Find relevant visual content
                 - Images that illustrate key points
                 - Video clips that demonstrate concepts
@@ -140,6 +151,7 @@ def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
             Transcript chunk to analyze:
             {transcript_chunk}""",
         agent=content_researcher,
+        context=[],
         expected_output="""Content resource list with:
             1. VISUAL RESOURCES
                - [Timestamp] URLs to specific images/videos
@@ -158,41 +170,154 @@ def create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks):
         content_research
     ]
 
-def analyze_podcast_chunk(transcript_chunk, chunk_number, total_chunks):
-    """Analyze a single chunk of the podcast transcript."""
-    try:
-        agents, tasks = create_agents_and_tasks(transcript_chunk, chunk_number, total_chunks)
-        
-        crew = Crew(
-            agents=agents,
-            tasks=tasks,
+def analyze_podcast_chunk(tasks, transcript_chunk, chunk_number, total_chunks):
+    """Analyze a single chunk of the podcast transcript; returns its visual and content suggestions."""
+    # Each agent re-sends its prompt and the chunk on every tool-use step;
+    # marking the chunk lets those steps read the prefix from the provider cache
+    with cacheable_scope(transcript_chunk):
+        # Content research runs alongside context analysis and visual enhancement;
+        # the task templates are shared by all chunks and never modified
+        output = kickoff_task_graph(
+            tasks,
+            inputs={
+                "transcript_chunk": transcript_chunk,
+                "chunk_number": chunk_number,
+                "total_chunks": total_chunks
+            },
             verbose=True,
-            process=Process.sequential,
             memory=False,
             max_rpm=30
         )
-        
-        result = crew.kickoff()
-        return result
-    except Exception as e:
-        print(f"Error analyzing chunk {chunk_number}: {str(e)}")
-        return None
+    _, visual_suggestions, content_resources = output.tasks_output
+    return f"{visual_suggestions.raw}\n\n{content_resources.raw}"
+
+def format_chunk_analysis(chunk_number, total_chunks, analysis):
+    return f"\n\nCHUNK {chunk_number}/{total_chunks} ANALYSIS:\n{analysis}"
+
+TIMESTAMP_PATTERN = re.compile(r'\[?\b\d{1,2}:\d{2}(?::\d{2})?\b\]?')
+
+def dedupe_suggestions(chunk_analyses):
+    """
+    Fold suggestion lines that repeat an earlier one apart from the timestamp (e.g. the
+    same resource URL recommended in several chunks) into their first occurrence,
+    noting where else they came up. Short lines are kept since they are mostly headings.
+    """
+    first_seen = {}
+    deduped = []
+    for chunk_number, analysis in chunk_analyses:
+        lines = []
+        for line in str(analysis).split('\n'):
+            key = re.sub(r'\W+', ' ', TIMESTAMP_PATTERN.sub('', line)).strip().lower()
+            if len(key) > 20:
+                if key in first_seen:
+                    timestamps = [t.strip('[]') for t in TIMESTAMP_PATTERN.findall(line)]
+                    first_seen[key][2].append(" ".join([f"chunk {chunk_number}"] + timestamps))
+                    continue
+                first_seen[key] = (len(deduped), len(lines), [])
+            lines.append(line)
+        deduped.append((chunk_number, lines))
 
-def analyze_podcast(transcript):
-    """Run the podcast analysis process on chunks of the transcript."""
+    for chunk_index, line_index, repeats in first_seen.values():
+        if repeats:
+            deduped[chunk_index][1][line_index] += f" (also: {', '.join(repeats)})"
+    return [(chunk_number, '\n'.join(lines)) for chunk_number, lines in deduped]
+
+def merge_chunk_analyses(chunk_analyses, total_chunks):
+    """Merge the per-chunk analyses into one deduplicated editing plan for the episode."""
+    editing_producer = Agent(
+        role="Editing Producer",
+        goal="""Combine visual enhancement suggestions made for separate parts of a podcast
+                into a single, deduplicated editing plan for the whole episode""",
+        backstory="""Post-production lead who turns notes from several editors into one
+                    plan. Known for spotting repeated suggestions, keeping the most specific
+                    version of each, and preserving the order of the episode.""",
+        llm=llm
+    )
+
+    analyses_text = "".join(
+        format_chunk_analysis(chunk_number, total_chunks, analysis)
+        for chunk_number, analysis in dedupe_suggestions(chunk_analyses)
+    )
+    merge_suggestions = Task(
+        description=f"""Below are visual enhancement analyses for {len(chunk_analyses)} of the
+            {total_chunks} chunks of one podcast episode, in episode order. Merge them:
+            1. Combine suggestions for the same visual, resource or URL into one entry,
+               listing every timestamp it applies to
+            2. Remove duplicates, keeping the most specific version of each suggestion
+            3. Keep the episode's chronological order
+            4. Do not invent new suggestions or URLs
+
+            Chunk analyses:
+            {analyses_text}""",
+        agent=editing_producer,
+        expected_output="""Episode editing plan with:
+            1. B-ROLL AND VISUAL AIDS
+               - [Timestamp(s)] Suggestion, with the chunks it came from
+            
+            2. RESOURCES
+               - URL or source, licensing notes, and where it is used
+            
+            3. RECURRING THEMES
+               - Visual motifs that appear across several parts of the episode"""
+    )
+
+    crew = Crew(
+        agents=[editing_producer],
+        tasks=[merge_suggestions],
+        verbose=True,
+        process=Process.sequential
+    )
+    return crew.kickoff()
+
+def analyze_podcast(transcript, chunks_path=None, max_workers=None):
+    """
+    Run the podcast analysis as map-reduce: analyze the transcript chunks
+    concurrently (at most max_workers at once, default CREW_MAX_WORKERS), then
+    merge the chunk analyses into one editing plan.
+
+    Each chunk analysis is appended to chunks_path as soon as it completes,
+    so a crash or failed merge doesn't lose finished chunks.
+    """
     chunks = split_transcript_into_chunks(transcript)
     total_chunks = len(chunks)
     
     print(f"\nSplit transcript into {total_chunks} chunks for analysis")
-    all_results = []
-    
-    for i, chunk in enumerate(chunks, 1):
-        print(f"\nAnalyzing chunk {i}/{total_chunks}...")
-        result = analyze_podcast_chunk(chunk, i, total_chunks)
-        if result:
-            all_results.append(f"\n\nCHUNK {i}/{total_chunks} ANALYSIS:\n{result}")
-    
-    return "\n".join(all_results) if all_results else None
+    agents, tasks = create_agents_and_tasks()
+    if chunks_path:
+        with open(chunks_path, 'w', encoding='utf-8') as f:
+            f.write(f"Chunk analyses ({total_chunks} chunks, in order of completion)\n")
+
+    def on_progress(done, total, outcome):
+        chunk_number = outcome.index + 1
+        if not outcome.ok:
+            print(f"Error analyzing chunk {chunk_number}: {str(outcome.error)}")
+            return
+        print(f"\nFinished chunk {chunk_number}/{total_chunks} ({done} of {total} done)")
+        if chunks_path:
+            with open(chunks_path, 'a', encoding='utf-8') as f:
+                f.write(format_chunk_analysis(chunk_number, total_chunks, outcome.output))
+
+    outcomes = run_crews(
+        list(enumerate(chunks, 1)),
+        lambda numbered: analyze_podcast_chunk(tasks, numbered[1], numbered[0], total_chunks),
+        max_workers=max_workers,
+        on_progress=on_progress
+    )
+    report_failures(outcomes, label=lambda numbered: f"chunk {numbered[0]}")
+    chunk_analyses = [(outcome.index + 1, outcome.output) for outcome in outcomes if outcome.ok and outcome.output]
+    if not chunk_analyses:
+        return None
+
+    chunk_section = "\n".join(
+        format_chunk_analysis(chunk_number, total_chunks, analysis) for chunk_number, analysis in chunk_analyses
+    )
+    print(f"\nMerging {len(chunk_analyses)} chunk analyses...")
+    try:
+        merged = merge_chunk_analyses(chunk_analyses, total_chunks)
+    except Exception as e:
+        print(f"Error merging chunk analyses: {str(e)}")
+        return chunk_section
+    return f"EPISODE EDITING PLAN:\n{merged}\n\n{'=' * 60}\nPER-CHUNK ANALYSES:{chunk_section}"
 
 def read_transcript(file_path):
     """Read transcript from the provided file path."""
@@ -212,8 +337,13 @@ def main():
     if not transcript:
         return
     
+    # Chunk analyses are saved here as they complete
+    chunks_path = os.path.join(
+        os.path.dirname(transcript_path),
+        f"visual_enhancement_chunks_{os.path.basename(transcript_path)}"
+    )
     print("\nStarting podcast analysis...")
-    result = analyze_podcast(transcript)
+    result = analyze_podcast(transcript, chunks_path=chunks_path)
     
     if result:
         print("\nAnalysis Results:")
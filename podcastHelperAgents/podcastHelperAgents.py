@@ -7,13 +7,13 @@ import requests
 import sys
 import os
 from crewai import Agent, Task, Crew, Process
-from langchain_openai import ChatOpenAI
 from tkinter import messagebox
 # from tavilySearchEngine import process_search_results
 import io
 from podcastHelperAgentsSpawner import generate_agent_details
-from langchain_anthropic import ChatAnthropic
 import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from usefulTools.llm_repository import get_llm
 import json
 from tkinter import filedialog
 from datetime import datetime
@@ -23,15 +23,8 @@ OPENAI_API_KEY = config.OPENAI_API_KEY
 os.environ["GROQ_API_KEY"] = config.GROQ_API_KEY
 os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
 
-ClaudeSonnet = ChatAnthropic(
-    model="claude-3-5-sonnet-20240620"
-)
-
-llm_GROQ = ChatOpenAI(
-    openai_api_base="https://api.groq.com/openai/v1",
-    openai_api_key=os.getenv("GROQ_API_KEY"),
-    model_name="llama3-70b-8192"
-)
+ClaudeSonnet = get_llm("ClaudeSonnet")
+llm_GROQ = get_llm("GROQ")
 
 class GUIApp(tk.Tk):
     def __init__(self):
@@ -39,11 +32,7 @@ class GUIApp(tk.Tk):
         self.title("Podcast Preparation Assistant")
         self.geometry("1200x800")
         self.llms = {
-            "GPT4o": ChatOpenAI(
-                openai_api_base="https://api.openai.com/v1/chat/completions",
-                openai_api_key=config.OPENAI_API_KEY,
-                model_name="gpt-4o"
-            ),
+            "GPT4o": get_llm("GPT4o"),
             "Claude": ClaudeSonnet,
             "GROQ": llm_GROQ
         }
@@ -503,10 +492,10 @@ class GUIApp(tk.Tk):
 
                 for agent_info in agents_data:
                     if agent_info['llm_type'] == "ChatAnthropic":
-                        llm = ChatAnthropic(model=agent_info['llm_model'])
+                        llm = get_llm("ClaudeSonnet", model=agent_info['llm_model'])
                     else:
                         messagebox.showwarning("Unknown LLM", f"Unknown LLM type: {agent_info['llm_type']}. Using default.")
-                        llm = ChatAnthropic(model="claude-3-5-sonnet-20240620")
+                        llm = ClaudeSonnet
                     
                     agent = Agent(
                         role=agent_info['role'],
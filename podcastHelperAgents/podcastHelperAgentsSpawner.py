@@ -2,14 +2,15 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config 
-import anthropic
+from usefulTools.llm_repository import get_anthropic_client
+from usefulTools.llm_cache import cached_messages_create
 import re
 
 
 def generate_agent_details(blog_rough_cut,goal, context):
     # model = "claude-3-haiku-20240307"
     model = "claude-3-5-sonnet-20240620"
-    client = anthropic.Anthropic(api_key=config.ANTHROPIC_API_KEY)
+    client = get_anthropic_client()
 
     # Step 1: Analyze and distill key points from the rough cut blog
     analysis_prompt = f"""Analyze the following rough cut blog and distill its key points, main themes, and areas that need improvement. Focus on content, structure, clarity, and overall impact.
@@ -19,7 +20,7 @@ def generate_agent_details(blog_rough_cut,goal, context):
 
     Provide a concise summary of the key points and areas for improvement."""
 
-    analysis_message = client.messages.create(
+    analysis_message = cached_messages_create(client,
         model=model,
         max_tokens=4096,
         temperature=0.2,
@@ -50,7 +51,7 @@ def generate_agent_details(blog_rough_cut,goal, context):
     The agents will collaborate and iterate on the rough cut until it reaches a state suitable for publication."""
 
 
-    agent_generation_message = client.messages.create(
+    agent_generation_message = cached_messages_create(client,
         model=model,
         max_tokens=1000,
         temperature=0.0,
@@ -114,7 +115,7 @@ def generate_agent_details(blog_rough_cut,goal, context):
     for role, description in zip(agent_titles, agent_descriptions):
         backstory_prompt = f"Given the agent title '{role}' and the description '{description}', generate a 3 to 4 line backstory for the agent that aligns with their role in refining the provided rough cut blog. The backstory should highlight the agent's expertise, skills, or experience that will contribute to improving the content, structure, clarity, and overall impact of the blog post, ultimately transforming it into a compelling, publication-ready piece."
         
-        backstory_message = client.messages.create(
+        backstory_message = cached_messages_create(client,
             model=model,
             max_tokens=1000,
             temperature=0.0,
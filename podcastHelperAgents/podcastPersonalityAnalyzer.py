@@ -3,14 +3,12 @@ import sys
 from crewai import Agent, Task, Crew, Process
 from langchain_openai import ChatOpenAI
 from langchain_community.tools import DuckDuckGoSearchRun
-from langchain_anthropic import ChatAnthropic
 from langchain_groq import ChatGroq
 from groq import Groq
 from langchain.agents import Tool
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
-from anthropic import APIStatusError
-import time
+from usefulTools.llm_repository import get_llm
 
 os.environ["OPENAI_API_KEY"] = config.OPENAI_API_KEY
 os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
@@ -23,7 +21,7 @@ llmGROQ = ChatGroq(
 
 # Initialize tools and models
 search_tool = DuckDuckGoSearchRun()
-llm = ChatAnthropic(model="claude-3-5-sonnet-20240620")
+llm = get_llm("ClaudeSonnet", model="claude-3-5-sonnet-20240620", max_tokens=4096)
 
 search_tool_wrapped = Tool(
     name="Internet Search",
@@ -31,24 +29,8 @@ search_tool_wrapped = Tool(
     description="Useful for finding information about people, their work, and current events. Input should be a search query."
 )
 
-def retry_on_overload(func, max_retries=5, initial_wait=1):
-    def wrapper(*args, **kwargs):
-        retries = 0
-        while retries < max_retries:
-            try:
-                return func(*args, **kwargs)
-            except APIStatusError as e:
-                if 'overloaded_error' in str(e):
-                    wait_time = initial_wait * (2 ** retries)
-                    print(f"API overloaded. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    retries += 1
-                else:
-                    raise
-        raise Exception("Max retries reached. API still overloaded.")
-    return wrapper
-
-@retry_on_overload
+# Overloads and rate limits are retried per request by the LLM client
+# (usefulTools/llm_retry.py), so a failure no longer reruns the whole crew
 def kickoff_crew(crew):
     return crew.kickoff()
 
@@ -4,8 +4,6 @@ from crewai import Agent, Task, Crew, Process
 from langchain_anthropic import ChatAnthropic
 from langchain_groq import ChatGroq
 import config
-from anthropic import APIStatusError
-import time
 from usefulTools.search_tools import search_api_tool
 from usefulTools.llm_repository import ClaudeSonnet
 
@@ -16,24 +14,8 @@ os.environ["GROQ_API_KEY"] = config.GROQ_API_KEY
 # Initialize tools and models
 llm = ClaudeSonnet
 
-def retry_on_overload(func, max_retries=5, initial_wait=1):
-    def wrapper(*args, **kwargs):
-        retries = 0
-        while retries < max_retries:
-            try:
-                return func(*args, **kwargs)
-            except APIStatusError as e:
-                if 'overloaded_error' in str(e):
-                    wait_time = initial_wait * (2 ** retries)
-                    print(f"API overloaded. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    retries += 1
-                else:
-                    raise
-        raise Exception("Max retries reached. API still overloaded.")
-    return wrapper
-
-@retry_on_overload
+# Overloads and rate limits are retried per request by the LLM client
+# (usefulTools/llm_retry.py), so a failure no longer reruns the whole crew
 def kickoff_crew(crew):
     return crew.kickoff()
 
@@ -8,6 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 from usefulTools.search_tools import search_api_tool, youtube_tool
 from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.crew_checkpoint import kickoff_with_checkpoints
 import logging
 import time
 
@@ -191,17 +192,17 @@ def create_agents_and_tasks(full_transcript, chapter_script):
 def run_podcast_optimizer(full_transcript, chapter_script, max_retries=3):
     agents, tasks = create_agents_and_tasks(full_transcript, chapter_script)
 
-    crew = Crew(
-        agents=agents,
-        tasks=tasks,
-        verbose=2,
-        process=Process.sequential
-    )
-
     for attempt in range(max_retries):
         try:
             logging.info(f"Attempt {attempt + 1} to run the crew")
-            output = crew.kickoff()
+            # Tasks completed by an earlier attempt (or run) are restored, not re-run
+            output = kickoff_with_checkpoints(
+                "podcast_optimizer",
+                agents,
+                tasks,
+                verbose=2,
+                process=Process.sequential
+            )
 
             # Check if all tasks are completed
             incomplete_tasks = [task for task in tasks if task.output is None]
@@ -9,6 +9,7 @@ from usefulTools.llm_repository import ClaudeSonnet
 import config
 from usefulTools.search_tools import search_api_tool, youtube_tool
 from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.crew_checkpoint import kickoff_with_checkpoints
 import logging
 import time
 
@@ -92,39 +93,30 @@ def create_agents_and_tasks(full_transcript, host_sentiment):
 def run_podcast_segment_extractor(full_transcript, host_sentiment, max_retries=3):
     agents, tasks = create_agents_and_tasks(full_transcript, host_sentiment)
 
-    crew = Crew(
-        agents=agents,
-        tasks=tasks,
-        verbose=2,
-        process=Process.sequential
-    )
-
+    # API errors are retried per request by the LLM client (usefulTools/llm_retry.py);
+    # only a run that finishes with incomplete tasks is repeated here, resuming after
+    # the tasks that already completed
     for attempt in range(max_retries):
-        try:
-            logging.info(f"Attempt {attempt + 1} to run the crew")
-            output = crew.kickoff()
-
-            # Check if all tasks are completed
-            if all(task.output is not None for task in tasks):
-                logging.info("All tasks completed successfully")
-                return output
-            else:
-                logging.warning("Some tasks were not completed")
-                if attempt < max_retries - 1:
-                    logging.info("Retrying...")
-                    time.sleep(5)  # Wait for 5 seconds before retrying
-                else:
-                    logging.error("Max retries reached. Some tasks are still incomplete.")
-                    return "Error: Not all tasks could be completed after maximum retries."
-
-        except Exception as e:
-            logging.error(f"An error occurred: {str(e)}")
+        logging.info(f"Attempt {attempt + 1} to run the crew")
+        output = kickoff_with_checkpoints(
+            "podcast_segment_extractor",
+            agents,
+            tasks,
+            verbose=2,
+            process=Process.sequential
+        )
+
+        # Check if all tasks are completed
+        if all(task.output is not None for task in tasks):
+            logging.info("All tasks completed successfully")
+            return output
+        else:
+            logging.warning("Some tasks were not completed")
             if attempt < max_retries - 1:
-                logging.info("Retrying due to error...")
-                time.sleep(5)  # Wait for 5 seconds before retrying
+                logging.info("Retrying...")
             else:
-                logging.error("Max retries reached. Unable to complete the process.")
-                raise
+                logging.error("Max retries reached. Some tasks are still incomplete.")
+                return "Error: Not all tasks could be completed after maximum retries."
 
     return "Error: Unable to complete all tasks after maximum retries."
 
@@ -1,12 +1,14 @@
 from crewai import Agent, Task, Crew, Process
-from langchain_anthropic import ChatAnthropic
 import os
+import sys
 from typing import List, Dict, Tuple
 import logging
 import time
 import json
 from dataclasses import dataclass
 from enum import Enum
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from usefulTools.llm_repository import get_llm
 
 # Configure logging
 logging.basicConfig(
@@ -135,6 +137,8 @@ class ContentAnalytics:
 
 def create_agents_and_tasks(transcript: str, podcast_metadata: dict, subject_matter: Dict[str, ThematicElement]) -> Tuple[List[Agent], List[Task]]:
     """Creates specialized agents and tasks for viral clip generation with thematic awareness"""
+    # One shared client for all three agents
+    clip_llm = get_llm("ClaudeSonnet", model="claude-3-sonnet-20240229", max_tokens=4096)
     
     content_analyzer = Agent(
         role="Content Intelligence Analyst",
@@ -144,11 +148,7 @@ def create_agents_and_tasks(transcript: str, podcast_metadata: dict, subject_mat
         are both engaging and substantively valuable.""",
         verbose=True,
         allow_delegation=False,
-        llm=ChatAnthropic(
-            model="claude-3-sonnet-20240229",
-            anthropic_api_key=os.getenv('ANTHROPIC_API_KEY'),
-            max_tokens=4096
-        )
+        llm=clip_llm
     )
     
     narrative_architect = Agent(
@@ -159,11 +159,7 @@ def create_agents_and_tasks(transcript: str, podcast_metadata: dict, subject_mat
         compelling arcs that educate and entertain.""",
         verbose=True,
         allow_delegation=False,
-        llm=ChatAnthropic(
-            model="claude-3-sonnet-20240229",
-            anthropic_api_key=os.getenv('ANTHROPIC_API_KEY'),
-            max_tokens=4096
-        )
+        llm=clip_llm
     )
     
     subject_expert = Agent(
@@ -174,11 +170,7 @@ def create_agents_and_tasks(transcript: str, podcast_metadata: dict, subject_mat
         integrity while remaining accessible.""",
         verbose=True,
         allow_delegation=False,
-        llm=ChatAnthropic(
-            model="claude-3-sonnet-20240229",
-            anthropic_api_key=os.getenv('ANTHROPIC_API_KEY'),
-            max_tokens=4096
-        )
+        llm=clip_llm
     )
 
     # Task 1: Initial Content Analysis with Thematic Awareness
@@ -12,6 +12,7 @@ os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
 # Initialize LLMs
 from usefulTools.llm_repository import ClaudeSonnet
 from usefulTools.search_tools import search_api_tool
+from usefulTools.crew_dag import kickoff_task_graph
 
 os.environ["OPENAI_API_KEY"] = config.OPENAI_API_KEY
 
@@ -62,10 +63,9 @@ def create_video_analysis_task(analyzer_agent):
         7. Relevant background context (50-75 words)"""
     )
 
-def create_question_generation_task(question_agent, content_analysis):
+def create_question_generation_task(question_agent, analysis_task):
     return Task(
-        description=f"""Based on the following content analysis, generate a set of 10-15 compelling questions for the podcast interview:
-        {content_analysis}
+        description="""Based on the video content analysis provided as context, generate a set of 10-15 compelling questions for the podcast interview.
         
         Your questions should:
         1. Cover the main topics identified in the video
@@ -84,12 +84,13 @@ def create_question_generation_task(question_agent, content_analysis):
         5. 1-2 thought-provoking or challenging questions
         6. 1 question addressing potential controversies (if applicable)
         7. 1-2 questions connecting the speaker's ideas to broader contexts
-        Each question should be clear, concise, and open-ended to encourage detailed responses."""
+        Each question should be clear, concise, and open-ended to encourage detailed responses.""",
+        context=[analysis_task]
     )
 
-def create_creative_inquiry_task(question_agent, content_analysis):
+def create_creative_inquiry_task(question_agent, analysis_task):
     return Task(
-        description=f"""Based on the following content analysis, generate 10-15 highly original, 
+        description="""Based on the video content analysis provided as context, generate 10-15 highly original, 
         thought-provoking questions for the podcast interview. Your questions should:
         1. Uncover the guest's core motivations and the deeper purpose behind their work
         2. Explore unconventional or potentially controversial ideas related to their field
@@ -98,9 +99,7 @@ def create_creative_inquiry_task(question_agent, content_analysis):
         5. Encourage the guest to share their most ambitious, "blue sky" visions for the future
 
         Aim for questions that will surprise both the guest and the audience, leading to unique insights 
-        and a memorable conversation.
-
-        Content Analysis: {content_analysis}""",
+        and a memorable conversation.""",
         agent=question_agent,
         expected_output="""A list of 10-15 highly original and thought-provoking questions that:
         1. Probe into the guest's core motivations (2-4 questions)
@@ -108,7 +107,8 @@ def create_creative_inquiry_task(question_agent, content_analysis):
         3. Present a challenging hypothetical scenario (2 question)
         4. Make an unexpected connection to broader concepts (2-4 questions)
         5. Encourage sharing of ambitious future visions (4 question)
-        Each question should be unique, surprising, and capable of eliciting deep, insightful responses."""
+        Each question should be unique, surprising, and capable of eliciting deep, insightful responses.""",
+        context=[analysis_task]
     )
 
 def main():
@@ -119,21 +119,21 @@ def main():
     question_generator = create_question_generator_agent()
 
     analysis_task = create_video_analysis_task(analyzer)
-    question_task = create_question_generation_task(question_generator, "{{analysis_task.output}}")
-    creative_task = create_creative_inquiry_task(question_generator, "{{analysis_task.output}}")
+    question_task = create_question_generation_task(question_generator, analysis_task)
+    creative_task = create_creative_inquiry_task(question_generator, analysis_task)
 
-    crew = Crew(
-        agents=[analyzer, question_generator],
-        tasks=[analysis_task, question_task, creative_task],
-        verbose=2,
-        process=Process.sequential
+    # Both question sets only need the video analysis, so they are generated side by side
+    result = kickoff_task_graph(
+        [analysis_task, question_task, creative_task],
+        verbose=2
     )
-
-    result = crew.kickoff()
+    analysis, questions, creative_inquiries = result.tasks_output
 
     print(f"\nPodcast Preparation for Guest: {guest_name}")
-    print("\nGenerated Questions and Creative Inquiries:")
-    print(result)
+    print("\nGenerated Questions:")
+    print(questions.raw)
+    print("\nCreative Inquiries:")
+    print(creative_inquiries.raw)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,35 +1,17 @@
 import os
 from crewai import Agent, Task, Crew, Process
 import PyPDF2
-from langchain_anthropic import ChatAnthropic
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
-from anthropic import APIStatusError
-import time
+from usefulTools.llm_repository import get_llm
 
 os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
 
-llm = ChatAnthropic(model="claude-3-5-sonnet-20240620")
+llm = get_llm("ClaudeSonnet", model="claude-3-5-sonnet-20240620", max_tokens=4096)
 
-def retry_on_overload(func, max_retries=5, initial_wait=1):
-    def wrapper(*args, **kwargs):
-        retries = 0
-        while retries < max_retries:
-            try:
-                return func(*args, **kwargs)
-            except APIStatusError as e:
-                if 'overloaded_error' in str(e):
-                    wait_time = initial_wait * (2 ** retries)
-                    print(f"API overloaded. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    retries += 1
-                else:
-                    raise
-        raise Exception("Max retries reached. API still overloaded.")
-    return wrapper
-
-@retry_on_overload
+# Overloads and rate limits are retried per request by the LLM client
+# (usefulTools/llm_retry.py), so a failure no longer reruns the whole crew
 def kickoff_crew(crew):
     return crew.kickoff()
 
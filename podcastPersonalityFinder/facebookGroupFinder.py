@@ -9,6 +9,7 @@ import re
 from datetime import datetime
 from langchain.tools import Tool
 from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.crew_pool import run_crews, report_failures
 from usefulTools.search_tools import facebook_serper_tool, facebook_group_search_tool, us_serper_tool, uk_serper_tool, canada_serper_tool, australia_serper_tool
 
 # Set up environment variables
@@ -137,18 +138,28 @@ Research Focus {i}: {group_focus} - {region}
     
     return research_focuses
 
+def results_filename(config):
+    """
+    Timestamped results filename for a product configuration.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_product_name = re.sub(r'[^\w\-_\.]', '_', config["product_name"])
+    return f"facebook_groups_research_{safe_product_name}_{timestamp}.txt"
+
 def save_results_to_file(results, config, filename=None):
     """
     Save all research results to a comprehensive text file.
+    Focus areas whose result is None are listed as not completed, so the file
+    can be rewritten as each focus area finishes.
     """
     if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_product_name = re.sub(r'[^\w\-_\.]', '_', config["product_name"])
-        filename = f"facebook_groups_research_{safe_product_name}_{timestamp}.txt"
+        filename = results_filename(config)
     
     filepath = os.path.join(os.path.dirname(__file__), filename)
+    completed = sum(1 for result in results if result is not None)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
+    # Write to a temporary file first so the previous version stays readable until replaced
+    with open(filepath + ".tmp", 'w', encoding='utf-8') as f:
         # Write header
         f.write("=" * 100 + "\n")
         f.write("FACEBOOK GROUP RESEARCH RESULTS\n")
@@ -166,13 +177,13 @@ def save_results_to_file(results, config, filename=None):
         for i, result in enumerate(results, 1):
             f.write(f"\nRESEARCH FOCUS AREA {i}:\n")
             f.write("-" * 50 + "\n")
-            f.write(str(result))
+            f.write(str(result) if result is not None else "(not completed)")
             f.write("\n" + "=" * 50 + "\n")
         
         # Write summary
         f.write(f"\n\nSUMMARY:\n")
         f.write("-" * 20 + "\n")
-        f.write(f"Total Focus Areas Researched: {len(results)}\n")
+        f.write(f"Total Focus Areas Researched: {completed} of {len(results)}\n")
         f.write(f"Research completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write(f"Results saved to: {filename}\n")
         f.write("\nNext Steps:\n")
@@ -182,6 +193,7 @@ def save_results_to_file(results, config, filename=None):
         f.write("4. Implement the suggested engagement strategies\n")
         f.write("5. Track engagement metrics and adjust approach as needed\n")
     
+    os.replace(filepath + ".tmp", filepath)
     return filepath
 
 # Facebook Group Researcher Agent
@@ -378,14 +390,40 @@ def process_group_research(research_focus):
         process=Process.sequential
     )
 
-    result = crew.kickoff(inputs={"research_focus": research_focus})
+    # The agents and tasks are shared between focus areas, so each one runs on its own copy
+    result = crew.copy().kickoff(inputs={"research_focus": research_focus})
     print(f"✅ Research focus completed!")
     return result
 
+def _focus_label(research_focus):
+    return next((line.strip() for line in research_focus.splitlines() if line.strip()), "research focus")
+
+def research_focuses_concurrently(research_focuses, config, max_workers=None, filename=None):
+    """
+    Research all focus areas concurrently (at most max_workers at once, default
+    CREW_MAX_WORKERS) and rewrite the results file as each one completes.
+    Returns (results, filepath); results are in focus order, None where a focus failed.
+    """
+    filename = filename or results_filename(config)
+    results = [None] * len(research_focuses)
+    filepath = save_results_to_file(results, config, filename)
+
+    def on_progress(done, total, outcome):
+        status = "✅ Completed" if outcome.ok else f"❌ Failed ({outcome.error})"
+        print(f"{status} focus {outcome.index + 1} ({done} of {total} finished)")
+        if outcome.ok:
+            results[outcome.index] = outcome.output
+            save_results_to_file(results, config, filename)
+
+    outcomes = run_crews(research_focuses, process_group_research, max_workers=max_workers, on_progress=on_progress)
+    report_failures(outcomes, label=_focus_label)
+    return results, filepath
+
 # Main function to research Facebook groups
-def find_facebook_groups_interactive():
+def find_facebook_groups_interactive(max_workers=None):
     """
     Interactive function to find Facebook groups based on user configuration.
+    Focus areas run concurrently; pass max_workers=1 to run them one at a time.
     """
     # Get user configuration
     config = get_user_search_focus()
@@ -395,23 +433,14 @@ def find_facebook_groups_interactive():
     
     print(f"\n🚀 Starting research with {len(research_focuses)} focus area(s)...")
     
-    results = []
-    for i, focus in enumerate(research_focuses, 1):
-        print(f"\n📋 Research Focus {i} of {len(research_focuses)}")
-        print("=" * 60)
-        result = process_group_research(focus)
-        results.append(result)
-        print(f"✅ Completed focus {i} of {len(research_focuses)}")
-    
-    # Save results to file
-    print(f"\n💾 Saving results to file...")
-    filepath = save_results_to_file(results, config)
+    # Results are saved to file as each focus area completes
+    results, filepath = research_focuses_concurrently(research_focuses, config, max_workers=max_workers)
     
     # Print completion summary
     print("\n" + "=" * 80)
     print("🎉 FACEBOOK GROUP RESEARCH COMPLETED!")
     print("=" * 80)
-    print(f"✅ Total focus areas researched: {len(research_focuses)}")
+    print(f"✅ Total focus areas researched: {sum(1 for r in results if r is not None)} of {len(research_focuses)}")
     print(f"✅ Results saved to: {filepath}")
     print(f"✅ Research completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("\n📝 Next Steps:")
@@ -425,16 +454,14 @@ def find_facebook_groups_interactive():
     return results, filepath
 
 # Legacy function for backward compatibility
-def find_facebook_groups(research_focuses):
+def find_facebook_groups(research_focuses, max_workers=None):
     """
     Legacy function that takes predefined research focuses.
+    Returns the results in focus order, None where a focus failed.
     """
-    results = []
-    for i, focus in enumerate(research_focuses, 1):
-        print(f"\n📋 Processing Research Focus {i} of {len(research_focuses)}")
-        result = process_group_research(focus)
-        results.append(result)
-    return results
+    outcomes = run_crews(research_focuses, process_group_research, max_workers=max_workers)
+    report_failures(outcomes, label=_focus_label)
+    return [outcome.output for outcome in outcomes]
 
 # Example predefined research focuses for podcastbots.ai (kept for reference)
 example_research_focuses = [
@@ -496,9 +523,6 @@ if __name__ == "__main__":
     elif choice == "2":
         # Example mode with predefined focuses
         print("\n🔄 Running example search for podcastbots.ai...")
-        results = find_facebook_groups(example_research_focuses)
-        
-        # Save example results
         example_config = {
             "product_name": "podcastbots.ai",
             "product_description": "AI-powered podcast guest finding and contact tool",
@@ -507,7 +531,8 @@ if __name__ == "__main__":
             "region_choice": "5",  # All regions
             "num_groups": "15-20"
         }
-        filepath = save_results_to_file(results, example_config)
+        # Results are saved to file as each focus area completes
+        results, filepath = research_focuses_concurrently(example_research_focuses, example_config)
         
         print("\n" + "=" * 80)
         print("🎉 EXAMPLE FACEBOOK GROUP RESEARCH COMPLETED!")
@@ -1,8 +1,6 @@
 from crewai import Agent, Task, Crew, Process
-from langchain_openai import ChatOpenAI
 import os
 from anthropic import Anthropic
-import anthropic
 import sys
 import json
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,7 +17,10 @@ from googleCustomSearch import google_custom_search
 from langchain.tools import Tool
 from langchain_community.utilities import SerpAPIWrapper
 from usefulTools.search_tools import search_tool, youtube_tool, search_api_tool
-from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.llm_repository import ClaudeSonnet, get_llm, get_anthropic_client
+from usefulTools.llm_router import routed_messages_create
+from usefulTools.llm_governor import set_default_priority
+from usefulTools.prompt_cache import cacheable_scope
 
 from crewai_tools.tools import SerperDevTool
 from langchain.tools import Tool
@@ -28,6 +29,9 @@ os.environ["GROQ_API_KEY"] = config.GROQ_API_KEY
 os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
 os.environ["SERPAPI_API_KEY"] = config.SERPAPI_API_KEY
 
+# Bulk outreach: yield to interactive chat and crews sharing the API key
+set_default_priority("batch")
+
 
 def get_user_input_path():
     while True:
@@ -37,6 +41,15 @@ def get_user_input_path():
         else:
             print(f"The file '{user_path}' does not exist. Please enter a valid file path.")
 
+def _contains_json_array(response):
+    json_match = re.search(r'\[.*\]', response, re.DOTALL)
+    if not json_match:
+        return False
+    try:
+        return isinstance(json.loads(json_match.group()), list)
+    except json.JSONDecodeError:
+        return False
+
 def parse_podcast_personalities(file_path=None):
     if file_path is None:
         file_path = get_user_input_path()
@@ -44,8 +57,7 @@ def parse_podcast_personalities(file_path=None):
     with open(file_path, 'r') as file:
         content = file.read()
 
-    client = anthropic.Anthropic(api_key=config.ANTHROPIC_API_KEY)
-    model = "claude-3-5-sonnet-20240620"
+    client = get_anthropic_client()
 
     system_message = """You are an AI assistant skilled at extracting structured information from text.
     Your task is to parse information about podcast personalities, extracting their name, title, and a brief description of their work."""
@@ -58,8 +70,9 @@ def parse_podcast_personalities(file_path=None):
     Text to parse:
     {content}"""
 
-    message = client.messages.create(
-        model=model,
+    # Extraction runs on the cheap model and escalates if it returns no valid JSON array
+    message = routed_messages_create(client, "extract",
+        validate=_contains_json_array,
         max_tokens=2000,
         temperature=0,
         system=system_message,
@@ -112,11 +125,7 @@ for person in personalities:
 
 
     if __name__ == '__main__':
-        llm = ChatOpenAI(
-            openai_api_base="https://api.groq.com/openai/v1",
-            openai_api_key=os.getenv("GROQ_API_KEY"),
-            model_name="gemma2-9b-it"
-        )
+        llm = get_llm("GROQ", model="gemma2-9b-it")
 
 
         host_info = {
@@ -200,11 +209,12 @@ for person in personalities:
         )
 
 
-        craft_invitation_email = Task(
-            description=f"""
+        # Everything but the guest details is identical for every podcast, so it comes first
+        # and is cached by the provider across guests (usefulTools/prompt_cache.py)
+        invitation_brief = f"""
             Compose a personalized, engaging email invitation for a potential podcast guest, highlighting the relevance of their work to the podcast's mission and emphasizing the potential for a meaningful conversation. Remember, this is a solo effort by the host, not a team project.
 
-            Use the following information to craft the email:
+            Use the host information below and the guest information at the end to craft the email:
 
             Host Information:
             - Name: {host_name}
@@ -214,14 +224,6 @@ for person in personalities:
             - Website: {host_website}
             - Phone: {host_phone}
 
-            Guest Information:
-            - Name: {guest_name}
-            - Title: {guest_title}
-            - Work Summary: {guest_work_summary}
-
-            Subject Matter:
-            - Topic: {subject_matter}  # This can be a specific topic or "None" if not applicable
-
             The output should be structured as follows:
             1. Guest's email address (ONLY if found during info gathering)[blank line] (ONLY if email was found)
             2. A blank line
@@ -247,6 +249,17 @@ for person in personalities:
 
             Ensure the email is warm, personal, 250-350 words long, and avoids clichés and overly formal language.
             Use the exact host information provided, do not invent or alter any details.
+            """
+
+        craft_invitation_email = Task(
+            description=f"""{invitation_brief}
+            Guest Information:
+            - Name: {guest_name}
+            - Title: {guest_title}
+            - Work Summary: {guest_work_summary}
+
+            Subject Matter:
+            - Topic: {subject_matter}  # This can be a specific topic or "None" if not applicable
             """,
             agent=email_crafter,
             expected_output="""Output should be structured as follows:
@@ -286,7 +299,8 @@ for person in personalities:
             process=Process.sequential
         )
 
-        output = crew.kickoff()
+        with cacheable_scope(invitation_brief):
+            output = crew.kickoff()
         print(output)
 
         def write_guest_email_to_file(content, guest_name, directory="/Users/rajeevkumar/Documents/TISB/pitchEmails"):
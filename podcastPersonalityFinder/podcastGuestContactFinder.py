@@ -16,6 +16,8 @@ os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
 
 # Initialize language model and search tool
 from usefulTools.search_tools import search_tool, youtube_tool, search_api_tool
+from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.crew_pool import run_crews, report_failures, print_crew_progress
 
 
 # Contact Information Researcher Agent
@@ -172,16 +174,20 @@ def process_guest(guest_info):
         process=Process.sequential
     )
 
-    return crew.kickoff(inputs={"guest_info": guest_info})
+    # The agents and tasks above are shared, so each guest runs on its own copy
+    return crew.copy().kickoff(inputs={"guest_info": guest_info})
+
+
+def _guest_label(guest_info):
+    return next((line.strip() for line in guest_info.splitlines() if line.strip()), "guest")
 
 
 # Main function to process all guests
-def find_guest_contacts(guests_list):
-    results = []
-    for guest in guests_list:
-        result = process_guest(guest)
-        results.append(result)
-    return results
+def find_guest_contacts(guests_list, max_workers=None, on_progress=print_crew_progress):
+    """Run the contact crew for every guest concurrently; failed guests yield None."""
+    results = run_crews(guests_list, process_guest, max_workers=max_workers, on_progress=on_progress)
+    report_failures(results, label=_guest_label)
+    return [result.output for result in results]
 
 
 # Example usage:
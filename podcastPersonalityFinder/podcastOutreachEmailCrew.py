@@ -20,6 +20,7 @@ sys.path.insert(0, project_root)
 from crewai import Agent, Task, Crew, Process
 from usefulTools.search_tools import serper_search_tool
 from usefulTools.llm_repository import ClaudeSonnet
+from usefulTools.crew_pool import run_crews, report_failures, print_crew_progress
 from podcastPersonalityFinder.podcastHostParser import PodcastHostParser
 
 class PodcastOutreachEmailCrew:
@@ -160,48 +161,69 @@ class PodcastOutreachEmailCrew:
             logging.debug(f"Full output: {output}")
             return None, None
 
-    def generate_emails(self, output_dir='podcast_outreach_emails'):
+    def generate_emails(self, output_dir='podcast_outreach_emails', max_workers=None):
         """
         Generate personalized emails for all podcasts
         
         :param output_dir: Directory to save generated emails
+        :param max_workers: Podcasts processed concurrently (default: CREW_MAX_WORKERS)
         """
         os.makedirs(output_dir, exist_ok=True)
 
-        # Iterate through tiers
+        # Collect podcasts across tiers
+        podcasts = []
         for tier, tier_podcasts in self.podcasts.items():
             for podcast in tier_podcasts:
                 # Skip if no verified email
                 if not podcast.get('verified_emails') or 'not found' in str(podcast.get('verified_emails', '')).lower():
                     logging.warning(f"Skipping {podcast['name']}: No verified email")
                     continue
+                podcasts.append(podcast)
 
-                # Create agents and tasks for this podcast
-                agents = self.create_agents()
-                tasks = self.create_tasks(agents, podcast)
-
-                # Create and run crew
-                try:
-                    crew = Crew(
-                        agents=agents,
-                        tasks=tasks,
-                        verbose=True,
-                        process=Process.sequential
-                    )
-
-                    # Generate email
-                    output = crew.kickoff()
-                    
-                    # Extract email content
-                    subject, body = self._extract_email_content(output)
-                    
-                    if subject and body:
-                        # Sanitize filename
-                        safe_filename = re.sub(r'[^\w\-_\. ]', '_', podcast['name'])
-                        email_file_path = os.path.join(output_dir, f'{safe_filename}_outreach_email.txt')
-                        
-                        # Construct full email with founder's context
-                        full_email = f"""To: {podcast.get('verified_emails', 'N/A')}
+        # Each podcast gets its own crew, so they can run side by side
+        results = run_crews(
+            podcasts,
+            lambda podcast: self._generate_email(podcast, output_dir),
+            max_workers=max_workers,
+            on_progress=print_crew_progress
+        )
+        report_failures(results, label=lambda podcast: podcast['name'])
+
+    def _generate_email(self, podcast, output_dir):
+        """
+        Run the email crew for one podcast and save the result
+        
+        :param podcast: Podcast details
+        :param output_dir: Directory to save the generated email
+        """
+        # Create agents and tasks for this podcast
+        agents = self.create_agents()
+        tasks = self.create_tasks(agents, podcast)
+
+        # Create and run crew
+        crew = Crew(
+            agents=agents,
+            tasks=tasks,
+            verbose=True,
+            process=Process.sequential
+        )
+
+        # Generate email
+        output = crew.kickoff()
+        
+        # Extract email content
+        subject, body = self._extract_email_content(output)
+        
+        if not (subject and body):
+            logging.error(f"Could not extract email content for {podcast['name']}")
+            return
+
+        # Sanitize filename
+        safe_filename = re.sub(r'[^\w\-_\. ]', '_', podcast['name'])
+        email_file_path = os.path.join(output_dir, f'{safe_filename}_outreach_email.txt')
+        
+        # Construct full email with founder's context
+        full_email = f"""To: {podcast.get('verified_emails', 'N/A')}
 Subject: {subject}
 
 Dear Podcast Host,
@@ -219,16 +241,11 @@ Founder, Podcast Bots
 {self.founder_context['email']}
 {self.founder_context['website']}
 """
-                        
-                        with open(email_file_path, 'w', encoding='utf-8') as email_file:
-                            email_file.write(full_email)
-                        
-                        logging.info(f"Generated email for {podcast['name']}")
-                    else:
-                        logging.error(f"Could not extract email content for {podcast['name']}")
-                
-                except Exception as e:
-                    logging.error(f"Error generating email for {podcast['name']}: {e}")
+        
+        with open(email_file_path, 'w', encoding='utf-8') as email_file:
+            email_file.write(full_email)
+        
+        logging.info(f"Generated email for {podcast['name']}")
 
 def main():
     input_file = input("Enter the path to the podcast hosts text file: ")
@@ -0,0 +1,179 @@
+"""
+Checkpoint and resume for sequential multi-task crews.
+
+A long crew that fails or is interrupted at its last task loses the output
+of every task before it, and a retry pays for all of them again. Kicking a
+crew off through kickoff_with_checkpoints() saves each task's output as soon
+as the task completes. A re-run with the same crew, tasks and inputs restores
+the finished tasks and resumes at the first incomplete one:
+
+    agents, tasks = create_agents_and_tasks(transcript)
+    output = kickoff_with_checkpoints("segment_extractor", agents, tasks,
+                                      verbose=True, process=Process.sequential)
+
+Each task is keyed by a hash of the crew name, the task (description,
+expected output, agent role), the kickoff inputs and the key of the task
+before it, so changing any task or input invalidates it and everything after
+it. Checkpoints are removed once the whole crew has finished; they are a way
+to resume, not a response cache (that is usefulTools/llm_cache.py).
+
+Restored tasks are not part of the resumed kickoff, so the returned output's
+tasks_output only lists the tasks that ran; every task's .output is set.
+
+Environment overrides:
+    CREW_CHECKPOINT_PATH      location of the SQLite file
+    CREW_CHECKPOINT_TTL       time-to-live in seconds (default: one week)
+    CREW_CHECKPOINT_DISABLED  set to "1" to always run every task
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+
+from crewai import Crew
+from crewai.crews.crew_output import CrewOutput
+from crewai.tasks.task_output import TaskOutput
+
+from usefulTools.search_cache import SearchCache
+from usefulTools.mock_llm import mock_llm_enabled
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = os.environ.get(
+    "CREW_CHECKPOINT_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "crew_checkpoints.sqlite3")
+)
+DEFAULT_CHECKPOINT_TTL = int(os.environ.get("CREW_CHECKPOINT_TTL", 7 * 24 * 60 * 60))
+DEFAULT_CHECKPOINT_MAX_ENTRIES = 1000
+
+# Shared store for task outputs of unfinished crews
+checkpoint_store = SearchCache(
+    path=DEFAULT_CHECKPOINT_PATH,
+    ttl=DEFAULT_CHECKPOINT_TTL,
+    max_entries=DEFAULT_CHECKPOINT_MAX_ENTRIES
+)
+
+
+def checkpoints_enabled() -> bool:
+    return os.environ.get("CREW_CHECKPOINT_DISABLED", "0") != "1"
+
+
+def task_checkpoint_key(crew_name: str, task, inputs: dict = None, previous_key: str = None) -> str:
+    """Hash a task, its crew and inputs, and the task before it into a checkpoint key."""
+    material = {
+        "crew": crew_name,
+        "previous": previous_key,
+        # kickoff() interpolates inputs into the description; key on the template
+        "description": getattr(task, "_original_description", None) or task.description,
+        "expected_output": task.expected_output,
+        "agent": getattr(task.agent, "role", None),
+        "inputs": inputs or {},
+        # Mock outputs must never resume a real run
+        "mock": mock_llm_enabled(),
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _load(key: str):
+    try:
+        return checkpoint_store.get(key)
+    except sqlite3.Error as e:
+        logger.warning(f"Checkpoint read failed: {e}")
+        return None
+
+
+def _save(key: str, output) -> None:
+    entry = {"raw": output.raw, "json_dict": output.json_dict}
+    try:
+        checkpoint_store.set(key, entry)
+    except sqlite3.Error as e:
+        logger.warning(f"Checkpoint write failed: {e}")
+
+
+def _discard(keys: list) -> None:
+    try:
+        checkpoint_store.delete(*keys)
+    except sqlite3.Error as e:
+        logger.warning(f"Checkpoint cleanup failed: {e}")
+
+
+def _restored_output(task, entry: dict):
+    return TaskOutput(
+        description=task.description,
+        expected_output=task.expected_output,
+        raw=entry["raw"],
+        json_dict=entry.get("json_dict"),
+        agent=getattr(task.agent, "role", "None"),
+    )
+
+
+def _checkpointing_callback(key: str, callback):
+    def on_task_done(output):
+        _save(key, output)
+        if callback:
+            callback(output)
+    return on_task_done
+
+
+def kickoff_with_checkpoints(crew_name: str, agents: list, tasks: list, inputs: dict = None, **crew_kwargs):
+    """
+    Kick off a sequential crew, skipping tasks finished by an earlier run.
+
+    Args:
+        crew_name: Name identifying the crew in checkpoint keys, e.g. "bill_analysis"
+        agents: The crew's agents
+        tasks: The crew's tasks, in order
+        inputs: Kickoff inputs interpolated into the tasks
+        **crew_kwargs: Remaining Crew arguments (process, verbose, memory, ...)
+
+    Returns:
+        CrewOutput: Output of the final task
+    """
+    if not checkpoints_enabled():
+        return Crew(agents=agents, tasks=tasks, **crew_kwargs).kickoff(inputs=inputs)
+
+    keys = []
+    previous_key = None
+    for task in tasks:
+        previous_key = task_checkpoint_key(crew_name, task, inputs, previous_key)
+        keys.append(previous_key)
+
+    # Restore the finished prefix; everything from the first missing task on runs again
+    restored = 0
+    for task, key in zip(tasks, keys):
+        entry = _load(key)
+        if entry is None:
+            break
+        task.output = _restored_output(task, entry)
+        restored += 1
+
+    if restored == len(tasks):
+        logger.info(f"All {restored} tasks of {crew_name} restored from checkpoints")
+        _discard(keys)
+        return CrewOutput(raw=tasks[-1].output.raw, json_dict=tasks[-1].output.json_dict,
+                          tasks_output=[task.output for task in tasks])
+    if restored:
+        logger.info(f"Resuming {crew_name} at task {restored + 1}/{len(tasks)}")
+
+    remaining = tasks[restored:]
+    first = remaining[0]
+    original_context = first.context
+    original_callbacks = [task.callback for task in remaining]
+    if restored and not (isinstance(first.context, list) and first.context):
+        # In a sequential crew a task without explicit context sees the previous task's output
+        first.context = [tasks[restored - 1]]
+    for task, key in zip(remaining, keys[restored:]):
+        task.callback = _checkpointing_callback(key, task.callback)
+    try:
+        output = Crew(agents=agents, tasks=remaining, **crew_kwargs).kickoff(inputs=inputs)
+    finally:
+        first.context = original_context
+        for task, callback in zip(remaining, original_callbacks):
+            task.callback = callback
+
+    if all(task.output is not None for task in tasks):
+        _discard(keys)
+    return output
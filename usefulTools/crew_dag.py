@@ -0,0 +1,174 @@
+"""
+Dependency-graph execution for crews whose tasks don't all depend on each other.
+
+Process.sequential runs tasks one after another even when a task only needs
+the output of one earlier task. kickoff_task_graph() builds a graph from each
+Task.context and runs every task whose dependencies are done concurrently,
+feeding their outputs forward as context:
+
+    analysis = Task(..., agent=analyzer)
+    questions = Task(..., agent=host, context=[analysis])
+    creative = Task(..., agent=host, context=[analysis])
+    output = kickoff_task_graph([analysis, questions, creative], verbose=True)
+
+questions and creative run side by side once analysis is done, so the run
+takes as long as its critical path instead of the sum of all tasks.
+
+Dependencies follow Task.context:
+  * context=[a, b]: runs after a and b, with their outputs as context;
+  * context=[]: independent, starts right away without context;
+  * no context: runs after the previous task, as in a sequential crew.
+Context tasks are matched by identity, then by Task.key, so tasks taken from
+crew.copy() keep their graph.
+
+At most max_workers tasks run at once (default: CREW_MAX_WORKERS); the LLM
+governor (usefulTools/llm_governor.py) still caps API calls across the
+process. Each task runs as a copy in a one-task crew with its own copy of the
+agent, so one agent can work on two tasks at once and the given tasks are
+never modified: several graphs may share the same task templates. If a task
+fails, no further tasks start; running ones finish and the error is raised.
+
+Because every task gets its own crew, crew-level settings act per task
+unless the graph handles them:
+  * max_rpm is shared: one request-per-minute limit covers the whole graph;
+  * memory is per task; tasks see each other only through their context;
+  * LLM usage is recorded as one run for the graph (usefulTools/llm_usage.py).
+
+Tasks are copied with model_copy() rather than Task.copy(), which turns
+context=[] into None in both crewai 0.51 (pyproject.toml) and 0.64
+(requirements.txt). Agent.copy() behaves the same in both.
+"""
+
+import contextvars
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from crewai import Crew
+from crewai.crews.crew_output import CrewOutput
+from crewai.utilities import Logger, RPMController
+
+from usefulTools.crew_pool import DEFAULT_MAX_WORKERS
+from usefulTools.llm_usage import usage_run
+
+logger = logging.getLogger(__name__)
+
+
+def _label(task) -> str:
+    return (task.description or "").strip().split("\n")[0][:60]
+
+
+def task_dependencies(tasks: list) -> list:
+    """For each task, the indices of the tasks in the list it waits for."""
+    keys = {}
+    for index, task in enumerate(tasks):
+        keys.setdefault(task.key, index)
+
+    dependencies = []
+    for index, task in enumerate(tasks):
+        context = task.context
+        if not isinstance(context, list):
+            dependencies.append([index - 1] if index else [])
+            continue
+        depends_on = []
+        for context_task in context:
+            match = next((i for i, t in enumerate(tasks) if t is context_task), keys.get(context_task.key))
+            if match is None:
+                raise ValueError(f"Task '{_label(task)}' depends on '{_label(context_task)}', which is not in the crew")
+            depends_on.append(match)
+        dependencies.append(depends_on)
+
+    # Kahn's algorithm: anything left unvisited is on a cycle
+    remaining = {i: set(d) for i, d in enumerate(dependencies)}
+    ready = [i for i, d in remaining.items() if not d]
+    while ready:
+        done = ready.pop()
+        del remaining[done]
+        for i, d in remaining.items():
+            if done in d:
+                d.discard(done)
+                if not d:
+                    ready.append(i)
+    if remaining:
+        raise ValueError("Task context forms a cycle: " + ", ".join(_label(tasks[i]) for i in sorted(remaining)))
+    return dependencies
+
+
+def _run_task(task, context: list, inputs: dict, crew_kwargs: dict, rpm_controller=None):
+    agent = task.agent.copy()
+    if rpm_controller is not None:
+        # Like Crew(max_rpm=...), this leaves an agent's own max_rpm in place
+        agent.set_rpm_controller(rpm_controller)
+    run = task.model_copy(update={"agent": agent, "context": context, "output": None})
+    Crew(agents=[agent], tasks=[run], **crew_kwargs).kickoff(inputs=inputs)
+    return run
+
+
+def kickoff_task_graph(tasks: list, inputs: dict = None, max_workers: int = None, **crew_kwargs):
+    """
+    Run tasks as a dependency graph, starting each one as soon as its context is done.
+
+    Args:
+        tasks: The crew's tasks; the last one provides the final output
+        inputs: Kickoff inputs interpolated into every task
+        max_workers: Tasks running at once (default: CREW_MAX_WORKERS)
+        **crew_kwargs: Arguments for each one-task Crew (verbose, memory, ...);
+                       max_rpm applies to the graph as a whole
+
+    Returns:
+        CrewOutput: Output of the last task, with every task's output in tasks_output (in task order)
+    """
+    for task in tasks:
+        if task.agent is None:
+            raise ValueError(f"Task '{_label(task)}' has no agent")
+    dependencies = task_dependencies(tasks)
+    runs = [None] * len(tasks)
+    pending = set(range(len(tasks)))
+    running = {}
+    error = None
+    crew_kwargs = dict(crew_kwargs)
+    max_rpm = crew_kwargs.pop("max_rpm", None)
+    rpm_controller = None
+    if max_rpm:
+        rpm_controller = RPMController(max_rpm=max_rpm, logger=Logger(verbose=bool(crew_kwargs.get("verbose"))))
+
+    with usage_run():
+        pool = ThreadPoolExecutor(max_workers=max(1, max_workers or DEFAULT_MAX_WORKERS), thread_name_prefix="crew-task")
+        try:
+            while pending or running:
+                if error is None:
+                    for index in sorted(pending):
+                        if all(runs[d] is not None for d in dependencies[index]):
+                            pending.discard(index)
+                            context = [runs[d] for d in dependencies[index]]
+                            future = pool.submit(contextvars.copy_context().run, _run_task,
+                                                 tasks[index], context, inputs, crew_kwargs, rpm_controller)
+                            running[future] = index
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = running.pop(future)
+                    if future.cancelled():
+                        continue
+                    try:
+                        runs[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"Task '{_label(tasks[index])}' failed: {e}")
+                        if error is None:
+                            error = e
+                            # Drop queued tasks; running ones are left to finish
+                            for queued in running:
+                                queued.cancel()
+                            pending.clear()
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            if rpm_controller is not None:
+                rpm_controller.stop_rpm_counter()
+        pool.shutdown()
+    if error is not None:
+        raise error
+
+    outputs = [run.output for run in runs]
+    return CrewOutput(raw=outputs[-1].raw, json_dict=outputs[-1].json_dict, tasks_output=outputs)
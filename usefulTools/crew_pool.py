@@ -0,0 +1,125 @@
+"""
+Bounded worker pool for independent crew kickoffs.
+
+Scripts that run the same crew once per guest, podcast or group spend nearly
+all their time waiting on the LLM, one item after another. run_crews() runs
+those kickoffs concurrently on a bounded thread pool:
+
+  * at most max_workers crews run at once; the LLM governor
+    (usefulTools/llm_governor.py) still caps concurrent API calls across them;
+  * a failing item does not stop the others; its result carries the exception;
+  * results come back in input order, whatever order the crews finish in;
+  * on_progress(done, total, result) runs in the calling thread as each item
+    finishes, so it can print or update a UI safely.
+
+    results = run_crews(guests, process_guest, on_progress=print_crew_progress)
+    report_failures(results, label=lambda guest: guest.name)
+    outputs = [r.output for r in results if r.ok]
+
+Each item needs its own crew. CrewAI agents and tasks keep per-run state,
+so build them inside the worker function or kick off crew.copy(). The
+caller's priority and usage scopes apply inside the workers, and all the
+crews are recorded as one usage run (usefulTools/llm_usage.py).
+
+Environment overrides:
+    CREW_MAX_WORKERS   concurrent crews (default: 4)
+"""
+
+import contextvars
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+
+from usefulTools.llm_usage import usage_run
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = int(os.environ.get("CREW_MAX_WORKERS", 4))
+
+
+class CrewRunResult(NamedTuple):
+    """Outcome of one item: its crew output, or the exception it raised."""
+    index: int
+    item: Any
+    output: Any = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_crews(items: Iterable, run_one: Callable[[Any], Any], max_workers: int = None,
+              on_progress: Callable[[int, int, CrewRunResult], None] = None) -> List[CrewRunResult]:
+    """
+    Run run_one(item) for every item on a bounded thread pool.
+
+    Args:
+        items: Independent inputs, e.g. guest descriptions
+        run_one: Builds and kicks off the crew for one item, returning its output
+        max_workers: Concurrent crews (default: CREW_MAX_WORKERS)
+        on_progress: Called as on_progress(done, total, result) after each item
+
+    Returns:
+        list[CrewRunResult]: One result per item, in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+    results = [None] * len(items)
+
+    def run(index, item):
+        start = time.monotonic()
+        try:
+            output = run_one(item)
+        except Exception as e:
+            logger.error(f"Item {index + 1}/{len(items)} failed: {e}")
+            return CrewRunResult(index, item, error=e, duration=time.monotonic() - start)
+        return CrewRunResult(index, item, output=output, duration=time.monotonic() - start)
+
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(items)))
+    with usage_run():
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crew")
+        try:
+            # Each worker gets a copy of the caller's context (priority, usage tags and run)
+            futures = [pool.submit(contextvars.copy_context().run, run, i, item) for i, item in enumerate(items)]
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results[result.index] = result
+                if on_progress:
+                    on_progress(done, len(items), result)
+        except BaseException:
+            # Ctrl-C or a failing callback: don't start the remaining crews
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+    return results
+
+
+def print_crew_progress(done: int, total: int, result: CrewRunResult) -> None:
+    """Default progress callback: one line per finished item."""
+    status = "done" if result.ok else f"FAILED ({result.error})"
+    print(f"[{done}/{total}] item {result.index + 1} {status} in {result.duration:.1f}s")
+
+
+def report_failures(results: List[CrewRunResult], label: Callable[[Any], str] = None) -> List[CrewRunResult]:
+    """
+    Log a summary of the items that failed.
+
+    Args:
+        results: Output of run_crews
+        label: Turns an item into a short name for the log (default: its position)
+
+    Returns:
+        list[CrewRunResult]: The failed results
+    """
+    failures = [r for r in results if not r.ok]
+    if failures:
+        names = [label(r.item) if label else f"item {r.index + 1}" for r in failures]
+        logger.warning(f"{len(failures)}/{len(results)} items failed: " + "; ".join(
+            f"{name}: {r.error}" for name, r in zip(names, failures)
+        ))
+    return failures
@@ -0,0 +1,125 @@
+"""
+Shared, connection-pooled HTTP client for the search helpers.
+
+Calling bare requests.post/requests.get opens a new TCP + TLS connection for
+every query. Routing all search traffic through one requests.Session keeps
+connections alive between calls, bounds how many requests are in flight at
+once and records per-host statistics.
+
+Environment overrides:
+    HTTP_POOL_MAXSIZE        connections kept alive per host (default: 20)
+    HTTP_MAX_CONCURRENCY     simultaneous in-flight requests (default: 16)
+    HTTP_CONNECT_TIMEOUT     seconds to establish a connection (default: 5)
+    HTTP_READ_TIMEOUT        seconds to wait for a response (default: 30)
+"""
+
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 20))
+DEFAULT_MAX_CONCURRENCY = int(os.environ.get("HTTP_MAX_CONCURRENCY", 16))
+DEFAULT_TIMEOUT = (
+    float(os.environ.get("HTTP_CONNECT_TIMEOUT", 5)),
+    float(os.environ.get("HTTP_READ_TIMEOUT", 30)),
+)
+
+
+class PooledHTTPClient:
+    """Thread-safe wrapper around a keep-alive requests.Session."""
+
+    def __init__(self, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 timeout=DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._adapter = adapter
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared session.
+
+        Accepts the same keyword arguments as requests.request. A default
+        (connect, read) timeout is applied unless one is given.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlparse(url).netloc
+        with self._semaphore:
+            self._record(host, in_flight=1)
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException:
+                self._record(host, in_flight=-1, errors=1, elapsed=time.perf_counter() - start)
+                raise
+            self._record(
+                host,
+                in_flight=-1,
+                errors=1 if response.status_code >= 400 else 0,
+                elapsed=time.perf_counter() - start
+            )
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def _record(self, host: str, in_flight: int = 0, errors: int = 0, elapsed: float = None) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(host, {
+                "requests": 0,
+                "errors": 0,
+                "in_flight": 0,
+                "total_seconds": 0.0,
+                "max_seconds": 0.0,
+            })
+            stats["in_flight"] += in_flight
+            stats["errors"] += errors
+            if elapsed is not None:
+                stats["requests"] += 1
+                stats["total_seconds"] += elapsed
+                stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+    def pool_stats(self) -> dict:
+        """
+        Return per-host request statistics.
+
+        Each entry holds request and error counts, the current number of
+        in-flight requests, mean/max latency and how many idle keep-alive
+        connections the pool is holding for that host.
+        """
+        idle = {}
+        for key in list(self._adapter.poolmanager.pools.keys()):
+            pool = self._adapter.poolmanager.pools.get(key)
+            if pool is not None:
+                idle[key.key_host] = idle.get(key.key_host, 0) + pool.pool.qsize() - sum(
+                    1 for conn in list(pool.pool.queue) if conn is None
+                )
+
+        with self._stats_lock:
+            report = {}
+            for host, stats in self._stats.items():
+                entry = dict(stats)
+                entry["mean_seconds"] = stats["total_seconds"] / stats["requests"] if stats["requests"] else 0.0
+                entry["idle_connections"] = idle.get(host.split(":")[0], 0)
+                report[host] = entry
+        return report
+
+    def close(self) -> None:
+        self.session.close()
+
+
+# Process-wide client shared by every search helper
+http_client = PooledHTTPClient()
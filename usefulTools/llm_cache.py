@@ -0,0 +1,230 @@
+"""
+Exact-match response cache for LLM calls.
+
+Our crews send the same prompts again and again, for example agent
+generation for a repeated topic or parsing the same input file. This module
+puts a content-addressed cache in front of both kinds of LLM call in the
+repo:
+
+  * raw Anthropic SDK calls: replace client.messages.create(...) with
+    cached_messages_create(client, ...). Keys cover model, temperature,
+    max_tokens, system, messages and any other request arguments. Pass
+    use_cache=False to opt out for one call.
+  * LangChain chat models from usefulTools/llm_repository.py: the registry
+    installs SQLiteLLMCache as LangChain's global LLM cache, whose key is
+    the serialized prompt plus the model's parameters. Build a client with
+    get_llm(name, cache=False) to opt out.
+
+Entries live in a SQLite file with TTL expiry and LRU eviction (the same
+store used for search results). Whitelisted call sites can also fall back to
+the optional similarity-based tier in usefulTools/semantic_llm_cache.py.
+
+Environment overrides:
+    LLM_CACHE_PATH         location of the SQLite file
+    LLM_CACHE_TTL          time-to-live in seconds (default: one week)
+    LLM_CACHE_MAX_ENTRIES  maximum number of cached responses
+    LLM_CACHE_DISABLED     set to "1" to bypass the cache entirely (also bypassed under LLM_MOCK=1)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from usefulTools.search_cache import SearchCache
+from usefulTools.llm_usage import record_cache_hit, record_langchain_cache_hit
+from usefulTools.mock_llm import mock_llm_enabled
+from usefulTools.semantic_llm_cache import get_semantic_cache, semantic_cache_enabled
+
+logger = logging.getLogger(__name__)
+
+try:
+    from langchain_core.caches import BaseCache
+    from langchain_core.load import dumps, loads
+    LANGCHAIN_CACHE_AVAILABLE = True
+except ImportError:
+    BaseCache = object
+    LANGCHAIN_CACHE_AVAILABLE = False
+
+DEFAULT_LLM_CACHE_PATH = os.environ.get(
+    "LLM_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "llm_cache.sqlite3")
+)
+DEFAULT_LLM_CACHE_TTL = int(os.environ.get("LLM_CACHE_TTL", 7 * 24 * 60 * 60))
+DEFAULT_LLM_CACHE_MAX_ENTRIES = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", 2000))
+
+# Shared store for every cached LLM response
+llm_cache_store = SearchCache(
+    path=DEFAULT_LLM_CACHE_PATH,
+    ttl=DEFAULT_LLM_CACHE_TTL,
+    max_entries=DEFAULT_LLM_CACHE_MAX_ENTRIES
+)
+
+
+def llm_cache_enabled() -> bool:
+    # Mock responses must never be stored alongside real ones
+    return os.environ.get("LLM_CACHE_DISABLED", "0") != "1" and not mock_llm_enabled()
+
+
+def make_llm_cache_key(kind: str, **request) -> str:
+    """Hash a full LLM request (model, parameters, system, messages, ...) into a key."""
+    material = {"kind": kind, "request": request}
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _store_get(key: str):
+    try:
+        return llm_cache_store.get(key)
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache read failed: {e}")
+        return None
+
+
+def _store_set(key: str, value) -> None:
+    try:
+        llm_cache_store.set(key, value)
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache write failed: {e}")
+
+
+def _content_text(content) -> str:
+    if isinstance(content, str):
+        return content
+    return "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+def _prompt_text(request: dict) -> str:
+    """Flatten the system prompt and messages of a messages.create request for embedding."""
+    parts = [_content_text(request.get("system", ""))]
+    parts.extend(f"{m.get('role')}: {_content_text(m.get('content', ''))}" for m in request.get("messages", []))
+    return "\n".join(part for part in parts if part)
+
+
+def _semantic_lookup(prompt: str, namespace: str):
+    """Return a cached value for a near-duplicate prompt, or None."""
+    try:
+        key = get_semantic_cache().lookup(prompt, namespace)
+    except Exception as e:
+        logger.warning(f"Semantic LLM cache lookup failed: {e}")
+        return None
+    return _store_get(key) if key else None
+
+
+def _semantic_add(prompt: str, namespace: str, key: str) -> None:
+    try:
+        get_semantic_cache().add(prompt, namespace, key)
+    except Exception as e:
+        logger.warning(f"Semantic LLM cache write failed: {e}")
+
+
+def cached_messages_create(client, use_cache: bool = True, semantic: bool = False, **kwargs):
+    """
+    Drop-in replacement for client.messages.create with an exact-match cache.
+
+    Args:
+        client: An anthropic.Anthropic client
+        use_cache: Set to False to always call the API for this request
+        semantic: Also accept answers to near-duplicate prompts (low-stakes
+                  call sites only; needs LLM_SEMANTIC_CACHE=1)
+        **kwargs: Arguments for messages.create (model, max_tokens, temperature,
+                  system, messages, ...)
+
+    Returns:
+        anthropic.types.Message: The cached or freshly created message
+    """
+    if not use_cache or not llm_cache_enabled() or kwargs.get("stream"):
+        return client.messages.create(**kwargs)
+
+    from anthropic.types import Message
+
+    key = make_llm_cache_key("anthropic.messages", **kwargs)
+    cached = _store_get(key)
+    if cached is not None:
+        logger.debug(f"LLM cache hit for {kwargs.get('model')}")
+        message = Message.model_validate(cached)
+        record_cache_hit(kwargs, message)
+        return message
+
+    use_semantic = semantic and semantic_cache_enabled()
+    if use_semantic:
+        prompt = _prompt_text(kwargs)
+        settings = {k: v for k, v in kwargs.items() if k not in ("system", "messages")}
+        namespace = make_llm_cache_key("anthropic.messages", **settings)
+        cached = _semantic_lookup(prompt, namespace)
+        if cached is not None:
+            message = Message.model_validate(cached)
+            record_cache_hit(kwargs, message)
+            return message
+
+    message = client.messages.create(**kwargs)
+    _store_set(key, message.model_dump(mode="json"))
+    if use_semantic:
+        _semantic_add(prompt, namespace, key)
+    return message
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    LangChain LLM cache backed by the shared TTL/LRU store.
+
+    With semantic=True, exact misses fall back to the semantic tier. Pass such
+    an instance as a single model's cache (see get_llm(..., semantic_cache=True)).
+    """
+
+    def __init__(self, semantic: bool = False):
+        self.semantic = semantic
+
+    def lookup(self, prompt: str, llm_string: str):
+        if not llm_cache_enabled():
+            return None
+        cached = _store_get(make_llm_cache_key("langchain", prompt=prompt, llm_string=llm_string))
+        if cached is None and self.semantic and semantic_cache_enabled():
+            cached = _semantic_lookup(prompt, make_llm_cache_key("langchain", llm_string=llm_string))
+        if cached is None:
+            return None
+        generations = [loads(generation) for generation in cached]
+        record_langchain_cache_hit(llm_string, generations)
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        if not llm_cache_enabled():
+            return
+        key = make_llm_cache_key("langchain", prompt=prompt, llm_string=llm_string)
+        _store_set(key, [dumps(generation) for generation in return_val])
+        if self.semantic and semantic_cache_enabled():
+            _semantic_add(prompt, make_llm_cache_key("langchain", llm_string=llm_string), key)
+
+    def clear(self, **kwargs) -> None:
+        llm_cache_store.clear()
+
+
+_semantic_langchain_cache = None
+_langchain_cache_installed = False
+_install_lock = threading.Lock()
+
+
+def enable_langchain_cache() -> None:
+    """Install SQLiteLLMCache as LangChain's global LLM cache (once per process)."""
+    global _langchain_cache_installed
+    if not LANGCHAIN_CACHE_AVAILABLE or not llm_cache_enabled():
+        return
+    with _install_lock:
+        if _langchain_cache_installed:
+            return
+        from langchain_core.globals import set_llm_cache
+        set_llm_cache(SQLiteLLMCache())
+        _langchain_cache_installed = True
+
+
+def semantic_langchain_cache():
+    """Shared exact-plus-semantic cache for whitelisted LangChain models, or None if unavailable."""
+    global _semantic_langchain_cache
+    if not LANGCHAIN_CACHE_AVAILABLE or not llm_cache_enabled() or not semantic_cache_enabled():
+        return None
+    with _install_lock:
+        if _semantic_langchain_cache is None:
+            _semantic_langchain_cache = SQLiteLLMCache(semantic=True)
+        return _semantic_langchain_cache
@@ -0,0 +1,358 @@
+"""
+Process-wide concurrency governor for LLM calls.
+
+The FastAPI backend, GUI crews and batch jobs can share one API key. Without
+coordination their requests compete blindly and interactive chat latency
+spikes. Every Anthropic request made through an instrumented client (see
+usefulTools/llm_retry.py) first takes a slot from this governor:
+
+  * at most LLM_MAX_CONCURRENCY requests are in flight at once;
+  * waiting requests are served by priority class, interactive > crew > batch,
+    and first come first served within a class;
+  * an optional tokens-per-minute budget holds requests back until the
+    sliding one-minute window has room (estimated up front, corrected with the
+    usage the API reports);
+  * queue depth, in-flight count and wait times are exposed via metrics().
+
+The priority of a call comes from the innermost priority_scope(), else the
+process default (set_default_priority() or LLM_PRIORITY), else "crew":
+
+    with priority_scope("interactive"):
+        reply = assistant_workflow.get_personal_assistant_response(text)
+
+Set LLM_GOVERNOR_LOCK_DIR to also share slots between processes on the same
+machine. The slots are lock files; higher priorities poll for a free one more
+often. The token budget is per process.
+
+Environment overrides:
+    LLM_MAX_CONCURRENCY      concurrent requests (default: 4)
+    LLM_TOKENS_PER_MINUTE    token budget per minute, 0 for none (default: 0)
+    LLM_PRIORITY             default priority class for this process
+    LLM_GOVERNOR_LOCK_DIR    directory for cross-process slot files (default: off)
+    LLM_GOVERNOR_SHARED_SLOTS  number of cross-process slots (default: LLM_MAX_CONCURRENCY)
+"""
+
+import asyncio
+import collections
+import contextlib
+import contextvars
+import functools
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+INTERACTIVE = 0
+CREW = 1
+BATCH = 2
+PRIORITY_NAMES = {INTERACTIVE: "interactive", CREW: "crew", BATCH: "batch"}
+PRIORITY_VALUES = {name: value for value, name in PRIORITY_NAMES.items()}
+
+# Cross-process poll interval per class: higher priorities retry sooner
+_POLL_INTERVALS = {INTERACTIVE: 0.01, CREW: 0.05, BATCH: 0.2}
+
+_priority = contextvars.ContextVar("llm_priority", default=None)
+_default_priority = None
+
+
+def _as_priority(priority) -> int:
+    if isinstance(priority, str):
+        if priority.lower() not in PRIORITY_VALUES:
+            raise ValueError(f"Unknown priority class: {priority}. Known: {', '.join(PRIORITY_VALUES)}")
+        return PRIORITY_VALUES[priority.lower()]
+    return int(priority)
+
+
+def set_default_priority(priority) -> None:
+    """Priority for calls made outside any priority_scope in this process."""
+    global _default_priority
+    _default_priority = _as_priority(priority)
+
+
+def current_priority() -> int:
+    priority = _priority.get()
+    if priority is not None:
+        return priority
+    if _default_priority is not None:
+        return _default_priority
+    return _as_priority(os.environ.get("LLM_PRIORITY", "crew"))
+
+
+@contextlib.contextmanager
+def priority_scope(priority):
+    """Run the enclosed LLM calls with the given priority class."""
+    token = _priority.set(_as_priority(priority))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class _FileSlots:
+    """Cross-process slot pool built on exclusive locks over N files."""
+
+    def __init__(self, directory: str, count: int):
+        os.makedirs(directory, exist_ok=True)
+        self.paths = [os.path.join(directory, f"llm-slot-{i}.lock") for i in range(count)]
+
+    def acquire(self, priority: int, cancel_event: threading.Event = None):
+        interval = _POLL_INTERVALS.get(priority, 0.05)
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise WaitCancelled()
+            for path in self.paths:
+                fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return fd
+                except OSError:
+                    os.close(fd)
+            time.sleep(interval)
+
+    @staticmethod
+    def release(fd) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+class WaitCancelled(Exception):
+    """Raised by LLMGovernor.acquire() when its wait is abandoned via cancel_wait()."""
+
+
+class _Permit:
+    __slots__ = ("priority", "usage_entry", "slot_fd")
+
+    def __init__(self, priority, usage_entry, slot_fd=None):
+        self.priority = priority
+        self.usage_entry = usage_entry
+        self.slot_fd = slot_fd
+
+
+class LLMGovernor:
+    """Priority-ordered slots plus a sliding-window tokens-per-minute budget."""
+
+    def __init__(self, max_concurrency: int = 4, tokens_per_minute: int = 0,
+                 lock_dir: str = None, shared_slots: int = None):
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._usage = collections.deque()
+        self._queued = collections.Counter()
+        self._waits = {p: collections.deque(maxlen=500) for p in PRIORITY_NAMES}
+        self._slots = None
+        if lock_dir and FCNTL_AVAILABLE:
+            self._slots = _FileSlots(lock_dir, shared_slots or max_concurrency)
+
+    def _tokens_in_window(self, now: float) -> int:
+        while self._usage and now - self._usage[0][0] >= 60.0:
+            self._usage.popleft()
+        return sum(entry[1] for entry in self._usage)
+
+    def _budget_wait(self, tokens: int, now: float) -> float:
+        """Seconds until `tokens` fit in the one-minute budget (0 if they fit now)."""
+        if not self.tokens_per_minute:
+            return 0.0
+        used = self._tokens_in_window(now)
+        if used == 0 or used + tokens <= self.tokens_per_minute:
+            return 0.0
+        for timestamp, spent in self._usage:
+            used -= spent
+            if used + tokens <= self.tokens_per_minute:
+                return max(0.01, timestamp + 60.0 - now)
+        return 0.01
+
+    def acquire(self, priority: int = CREW, estimated_tokens: int = 0,
+                cancel_event: threading.Event = None) -> _Permit:
+        """
+        Block until a slot and token budget are available for this priority class.
+
+        Raises WaitCancelled if cancel_event is set (see cancel_wait()) before a slot is granted.
+        """
+        start = time.monotonic()
+        ticket = (priority, next(self._sequence))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            self._queued[priority] += 1
+            try:
+                while True:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise WaitCancelled()
+                    timeout = None
+                    if self._waiting[0] == ticket and self._in_flight < self.max_concurrency:
+                        timeout = self._budget_wait(estimated_tokens, time.monotonic())
+                        if timeout == 0:
+                            break
+                    self._cond.wait(timeout)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._queued[priority] -= 1
+                # The next ticket may now be at the head of the queue
+                self._cond.notify_all()
+            self._in_flight += 1
+            usage_entry = [time.monotonic(), estimated_tokens]
+            self._usage.append(usage_entry)
+            self._cond.notify_all()
+
+        slot_fd = None
+        if self._slots is not None:
+            try:
+                slot_fd = self._slots.acquire(priority, cancel_event)
+            except BaseException:
+                self.release(_Permit(priority, usage_entry))
+                raise
+        self._waits[priority].append(time.monotonic() - start)
+        return _Permit(priority, usage_entry, slot_fd)
+
+    def release(self, permit: _Permit, actual_tokens: int = None) -> None:
+        """Free the slot and replace the token estimate with the reported usage."""
+        if permit.slot_fd is not None:
+            self._slots.release(permit.slot_fd)
+        with self._cond:
+            if actual_tokens is not None:
+                permit.usage_entry[1] = actual_tokens
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def cancel_wait(self, cancel_event: threading.Event) -> None:
+        """Abandon the acquire() waiting on cancel_event; it raises WaitCancelled."""
+        cancel_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    async def acquire_async(self, priority: int = CREW, estimated_tokens: int = 0) -> _Permit:
+        """
+        acquire() for coroutines, waiting in a worker thread.
+
+        If the caller is cancelled while waiting, the wait is abandoned; a permit
+        the worker was granted in the meantime is released, not leaked.
+        """
+        cancel_event = threading.Event()
+        waiter = asyncio.ensure_future(asyncio.to_thread(self.acquire, priority, estimated_tokens, cancel_event))
+        try:
+            return await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            self.cancel_wait(cancel_event)
+
+            def release_late_permit(future):
+                if not future.cancelled() and future.exception() is None:
+                    self.release(future.result())
+            waiter.add_done_callback(release_late_permit)
+            raise
+
+    @contextlib.contextmanager
+    def slot(self, priority=None, estimated_tokens: int = 0):
+        """Context manager around acquire()/release(); yields a dict for the actual token count."""
+        permit = self.acquire(current_priority() if priority is None else _as_priority(priority), estimated_tokens)
+        usage = {"tokens": None}
+        try:
+            yield usage
+        finally:
+            self.release(permit, usage["tokens"])
+
+    def metrics(self) -> dict:
+        with self._cond:
+            now = time.monotonic()
+            metrics = {
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "queue_depth": {name: self._queued[p] for p, name in PRIORITY_NAMES.items()},
+                "tokens_per_minute": self.tokens_per_minute,
+                "tokens_last_minute": self._tokens_in_window(now),
+                "cross_process": self._slots is not None,
+            }
+            waits = {p: sorted(samples) for p, samples in self._waits.items()}
+        metrics["wait_seconds"] = {
+            PRIORITY_NAMES[p]: {
+                "count": len(samples),
+                "avg": sum(samples) / len(samples) if samples else 0.0,
+                "p95": samples[int(0.95 * (len(samples) - 1))] if samples else 0.0,
+                "max": samples[-1] if samples else 0.0,
+            }
+            for p, samples in waits.items()
+        }
+        return metrics
+
+
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> LLMGovernor:
+    """Shared governor configured from the environment, created on first use."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = LLMGovernor(
+                max_concurrency=int(os.environ.get("LLM_MAX_CONCURRENCY", 4)),
+                tokens_per_minute=int(os.environ.get("LLM_TOKENS_PER_MINUTE", 0)),
+                lock_dir=os.environ.get("LLM_GOVERNOR_LOCK_DIR"),
+                shared_slots=int(os.environ["LLM_GOVERNOR_SHARED_SLOTS"]) if os.environ.get("LLM_GOVERNOR_SHARED_SLOTS") else None
+            )
+        return _governor
+
+
+def _text_length(content) -> int:
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, list):
+        return sum(_text_length(block.get("text", "")) if isinstance(block, dict) else 0 for block in content)
+    return 0
+
+
+def estimate_request_tokens(request: dict) -> int:
+    """Rough token estimate for a messages.create request (4 characters per token)."""
+    chars = _text_length(request.get("system", ""))
+    chars += sum(_text_length(m.get("content", "")) for m in request.get("messages", []))
+    return chars // 4 + min(int(request.get("max_tokens", 1024)), 1024)
+
+
+def response_tokens(response):
+    """Input plus output tokens reported by the API, or None if unavailable."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    return (getattr(usage, "input_tokens", 0) or 0) + (getattr(usage, "output_tokens", 0) or 0)
+
+
+def governed(func, is_async: bool = False):
+    """Wrap a messages.create-style callable so each call takes a governor slot."""
+    if is_async:
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            governor = get_governor()
+            permit = await governor.acquire_async(current_priority(), estimate_request_tokens(kwargs))
+            tokens = None
+            try:
+                response = await func(*args, **kwargs)
+                tokens = response_tokens(response)
+                return response
+            finally:
+                governor.release(permit, tokens)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        governor = get_governor()
+        permit = governor.acquire(current_priority(), estimate_request_tokens(kwargs))
+        tokens = None
+        try:
+            response = func(*args, **kwargs)
+            tokens = response_tokens(response)
+            return response
+        finally:
+            governor.release(permit, tokens)
+    return wrapper
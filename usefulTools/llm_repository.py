@@ -1,26 +1,173 @@
-from langchain_anthropic import ChatAnthropic
+"""
+Process-wide registry of LLM clients.
+
+Clients are built lazily the first time they are asked for and memoized by
+logical name (plus any overrides). Every script that asks for "ClaudeSonnet"
+therefore shares one client and its HTTP connection pool. Startup does not
+pay for models a script never uses.
+
+Usage:
+    from usefulTools.llm_repository import ClaudeSonnet          # as before
+    from usefulTools.llm_repository import get_llm
+    llm = get_llm("GROQ")
+    llm = get_llm("ClaudeSonnet", max_tokens=4096)               # memoized variant
+    llm = get_llm("ClaudeSonnet", cache=False)                   # skip the response cache
+    llm = get_llm("ClaudeSonnet", semantic_cache=True)           # also reuse near-duplicate answers
+    client = get_anthropic_client()                              # raw SDK client
+    llm = get_llm("Mock")                                        # offline, deterministic
+
+Anthropic clients retry transient failures per request (usefulTools/llm_retry.py).
+Set LLM_MOCK=1 to serve every model and client from the mock backend instead
+(usefulTools/mock_llm.py), or LLM_MOCK_RECORD=1 to record real responses for it.
+"""
+
 import sys
 import os
+import threading
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
+from usefulTools.llm_cache import enable_langchain_cache, semantic_langchain_cache
+from usefulTools.llm_retry import instrument_chat_model, wrap_anthropic_client
+from usefulTools.llm_usage import instrument_crewai
+from usefulTools.mock_llm import (
+    MockAnthropicClient, build_mock_chat_model, get_mock_responder,
+    mock_llm_enabled, mock_recording_enabled, record_responses
+)
 
-os.environ["ANTHROPIC_API_KEY"] = config.ANTHROPIC_API_KEY
+# Logical name -> provider and constructor parameters
+LLM_SPECS = {
+    "ClaudeSonnet": {
+        "provider": "anthropic",
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 8192,
+        "temperature": 0.6,
+    },
+    "ClaudeHaiku": {
+        "provider": "anthropic",
+        "model": "claude-3-5-haiku-20241022",
+        "max_tokens": 8192,
+        "temperature": 0.6,
+    },
+    "ClaudeOpus": {
+        "provider": "anthropic",
+        "model": "claude-3-opus-20240229",
+        "max_tokens": 8192,
+        "temperature": 0.6,
+    },
+    "GPT4o": {
+        "provider": "openai",
+        "model": "gpt-4o",
+    },
+    "GROQ": {
+        "provider": "groq",
+        "model": "llama3-70b-8192",
+    },
+    "Mock": {
+        "provider": "mock",
+        "model": "mock-llm",
+    },
+}
 
-ClaudeSonnet = ChatAnthropic(
-    model="claude-sonnet-4-20250514",
-    max_tokens = 8192,
-    temperature=0.6
-)
+GROQ_BASE_URL = "https://api.groq.com/openai/v1"
 
-ClaudeHaiku = ChatAnthropic(
-    model="claude-3-5-haiku-20240307",
-    max_tokens = 8192,
-    temperature=0.6
-)
+_clients = {}
+_clients_lock = threading.RLock()
+
+
+def _build_client(provider: str, **params):
+    # Responses are cached globally; get_llm(name, cache=False) opts a client out
+    enable_langchain_cache()
+    # Tag LLM usage with the crew, task and agent that caused it
+    instrument_crewai()
+    if provider == "mock" or mock_llm_enabled():
+        # Keeps the spec's model name so usage reports still read per model
+        return build_mock_chat_model(**params)
+    if params.pop("semantic_cache", False):
+        params.setdefault("cache", semantic_langchain_cache())
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+        # CrewAI internals still read the key from the environment
+        os.environ.setdefault("ANTHROPIC_API_KEY", config.ANTHROPIC_API_KEY)
+        llm = instrument_chat_model(ChatAnthropic(api_key=config.ANTHROPIC_API_KEY, **params))
+        return record_responses(llm) if mock_recording_enabled() else llm
+    if provider == "openai":
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(api_key=config.OPENAI_API_KEY, **params)
+    if provider == "groq":
+        from langchain_openai import ChatOpenAI
+        params.setdefault("base_url", GROQ_BASE_URL)
+        return ChatOpenAI(api_key=getattr(config, "GROQ_API_KEY", os.getenv("GROQ_API_KEY")), **params)
+    raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+def register_llm(name: str, provider: str, model: str, **params) -> None:
+    """Add or replace a logical LLM name. Existing memoized clients for it are dropped."""
+    with _clients_lock:
+        LLM_SPECS[name] = {"provider": provider, "model": model, **params}
+        for key in [k for k in _clients if k[0] == name]:
+            del _clients[key]
+
+
+def get_llm(name: str = "ClaudeSonnet", **overrides):
+    """
+    Return the shared client for a logical model name, building it on first use.
+
+    Args:
+        name: Key in LLM_SPECS, e.g. "ClaudeSonnet", "ClaudeHaiku", "GPT4o", "GROQ"
+        **overrides: Constructor parameters that differ from the spec
+                     (model, max_tokens, temperature, ...). Each distinct set
+                     of overrides is memoized separately.
+
+    Returns:
+        A LangChain chat model
+    """
+    if name not in LLM_SPECS:
+        raise KeyError(f"Unknown LLM: {name}. Known: {', '.join(sorted(LLM_SPECS))}")
+
+    key = (name, tuple(sorted(overrides.items())))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            spec = dict(LLM_SPECS[name])
+            provider = spec.pop("provider")
+            spec.update(overrides)
+            client = _build_client(provider, **spec)
+            _clients[key] = client
+        return client
+
+
+def get_anthropic_client(async_client: bool = False):
+    """
+    Return the shared Anthropic SDK client, wrapped with retries and the circuit breaker.
+
+    Args:
+        async_client: Return an AsyncAnthropic client instead
+
+    Returns:
+        anthropic.Anthropic or anthropic.AsyncAnthropic
+    """
+    key = ("anthropic-sdk", async_client)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            if mock_llm_enabled():
+                client = wrap_anthropic_client(MockAnthropicClient(get_mock_responder(), async_client=async_client))
+            else:
+                import anthropic
+                client_class = anthropic.AsyncAnthropic if async_client else anthropic.Anthropic
+                client = wrap_anthropic_client(client_class(api_key=config.ANTHROPIC_API_KEY))
+                if mock_recording_enabled():
+                    record_responses(client)
+            _clients[key] = client
+        return client
+
+
+def __getattr__(name: str):
+    # Keeps "from usefulTools.llm_repository import ClaudeSonnet" working lazily
+    if name in LLM_SPECS:
+        return get_llm(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-ClaudeOpus = ChatAnthropic(
-    model="claude-3-opus-20240229",
-    max_tokens = 8192,
-    temperature=0.6
-)
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(LLM_SPECS))
@@ -0,0 +1,282 @@
+"""
+Retry, backoff and circuit breaking for LLM API calls.
+
+Transient failures are retried on the single request that failed, not by
+re-running a whole crew:
+  * 429 rate limits, 529 overloaded, 5xx and connection errors are retried
+    with full-jitter exponential backoff;
+  * a Retry-After header from the API takes precedence over the computed delay;
+  * a per-provider circuit breaker opens after repeated failures and sheds
+    load (CircuitOpenError) until the reset timeout has passed, then lets a
+    single probe request through.
+
+Usage:
+    @llm_retry
+    def call(): ...
+
+    @llm_retry(max_retries=2)
+    async def acall(): ...
+
+    client = wrap_anthropic_client(anthropic.Anthropic())   # SDK clients
+    llm = instrument_chat_model(ChatAnthropic(...))          # LangChain models
+
+Clients from usefulTools/llm_repository.py are already instrumented.
+
+Environment overrides:
+    LLM_MAX_RETRIES          retries per request (default: 5)
+    LLM_RETRY_BASE_DELAY     first backoff step in seconds (default: 1)
+    LLM_RETRY_MAX_DELAY      backoff cap in seconds (default: 60)
+    LLM_BREAKER_THRESHOLD    consecutive failures that open the breaker (default: 8)
+    LLM_BREAKER_RESET        seconds the breaker stays open (default: 30)
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+
+from usefulTools.llm_governor import governed
+from usefulTools.llm_usage import metered, metered_async
+from usefulTools.prompt_cache import prompt_cached
+from usefulTools.rate_limiter import backoff_delay, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+try:
+    import anthropic
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+
+DEFAULT_MAX_RETRIES = int(os.environ.get("LLM_MAX_RETRIES", 5))
+DEFAULT_BASE_DELAY = float(os.environ.get("LLM_RETRY_BASE_DELAY", 1.0))
+DEFAULT_MAX_DELAY = float(os.environ.get("LLM_RETRY_MAX_DELAY", 60.0))
+DEFAULT_BREAKER_THRESHOLD = int(os.environ.get("LLM_BREAKER_THRESHOLD", 8))
+DEFAULT_BREAKER_RESET = float(os.environ.get("LLM_BREAKER_RESET", 30.0))
+
+# 529 is Anthropic's "overloaded_error"
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the API while its circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit breaker for {name} is open; retry in {retry_in:.1f}s")
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_BREAKER_THRESHOLD,
+                 reset_timeout: float = DEFAULT_BREAKER_RESET):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError unless a request may go out now; True if it is the half-open probe."""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return False
+            if state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """The probe ended without an answer (cancelled, interrupted); let the next call probe."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._probing:
+                    logger.warning(f"Opening circuit breaker for {self.name} after {self._failures} failures")
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"state": self._state(), "consecutive_failures": self._failures, "rejected": self.rejected}
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Shared circuit breaker for a provider, e.g. "anthropic"."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name)
+        return breaker
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True for rate limits, overloads, server errors and connection failures."""
+    if isinstance(error, CircuitOpenError):
+        return False
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS_CODES
+    if ANTHROPIC_AVAILABLE and isinstance(error, anthropic.APIConnectionError):
+        return True
+    return "overloaded_error" in str(error)
+
+
+def retry_after_seconds(error: BaseException):
+    """Delay requested by the API through a Retry-After header, or None."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("retry-after"))
+
+
+def retry_delay(error: BaseException, attempt: int, base_delay: float, max_delay: float) -> float:
+    """Seconds to wait before retry number `attempt + 1`: Retry-After if given, else backoff."""
+    retry_after = retry_after_seconds(error)
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return backoff_delay(attempt, base=base_delay, cap=max_delay)
+
+
+def llm_retry(func=None, *, max_retries: int = None, breaker: str = "anthropic",
+              base_delay: float = None, max_delay: float = None, is_async: bool = None):
+    """
+    Decorate a sync or async LLM call with backoff retries and a circuit breaker.
+
+    Args:
+        func: The function to wrap (omit to use as @llm_retry(...))
+        max_retries: Retries after the first attempt
+        breaker: Name of the shared circuit breaker
+        base_delay: First backoff step in seconds
+        max_delay: Upper bound for any single wait
+        is_async: Force async handling for callables that return coroutines
+                  but are not declared with async def
+
+    Returns:
+        The wrapped callable
+    """
+    if func is None:
+        return functools.partial(llm_retry, max_retries=max_retries, breaker=breaker,
+                                 base_delay=base_delay, max_delay=max_delay, is_async=is_async)
+
+    retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+    base = DEFAULT_BASE_DELAY if base_delay is None else base_delay
+    cap = DEFAULT_MAX_DELAY if max_delay is None else max_delay
+    circuit = get_breaker(breaker)
+
+    def _handle_failure(error, attempt):
+        if not is_retryable(error):
+            # The API answered (e.g. a 400), so it is not overloaded
+            circuit.record_success()
+            raise error
+        circuit.record_failure()
+        if attempt >= retries:
+            raise error
+        delay = retry_delay(error, attempt, base, cap)
+        logger.warning(f"LLM call failed ({error.__class__.__name__}); retry {attempt + 1}/{retries} in {delay:.1f}s")
+        return delay
+
+    if is_async or (is_async is None and inspect.iscoroutinefunction(func)):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            for attempt in range(retries + 1):
+                probe = circuit.before_call()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    await asyncio.sleep(_handle_failure(e, attempt))
+                    continue
+                except BaseException:
+                    # Cancelled mid-call: not a verdict on the API, but the probe must not stay taken
+                    if probe:
+                        circuit.release_probe()
+                    raise
+                circuit.record_success()
+                return result
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(retries + 1):
+            probe = circuit.before_call()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                time.sleep(_handle_failure(e, attempt))
+                continue
+            except BaseException:
+                if probe:
+                    circuit.release_probe()
+                raise
+            circuit.record_success()
+            return result
+    return wrapper
+
+
+def wrap_anthropic_client(client, **retry_options):
+    """
+    Route an Anthropic SDK client's messages.create through llm_retry.
+
+    The SDK's own retries are switched off so that every attempt goes
+    through one backoff policy and one circuit breaker. Each attempt also
+    takes a slot from the LLM governor (usefulTools/llm_governor.py), and
+    backoff waits happen outside the slot. Successful calls are metered
+    (usefulTools/llm_usage.py), and stable prompt prefixes are marked for
+    provider-side caching (usefulTools/prompt_cache.py).
+    """
+    if getattr(client, "_llm_retry_wrapped", False):
+        return client
+    is_async = getattr(client, "is_async", False) or (ANTHROPIC_AVAILABLE and isinstance(client, anthropic.AsyncAnthropic))
+    client.max_retries = 0
+    create = (metered_async if is_async else metered)(prompt_cached(client.messages.create))
+    create = governed(create, is_async=is_async)
+    client.messages.create = llm_retry(create, is_async=is_async, **retry_options)
+    client._llm_retry_wrapped = True
+    return client
+
+
+def instrument_chat_model(llm, **retry_options):
+    """Wrap the SDK clients inside a LangChain ChatAnthropic model in place."""
+    for attribute in ("_client", "_async_client"):
+        client = getattr(llm, attribute, None)
+        if client is not None and hasattr(client, "messages"):
+            wrap_anthropic_client(client, **retry_options)
+    return llm
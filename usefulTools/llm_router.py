@@ -0,0 +1,132 @@
+"""
+Task-aware model routing.
+
+Call sites declare what kind of work a step does instead of naming a model:
+
+    classify    pick a label or lane from a fixed set
+    extract     pull structured data (JSON, fields) out of text
+    summarize   condense or restate existing content
+    synthesize  open-ended reasoning, research and writing
+
+ROUTING_POLICY maps each class to an escalation ladder of registry names
+(usefulTools/llm_repository.py), cheapest first. Changing the policy
+re-routes every call site at once; no script needs editing.
+
+    agent = Agent(..., llm=llm_for("classify"))           # first model of the ladder
+
+    message = routed_messages_create(                      # raw SDK calls
+        client, "extract", validate=is_json_array,
+        max_tokens=2000, system=..., messages=[...]
+    )
+
+routed_messages_create() falls back to the next model when a call still
+fails with a retryable error after its retries, and escalates to the next
+model when validate() rejects the response text. Every model shares the
+provider's circuit breaker (usefulTools/llm_retry.py), so an open breaker
+ends the ladder with CircuitOpenError instead of falling back.
+
+Environment overrides:
+    LLM_ROUTE_<CLASS>     comma-separated ladder, e.g. LLM_ROUTE_EXTRACT=ClaudeSonnet
+    LLM_ROUTING_DISABLED  set to "1" to send every class to UNROUTED_MODEL (ClaudeSonnet)
+"""
+
+import logging
+import os
+
+from usefulTools.llm_cache import cached_messages_create
+from usefulTools.llm_repository import LLM_SPECS, get_llm
+from usefulTools.llm_retry import is_retryable
+
+logger = logging.getLogger(__name__)
+
+TASK_CLASSES = ("classify", "extract", "summarize", "synthesize")
+
+# What every call site used before routing existed
+UNROUTED_MODEL = "ClaudeSonnet"
+
+ROUTING_POLICY = {
+    "classify": ["ClaudeHaiku", "ClaudeSonnet"],
+    "extract": ["ClaudeHaiku", "ClaudeSonnet"],
+    "summarize": ["ClaudeHaiku", "ClaudeSonnet"],
+    "synthesize": ["ClaudeSonnet", "ClaudeOpus"],
+}
+
+
+class RoutingError(RuntimeError):
+    """Raised when every model in a task class's ladder failed or was rejected."""
+
+
+def model_ladder(task_class: str) -> list:
+    """Registry names to try for a task class, cheapest first."""
+    if task_class not in ROUTING_POLICY:
+        raise ValueError(f"Unknown task class: {task_class}. Known: {', '.join(TASK_CLASSES)}")
+    override = os.environ.get(f"LLM_ROUTE_{task_class.upper()}")
+    ladder = [name.strip() for name in override.split(",") if name.strip()] if override else list(ROUTING_POLICY[task_class])
+    if os.environ.get("LLM_ROUTING_DISABLED", "0") == "1":
+        ladder = [UNROUTED_MODEL]
+    return ladder
+
+
+def llm_for(task_class: str, **overrides):
+    """
+    LangChain chat model for a task class, e.g. for an Agent's llm.
+
+    Args:
+        task_class: One of TASK_CLASSES
+        **overrides: Constructor overrides passed to get_llm
+
+    Returns:
+        The first model of the ladder that can be built
+    """
+    errors = []
+    for name in model_ladder(task_class):
+        try:
+            return get_llm(name, **overrides)
+        except Exception as e:
+            logger.warning(f"Could not build {name} for {task_class}: {e}")
+            errors.append(f"{name}: {e}")
+    raise RoutingError(f"No model available for {task_class}: {'; '.join(errors)}")
+
+
+def _response_text(message) -> str:
+    return "".join(getattr(block, "text", "") for block in getattr(message, "content", []))
+
+
+def routed_messages_create(client, task_class: str, validate=None, **kwargs):
+    """
+    messages.create routed by task class, with fallback and escalation.
+
+    Args:
+        client: An Anthropic SDK client (see get_anthropic_client)
+        task_class: One of TASK_CLASSES; picks the model, so omit "model"
+        validate: Optional callable taking the response text and returning
+                  True if it is usable; a rejection escalates to the next model
+        **kwargs: Remaining messages.create arguments (cached like
+                  cached_messages_create)
+
+    Returns:
+        anthropic.types.Message: The first response that passed validation
+
+    Raises:
+        RoutingError: If every model failed or was rejected
+        CircuitOpenError: If the provider's circuit breaker is open
+    """
+    kwargs.pop("model", None)
+    ladder = model_ladder(task_class)
+    problems = []
+    for position, name in enumerate(ladder):
+        model = LLM_SPECS[name]["model"]
+        try:
+            message = cached_messages_create(client, model=model, **kwargs)
+        except Exception as e:
+            if not is_retryable(e) or position == len(ladder) - 1:
+                raise
+            logger.warning(f"{name} failed for {task_class} ({e}); falling back")
+            problems.append(f"{name}: {e}")
+            continue
+
+        if validate is None or validate(_response_text(message)):
+            return message
+        logger.info(f"{name} output rejected for {task_class}; escalating")
+        problems.append(f"{name}: rejected by validation")
+    raise RoutingError(f"All models failed for {task_class}: {'; '.join(problems)}")
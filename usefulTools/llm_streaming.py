@@ -0,0 +1,103 @@
+"""
+Token streaming for Anthropic calls.
+
+stream_text() yields the response text as it is generated instead of
+returning the whole completion at the end, so a UI can start rendering
+after the first tokens:
+
+    chunks = stream_text(get_anthropic_client(), model=..., max_tokens=1024,
+                         system=..., messages=[...])
+    for text in chunks:
+        print(text, end="", flush=True)
+
+A stream is treated like messages.create on an instrumented client:
+  * it holds a governor slot (usefulTools/llm_governor.py) until the last token;
+  * failures before the first token are retried with backoff under the shared
+    circuit breaker (usefulTools/llm_retry.py); after that they are raised,
+    since a retry would repeat text the caller already has;
+  * cacheable prefixes are marked (usefulTools/prompt_cache.py);
+  * the final token usage is recorded (usefulTools/llm_usage.py).
+
+Streams are never cached. The priority class and usage tags are captured when
+stream_text() is called, so the returned generator can be consumed on another
+thread, e.g. by a FastAPI StreamingResponse. Consumers that stop early should
+close() the generator: that frees the governor slot right away instead of
+when the generator is garbage-collected.
+"""
+
+import contextvars
+import logging
+import time
+from typing import Iterator
+
+from usefulTools.llm_governor import current_priority, estimate_request_tokens, get_governor, response_tokens
+from usefulTools.llm_retry import (
+    DEFAULT_BASE_DELAY, DEFAULT_MAX_DELAY, DEFAULT_MAX_RETRIES,
+    get_breaker, is_retryable, retry_delay
+)
+from usefulTools.llm_usage import record_response
+from usefulTools.prompt_cache import mark_cacheable_prefix
+
+logger = logging.getLogger(__name__)
+
+
+def stream_text(client, max_retries: int = None, breaker: str = "anthropic", **kwargs) -> Iterator[str]:
+    """
+    Stream a messages request as text chunks.
+
+    Args:
+        client: An Anthropic SDK client (see get_anthropic_client)
+        max_retries: Retries before the first token (default: LLM_MAX_RETRIES)
+        breaker: Name of the shared circuit breaker
+        **kwargs: messages.stream arguments (model, max_tokens, system, messages, ...)
+
+    Returns:
+        Iterator[str]: Text deltas in order; nothing is sent until iteration starts
+    """
+    retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+    request = mark_cacheable_prefix(kwargs)
+    return _stream(client, request, retries, breaker, current_priority(), contextvars.copy_context())
+
+
+def _stream(client, request: dict, retries: int, breaker: str, priority: int, context) -> Iterator[str]:
+    governor = get_governor()
+    circuit = get_breaker(breaker)
+    for attempt in range(retries + 1):
+        probe = circuit.before_call()
+        permit = None
+        started = False
+        tokens = None
+        try:
+            permit = governor.acquire(priority, estimate_request_tokens(request))
+            start = time.monotonic()
+            with client.messages.stream(**request) as stream:
+                for text in stream.text_stream:
+                    started = True
+                    yield text
+                message = stream.get_final_message()
+        except Exception as e:
+            if not is_retryable(e):
+                # The API answered (e.g. a 400), so it is not overloaded
+                circuit.record_success()
+                raise
+            circuit.record_failure()
+            if started or attempt >= retries:
+                raise
+            delay = retry_delay(e, attempt, DEFAULT_BASE_DELAY, DEFAULT_MAX_DELAY)
+            logger.warning(f"LLM stream failed ({e.__class__.__name__}); retry {attempt + 1}/{retries} in {delay:.1f}s")
+        except BaseException:
+            # Closed by the consumer (GeneratorExit, e.g. an SSE client went away) or interrupted
+            if started:
+                circuit.record_success()
+            elif probe:
+                circuit.release_probe()
+            raise
+        else:
+            circuit.record_success()
+            tokens = response_tokens(message)
+            context.run(record_response, request, message, time.monotonic() - start)
+            return
+        finally:
+            if permit is not None:
+                governor.release(permit, tokens)
+        time.sleep(delay)
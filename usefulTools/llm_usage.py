@@ -0,0 +1,400 @@
+"""
+Token, latency and cost accounting for LLM calls.
+
+Every Anthropic request made through an instrumented client (registry models
+and get_anthropic_client(), see usefulTools/llm_retry.py) and every LLM cache
+hit is recorded with its model, input/output tokens, latency and cache-hit
+status. Each record is tagged with the crew, task and agent role that
+triggered it.
+
+Tagging works through instrument_crewai(), which the registry calls when it
+builds the first client: Crew.kickoff() opens a run for the crew and
+Agent.execute_task() tags calls with the current task and agent. Code
+outside crews can tag calls itself:
+
+    with usage_scope(crew="agent_generator", task="backstories"):
+        ...
+
+Each top-level kickoff is one run. Write a run's report next to the script's output:
+
+    result = crew.kickoff()
+    write_usage_report("south_asian_history")   # -> *_llm_usage.json / *_llm_usage.txt
+
+Kickoffs made inside an open run join it instead of starting their own, so
+wrap work that spans several crews in usage_run(); run_crews() and
+kickoff_task_graph() do this for their crews:
+
+    with usage_run() as run_id:
+        for guest in guests:
+            create_crew(guest).kickoff()
+
+Set LLM_USAGE_REPORT_DIR to also write a report automatically after every
+top-level run. Costs use MODEL_PRICES (USD per million tokens) and are estimates.
+
+Input tokens read from or written to the provider's prompt cache
+(usefulTools/prompt_cache.py) are recorded separately as prefix_read_tokens
+and prefix_write_tokens; input_tokens counts only the uncached remainder.
+"""
+
+import contextlib
+import contextvars
+import datetime
+import functools
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# USD per million input/output tokens, matched by model-name prefix
+MODEL_PRICES = {
+    "claude-sonnet-4": (3.00, 15.00),
+    "claude-3-7-sonnet": (3.00, 15.00),
+    "claude-3-5-sonnet": (3.00, 15.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-3-haiku": (0.25, 1.25),
+    "claude-3-opus": (15.00, 75.00),
+    "claude-opus-4": (15.00, 75.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+}
+
+# Prompt cache reads and writes relative to the input price
+PREFIX_READ_PRICE_FACTOR = 0.1
+PREFIX_WRITE_PRICE_FACTOR = 1.25
+
+_crew = contextvars.ContextVar("llm_usage_crew", default=None)
+_task = contextvars.ContextVar("llm_usage_task", default=None)
+_agent = contextvars.ContextVar("llm_usage_agent", default=None)
+_run = contextvars.ContextVar("llm_usage_run", default=None)
+
+
+class UsageRecord(NamedTuple):
+    """One LLM call (or cache hit) with the crew/task/agent that made it."""
+    timestamp: str
+    run_id: str
+    crew: str
+    task: str
+    agent: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    latency: float
+    cache_hit: bool
+    prefix_read_tokens: int = 0
+    prefix_write_tokens: int = 0
+
+    @property
+    def cost(self) -> float:
+        """Estimated cost in USD; cache hits cost nothing."""
+        if self.cache_hit:
+            return 0.0
+        return estimate_cost(self.model, self.input_tokens, self.output_tokens,
+                             self.prefix_read_tokens, self.prefix_write_tokens)
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int,
+                  prefix_read_tokens: int = 0, prefix_write_tokens: int = 0) -> float:
+    for prefix in sorted(MODEL_PRICES, key=len, reverse=True):
+        if (model or "").startswith(prefix):
+            input_price, output_price = MODEL_PRICES[prefix]
+            billed_input = (input_tokens + prefix_read_tokens * PREFIX_READ_PRICE_FACTOR
+                            + prefix_write_tokens * PREFIX_WRITE_PRICE_FACTOR)
+            return (billed_input * input_price + output_tokens * output_price) / 1_000_000
+    return 0.0
+
+
+class UsageTracker:
+    """Thread-safe in-memory store of usage records, grouped into runs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+        self.last_run_id = None
+
+    def record(self, model: str, input_tokens: int = 0, output_tokens: int = 0,
+               latency: float = 0.0, cache_hit: bool = False,
+               prefix_read_tokens: int = 0, prefix_write_tokens: int = 0) -> UsageRecord:
+        record = UsageRecord(
+            timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
+            run_id=_run.get() or "default",
+            crew=_crew.get() or _script_name(),
+            task=_task.get() or "-",
+            agent=_agent.get() or "-",
+            model=model or "unknown",
+            input_tokens=int(input_tokens or 0),
+            output_tokens=int(output_tokens or 0),
+            latency=round(latency, 3),
+            cache_hit=cache_hit,
+            prefix_read_tokens=int(prefix_read_tokens or 0),
+            prefix_write_tokens=int(prefix_write_tokens or 0)
+        )
+        with self._lock:
+            self.records.append(record)
+        return record
+
+    def run_records(self, run_id: str = None) -> list:
+        run_id = run_id or self.last_run_id or "default"
+        with self._lock:
+            return [r for r in self.records if r.run_id == run_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records = []
+            self.last_run_id = None
+
+
+usage_tracker = UsageTracker()
+
+
+def _script_name() -> str:
+    return os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0] or "python"
+
+
+@contextlib.contextmanager
+def usage_scope(crew: str = None, task: str = None, agent: str = None, run_id: str = None):
+    """Tag LLM calls made inside the block; unspecified tags are inherited."""
+    tokens = []
+    for var, value in ((_crew, crew), (_task, task), (_agent, agent), (_run, run_id)):
+        if value is not None:
+            tokens.append((var, var.set(value)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+@contextlib.contextmanager
+def usage_run():
+    """
+    Group the LLM calls made inside the block into one run; yields its run id.
+
+    Inside an open run (also in worker threads that copied its context) this
+    joins that run. Otherwise it starts a new one, makes it usage_tracker's
+    last run and writes its report to LLM_USAGE_REPORT_DIR when the block exits.
+    """
+    active = _run.get()
+    if active is not None:
+        yield active
+        return
+
+    run_id = f"{_script_name()}-{uuid.uuid4().hex[:8]}"
+    usage_tracker.last_run_id = run_id
+    token = _run.set(run_id)
+    try:
+        yield run_id
+    finally:
+        _run.reset(token)
+        report_dir = os.environ.get("LLM_USAGE_REPORT_DIR")
+        if report_dir:
+            try:
+                write_usage_report(os.path.join(report_dir, run_id), run_id)
+            except OSError as e:
+                logger.warning(f"Could not write LLM usage report: {e}")
+
+
+def _latency_saved(prefix_hits: list, prefix_misses: list) -> float:
+    """Estimate: calls that read the prompt cache vs. calls that had to write it."""
+    if not prefix_hits or not prefix_misses:
+        return 0.0
+    saved_per_call = sum(prefix_misses) / len(prefix_misses) - sum(prefix_hits) / len(prefix_hits)
+    return round(max(0.0, saved_per_call) * len(prefix_hits), 3)
+
+
+def summarize(records) -> dict:
+    """Roll records up into totals and per (crew, task, agent, model) rows, most expensive first."""
+    groups = {}
+    latencies = {}
+    for r in records:
+        key = (r.crew, r.task, r.agent, r.model)
+        row = groups.setdefault(key, {
+            "crew": r.crew, "task": r.task, "agent": r.agent, "model": r.model,
+            "calls": 0, "cache_hits": 0, "input_tokens": 0, "output_tokens": 0,
+            "tokens_saved": 0, "prefix_read_tokens": 0, "prefix_write_tokens": 0,
+            "prefix_hit_calls": 0, "latency": 0.0, "latency_saved": 0.0, "cost": 0.0
+        })
+        row["calls"] += 1
+        if r.cache_hit:
+            row["cache_hits"] += 1
+            row["tokens_saved"] += r.input_tokens + r.output_tokens
+        else:
+            row["input_tokens"] += r.input_tokens
+            row["output_tokens"] += r.output_tokens
+            row["prefix_read_tokens"] += r.prefix_read_tokens
+            row["prefix_write_tokens"] += r.prefix_write_tokens
+            if r.prefix_read_tokens:
+                row["prefix_hit_calls"] += 1
+                latencies.setdefault(key, ([], []))[0].append(r.latency)
+            elif r.prefix_write_tokens:
+                latencies.setdefault(key, ([], []))[1].append(r.latency)
+        row["latency"] = round(row["latency"] + r.latency, 3)
+        row["cost"] = round(row["cost"] + r.cost, 6)
+    for key, (prefix_hits, prefix_misses) in latencies.items():
+        groups[key]["latency_saved"] = _latency_saved(prefix_hits, prefix_misses)
+    rows = sorted(groups.values(), key=lambda row: (row["cost"], row["input_tokens"] + row["output_tokens"]), reverse=True)
+    totals = {
+        field: sum(row[field] for row in rows)
+        for field in ("calls", "cache_hits", "input_tokens", "output_tokens", "tokens_saved",
+                      "prefix_read_tokens", "prefix_write_tokens", "prefix_hit_calls")
+    }
+    prompt_tokens = totals["input_tokens"] + totals["prefix_read_tokens"] + totals["prefix_write_tokens"]
+    totals["prefix_hit_ratio"] = round(totals["prefix_read_tokens"] / prompt_tokens, 4) if prompt_tokens else 0.0
+    totals["latency"] = round(sum(row["latency"] for row in rows), 3)
+    totals["latency_saved"] = round(sum(row["latency_saved"] for row in rows), 3)
+    totals["cost"] = round(sum(row["cost"] for row in rows), 6)
+    return {"totals": totals, "rows": rows}
+
+
+def format_summary_table(summary: dict) -> str:
+    headers = ["Crew", "Task", "Agent", "Model", "Calls", "Hits", "In tok", "Prefix read", "Out tok",
+               "Saved tok", "Latency s", "Cost $"]
+    lines = [
+        [row["crew"], row["task"], row["agent"], row["model"], row["calls"], row["cache_hits"],
+         row["input_tokens"], row["prefix_read_tokens"], row["output_tokens"], row["tokens_saved"],
+         f"{row['latency']:.1f}", f"{row['cost']:.4f}"]
+        for row in summary["rows"]
+    ]
+    totals = summary["totals"]
+    lines.append(["TOTAL", "", "", "", totals["calls"], totals["cache_hits"], totals["input_tokens"],
+                  totals["prefix_read_tokens"], totals["output_tokens"], totals["tokens_saved"],
+                  f"{totals['latency']:.1f}", f"{totals['cost']:.4f}"])
+    cells = [[str(c)[:40] for c in line] for line in [headers] + lines]
+    widths = [max(len(line[i]) for line in cells) for i in range(len(headers))]
+    rendered = [" | ".join(c.ljust(w) for c, w in zip(line, widths)) for line in cells]
+    rendered.insert(1, "-+-".join("-" * w for w in widths))
+    rendered.insert(-1, rendered[1])
+    rendered.append(f"Prompt cache: {totals['prefix_hit_ratio']:.0%} of input tokens read from cache "
+                    f"({totals['prefix_hit_calls']} calls), ~{totals['latency_saved']:.1f}s latency saved")
+    return "\n".join(rendered)
+
+
+def write_usage_report(path_prefix: str, run_id: str = None) -> tuple:
+    """
+    Write the usage report for a run (default: the latest kickoff).
+
+    Args:
+        path_prefix: Output path without extension, e.g. "<topic>"
+        run_id: Run to report on
+
+    Returns:
+        tuple: Paths of the JSON report and the summary table
+    """
+    records = usage_tracker.run_records(run_id)
+    summary = summarize(records)
+    json_path = f"{path_prefix}_llm_usage.json"
+    table_path = f"{path_prefix}_llm_usage.txt"
+    directory = os.path.dirname(json_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "run_id": run_id or usage_tracker.last_run_id or "default",
+            "summary": summary,
+            "calls": [dict(r._asdict(), cost=round(r.cost, 6)) for r in records]
+        }, f, indent=2)
+    with open(table_path, "w", encoding="utf-8") as f:
+        f.write(format_summary_table(summary) + "\n")
+    logger.info(f"LLM usage report written to {json_path}")
+    return json_path, table_path
+
+
+def metered(func):
+    """Wrap a messages.create-style callable to record usage and latency of each call."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.monotonic()
+        response = func(*args, **kwargs)
+        record_response(kwargs, response, time.monotonic() - start)
+        return response
+    return wrapper
+
+
+def metered_async(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.monotonic()
+        response = await func(*args, **kwargs)
+        record_response(kwargs, response, time.monotonic() - start)
+        return response
+    return wrapper
+
+
+def record_response(request: dict, response, latency: float, cache_hit: bool = False) -> None:
+    """Record the usage an Anthropic response reports for a request."""
+    usage = getattr(response, "usage", None)
+    usage_tracker.record(
+        model=getattr(response, "model", None) or request.get("model"),
+        input_tokens=getattr(usage, "input_tokens", 0) if usage else 0,
+        output_tokens=getattr(usage, "output_tokens", 0) if usage else 0,
+        latency=latency,
+        cache_hit=cache_hit,
+        prefix_read_tokens=getattr(usage, "cache_read_input_tokens", 0) if usage else 0,
+        prefix_write_tokens=getattr(usage, "cache_creation_input_tokens", 0) if usage else 0
+    )
+
+
+def record_cache_hit(request: dict, response) -> None:
+    """Record a cached Anthropic response; its tokens are reported as saved."""
+    record_response(request, response, 0.0, cache_hit=True)
+
+
+_LLM_STRING_MODEL = re.compile(r"""['"]model(?:_name)?['"]\s*[,:]\s*['"]([^'"]+)""")
+
+
+def record_langchain_cache_hit(llm_string: str, generations) -> None:
+    """Record a LangChain cache hit, reading token counts from the cached messages if present."""
+    match = _LLM_STRING_MODEL.search(llm_string or "")
+    input_tokens = output_tokens = 0
+    for generation in generations:
+        usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+        input_tokens += usage.get("input_tokens", 0)
+        output_tokens += usage.get("output_tokens", 0)
+    usage_tracker.record(match.group(1) if match else None, input_tokens, output_tokens, 0.0, cache_hit=True)
+
+
+def _task_label(task) -> str:
+    label = getattr(task, "name", None) or (getattr(task, "description", "") or "").strip().split("\n")[0]
+    return label[:60] or "task"
+
+
+_crewai_instrumented = False
+_instrument_lock = threading.Lock()
+
+
+def instrument_crewai() -> None:
+    """Tag LLM calls made during Crew.kickoff() with the crew, task and agent (once per process)."""
+    global _crewai_instrumented
+    with _instrument_lock:
+        if _crewai_instrumented:
+            return
+        try:
+            from crewai import Agent, Crew
+        except ImportError:
+            return
+
+        original_kickoff = Crew.kickoff
+        original_execute_task = Agent.execute_task
+
+        @functools.wraps(original_kickoff)
+        def kickoff(self, *args, **kwargs):
+            crew_name = getattr(self, "name", None)
+            if not crew_name or crew_name == "crew":
+                crew_name = " / ".join(agent.role for agent in self.agents)[:80] or _script_name()
+            with usage_run(), usage_scope(crew=crew_name, task="-", agent="-"):
+                return original_kickoff(self, *args, **kwargs)
+
+        @functools.wraps(original_execute_task)
+        def execute_task(self, task=None, *args, **kwargs):
+            with usage_scope(task=_task_label(task), agent=self.role):
+                return original_execute_task(self, task, *args, **kwargs)
+
+        Crew.kickoff = kickoff
+        Agent.execute_task = execute_task
+        _crewai_instrumented = True
@@ -0,0 +1,465 @@
+"""
+Deterministic mock LLM backend for offline runs and benchmarks.
+
+With the mock selected, crews run end to end without network access or API
+cost, so orchestration overhead (agent creation, task wiring, output
+parsing, governor and metering) can be timed and profiled on its own:
+
+    LLM_MOCK=1 python -m cProfile -o guest_finder.prof podcastPersonalityFinder/podcastGuestFinderWithNicheProvided.py
+
+    llm = get_llm("Mock")            # or select a single model through the registry
+
+Only the provider is replaced. MockAnthropicClient stands in for the
+Anthropic SDK client and goes through the same retry, governor, prompt
+cache and usage layers as a real one (usefulTools/llm_retry.py).
+MockChatModel is the LangChain chat model that get_llm() returns, and it
+calls that client.
+
+Each response is, in order of preference:
+  1. a recorded response for the same prompt (system prompt and messages);
+  2. a recorded {"match": "...", "text": "..."} rule whose text occurs in the prompt;
+  3. a generated stub: an instance of a JSON schema found in the prompt, "[]"
+     when a JSON array is asked for, otherwise deterministic filler text. The
+     stub is wrapped in "Final Answer:" when the prompt is a CrewAI agent
+     prompt, so agents finish without calling tools.
+
+Record real responses once, then replay them offline:
+
+    LLM_MOCK_RECORD=1 python podcastHelperAgents/podcastEditorAssistant_V2.py
+    LLM_MOCK=1 python podcastHelperAgents/podcastEditorAssistant_V2.py
+
+The response caches are bypassed while the mock is active, so mock output
+never reaches them and repeated benchmark runs do the same work.
+
+Environment overrides:
+    LLM_MOCK                set to "1" to serve every get_llm() / get_anthropic_client() call from the mock
+    LLM_MOCK_RECORDINGS     JSONL file of recorded responses (default: db/llm_recordings.jsonl)
+    LLM_MOCK_RECORD         set to "1" to append real Anthropic responses to LLM_MOCK_RECORDINGS
+    LLM_MOCK_LATENCY        seconds added to every call (default: 0)
+    LLM_MOCK_TOKEN_LATENCY  seconds added per output token (default: 0)
+    LLM_MOCK_OUTPUT_WORDS   length of generated filler text (default: 120)
+"""
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+
+logger = logging.getLogger(__name__)
+
+try:
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+    LANGCHAIN_CORE_AVAILABLE = True
+except ImportError:
+    BaseChatModel = object
+    LANGCHAIN_CORE_AVAILABLE = False
+
+try:
+    import anthropic
+    from anthropic.types import Message
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+
+DEFAULT_RECORDINGS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "llm_recordings.jsonl"
+)
+MOCK_MODEL = "mock-llm"
+
+_FILLER_WORDS = (
+    "the guest discusses how ideas shape institutions and why careful research "
+    "matters for a thoughtful conversation about progress culture and change"
+).split()
+
+# LangChain message types -> Anthropic roles
+_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+
+def mock_llm_enabled() -> bool:
+    return os.environ.get("LLM_MOCK", "0") == "1"
+
+
+def mock_recording_enabled() -> bool:
+    return os.environ.get("LLM_MOCK_RECORD", "0") == "1" and not mock_llm_enabled()
+
+
+def recordings_path() -> str:
+    return os.environ.get("LLM_MOCK_RECORDINGS", DEFAULT_RECORDINGS_PATH)
+
+
+def _content_text(content) -> str:
+    # Joined without a separator: prompt caching splits text into blocks
+    # (usefulTools/prompt_cache.py), and the key must not depend on where
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content or [] if isinstance(block, dict))
+
+
+def request_pairs(request: dict) -> list:
+    """(role, text) pairs of a messages.create request, the unit recordings are keyed on (cache_control is ignored)."""
+    pairs = []
+    system = _content_text(request.get("system") or "")
+    if system:
+        pairs.append(["system", system])
+    pairs.extend([m.get("role", "user"), _content_text(m.get("content", ""))] for m in request.get("messages", []))
+    return pairs
+
+
+def prompt_key(pairs: list) -> str:
+    return hashlib.sha256(json.dumps(pairs, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+# -----------------------------------------------------------------------------
+# Stub generation
+# -----------------------------------------------------------------------------
+
+def _resolve_ref(schema: dict, root: dict) -> dict:
+    ref = schema.get("$ref", "")
+    node = root
+    for part in ref.lstrip("#/").split("/"):
+        node = node.get(part, {}) if part else node
+    return node
+
+
+def schema_instance(schema: dict, root: dict = None, depth: int = 0):
+    """A minimal deterministic value that conforms to a JSON schema."""
+    root = root or schema
+    if depth > 8 or not isinstance(schema, dict):
+        return None
+    if "$ref" in schema:
+        return schema_instance(_resolve_ref(schema, root), root, depth + 1)
+    if "default" in schema:
+        return schema["default"]
+    if "const" in schema:
+        return schema["const"]
+    if schema.get("enum"):
+        return schema["enum"][0]
+    for combinator in ("anyOf", "oneOf", "allOf"):
+        options = [o for o in schema.get(combinator, []) if o.get("type") != "null"]
+        if options:
+            return schema_instance(options[0], root, depth + 1)
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), None)
+    if kind == "object" or "properties" in schema:
+        return {name: schema_instance(prop, root, depth + 1) for name, prop in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [schema_instance(schema.get("items", {}), root, depth + 1)]
+    if kind == "integer":
+        return 1
+    if kind == "number":
+        return 1.0
+    if kind == "boolean":
+        return True
+    if kind == "string":
+        return "2024-01-01" if schema.get("format") == "date" else f"mock {schema.get('title', 'value').lower()}"
+    return None
+
+
+def find_json_schema(prompt: str):
+    """The first JSON object in the prompt that looks like a JSON schema, or None."""
+    decoder = json.JSONDecoder()
+    for attempt, match in enumerate(re.finditer(r'\{\s*"', prompt)):
+        if attempt >= 50:
+            break
+        try:
+            candidate, _ = decoder.raw_decode(prompt, match.start())
+        except ValueError:
+            continue
+        if isinstance(candidate, dict) and ("properties" in candidate or candidate.get("type") == "object"):
+            return candidate
+    return None
+
+
+def stub_output(pairs: list, output_words: int = 120) -> str:
+    """Deterministic response text for a prompt that has no recording."""
+    prompt = "\n".join(text for _, text in pairs)
+    schema = find_json_schema(prompt)
+    if schema is not None:
+        body = json.dumps(schema_instance(schema))
+    elif re.search(r"json\s+(array|list)", prompt, re.IGNORECASE):
+        body = "[]"
+    else:
+        digest = prompt_key(pairs)[:8]
+        last_user = next((text for role, text in reversed(pairs) if role == "user"), "")
+        topic = next((line.strip() for line in last_user.splitlines() if line.strip()), "the request")[:120]
+        words = [_FILLER_WORDS[(i + int(digest, 16)) % len(_FILLER_WORDS)] for i in range(output_words)]
+        body = f"Mock response {digest} to: {topic}\n\n{' '.join(words)}."
+    if "Final Answer:" in prompt:
+        return f"Thought: I now know the final answer\nFinal Answer: {body}"
+    return body
+
+
+# -----------------------------------------------------------------------------
+# Responder: recordings, stubs and latency
+# -----------------------------------------------------------------------------
+
+class MockResponder:
+    """Picks the response text for a request and simulates its latency."""
+
+    def __init__(self, path: str = None, latency: float = None, token_latency: float = None,
+                 output_words: int = None):
+        self.path = path or recordings_path()
+        self.latency = float(os.environ.get("LLM_MOCK_LATENCY", 0)) if latency is None else latency
+        self.token_latency = float(os.environ.get("LLM_MOCK_TOKEN_LATENCY", 0)) if token_latency is None else token_latency
+        self.output_words = int(os.environ.get("LLM_MOCK_OUTPUT_WORDS", 120)) if output_words is None else output_words
+        self.recorded = {}
+        self.rules = []
+        self.replayed = 0
+        self.stubbed = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed recording at {self.path}:{line_number}")
+                    continue
+                if "key" in entry:
+                    self.recorded[entry["key"]] = entry["text"]
+                elif "match" in entry:
+                    self.rules.append((entry["match"], entry["text"]))
+
+    def text_for(self, pairs: list) -> str:
+        text = self.recorded.get(prompt_key(pairs))
+        if text is None:
+            prompt = "\n".join(t for _, t in pairs)
+            text = next((rule_text for match, rule_text in self.rules if match in prompt), None)
+        if text is None:
+            self.stubbed += 1
+            return stub_output(pairs, self.output_words)
+        self.replayed += 1
+        return text
+
+    def delay_for(self, text: str) -> float:
+        return self.latency + self.token_latency * estimate_tokens(text)
+
+
+_responder = None
+_responder_lock = threading.Lock()
+
+
+def get_mock_responder() -> MockResponder:
+    """Shared responder configured from the environment, created on first use."""
+    global _responder
+    with _responder_lock:
+        if _responder is None:
+            _responder = MockResponder()
+        return _responder
+
+
+# -----------------------------------------------------------------------------
+# Anthropic SDK stand-in
+# -----------------------------------------------------------------------------
+
+def _mock_message(request: dict, text: str, pairs: list):
+    payload = {
+        "id": f"msg_mock_{uuid.uuid4().hex[:12]}",
+        "type": "message",
+        "role": "assistant",
+        "model": request.get("model") or MOCK_MODEL,
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "usage": {
+            "input_tokens": estimate_tokens("\n".join(t for _, t in pairs)),
+            "output_tokens": estimate_tokens(text),
+        },
+    }
+    if ANTHROPIC_AVAILABLE:
+        return Message.model_validate(payload)
+    return SimpleNamespace(
+        **dict(payload, content=[SimpleNamespace(**block) for block in payload["content"]],
+               usage=SimpleNamespace(**payload["usage"]))
+    )
+
+
+class _MockStream:
+    def __init__(self, message, text: str, delay: float):
+        self._message = message
+        self._text = text
+        self._delay = delay
+
+    @property
+    def text_stream(self):
+        pieces = re.findall(r"\S+\s*", self._text) or [self._text]
+        for piece in pieces:
+            time.sleep(self._delay / len(pieces))
+            yield piece
+
+    def get_final_message(self):
+        return self._message
+
+
+class _MockMessages:
+    def __init__(self, responder: MockResponder):
+        self._responder = responder
+
+    def _respond(self, request: dict):
+        pairs = request_pairs(request)
+        text = self._responder.text_for(pairs)
+        return _mock_message(request, text, pairs), text
+
+    def create(self, **kwargs):
+        message, text = self._respond(kwargs)
+        time.sleep(self._responder.delay_for(text))
+        return message
+
+    @contextlib.contextmanager
+    def stream(self, **kwargs):
+        message, text = self._respond(kwargs)
+        yield _MockStream(message, text, self._responder.delay_for(text))
+
+
+class _MockAsyncMessages(_MockMessages):
+    async def create(self, **kwargs):
+        message, text = self._respond(kwargs)
+        await asyncio.sleep(self._responder.delay_for(text))
+        return message
+
+
+class MockAnthropicClient:
+    """Offline stand-in for anthropic.Anthropic / AsyncAnthropic (messages.create and messages.stream)."""
+
+    def __init__(self, responder: MockResponder = None, async_client: bool = False):
+        self.is_async = async_client
+        self.max_retries = 0
+        self.messages = (_MockAsyncMessages if async_client else _MockMessages)(responder or get_mock_responder())
+
+
+_mock_client = None
+
+
+def get_mock_client():
+    """Shared MockAnthropicClient, instrumented like the real client."""
+    global _mock_client
+    responder = get_mock_responder()
+    with _responder_lock:
+        if _mock_client is None:
+            from usefulTools.llm_retry import wrap_anthropic_client
+            _mock_client = wrap_anthropic_client(MockAnthropicClient(responder))
+        return _mock_client
+
+
+# -----------------------------------------------------------------------------
+# LangChain chat model
+# -----------------------------------------------------------------------------
+
+class MockChatModel(BaseChatModel):
+    """LangChain chat model backed by MockAnthropicClient; usable anywhere get_llm() is."""
+
+    model: str = MOCK_MODEL
+    max_tokens: int = 1024
+    temperature: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "mock"
+
+    @property
+    def _identifying_params(self) -> dict:
+        return {"model": self.model}
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        system = "\n\n".join(_content_text(m.content) for m in messages if m.type == "system")
+        request_messages = [
+            {"role": _ROLES.get(m.type, "user"), "content": _content_text(m.content)}
+            for m in messages if m.type != "system"
+        ]
+        response = get_mock_client().messages.create(
+            model=self.model, max_tokens=self.max_tokens, temperature=self.temperature,
+            system=system, messages=request_messages
+        )
+        text = response.content[0].text
+        usage = {
+            "input_tokens": response.usage.input_tokens,
+            "output_tokens": response.usage.output_tokens,
+            "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text, usage_metadata=usage))])
+
+
+def build_mock_chat_model(model: str = None, **params):
+    """MockChatModel for the registry; provider-specific parameters are ignored."""
+    if not LANGCHAIN_CORE_AVAILABLE:
+        raise ImportError("The mock LLM needs langchain_core")
+    return MockChatModel(model=model or MOCK_MODEL, cache=False,
+                         max_tokens=params.get("max_tokens", 1024),
+                         temperature=params.get("temperature", 0.0))
+
+
+# -----------------------------------------------------------------------------
+# Recording real responses
+# -----------------------------------------------------------------------------
+
+_record_lock = threading.Lock()
+
+
+def _append_recording(request: dict, response) -> None:
+    pairs = request_pairs(request)
+    text = "".join(getattr(block, "text", "") for block in getattr(response, "content", []))
+    entry = {"key": prompt_key(pairs), "model": request.get("model"),
+             "preview": pairs[-1][1][:200] if pairs else "", "text": text}
+    path = recordings_path()
+    try:
+        with _record_lock:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.warning(f"Could not record LLM response: {e}")
+
+
+def record_responses(target):
+    """
+    Append every response of an Anthropic client to the recordings file.
+
+    Args:
+        target: An instrumented SDK client, or a LangChain model whose
+                _client / _async_client are recorded
+
+    Returns:
+        The target, modified in place
+    """
+    clients = [target] if hasattr(target, "messages") else [
+        getattr(target, attribute, None) for attribute in ("_client", "_async_client")
+    ]
+    for client in clients:
+        if client is None or getattr(client, "_llm_recorded", False) or isinstance(client, MockAnthropicClient):
+            continue
+        create = client.messages.create
+        if ANTHROPIC_AVAILABLE and isinstance(client, anthropic.AsyncAnthropic):
+            @functools.wraps(create)
+            async def recorded_async(*args, _create=create, **kwargs):
+                response = await _create(*args, **kwargs)
+                _append_recording(kwargs, response)
+                return response
+            client.messages.create = recorded_async
+        else:
+            @functools.wraps(create)
+            def recorded(*args, _create=create, **kwargs):
+                response = _create(*args, **kwargs)
+                _append_recording(kwargs, response)
+                return response
+            client.messages.create = recorded
+        client._llm_recorded = True
+    return target
@@ -0,0 +1,185 @@
+"""
+Provider-side prompt caching for long, stable prompt prefixes.
+
+Anthropic can cache a request prefix (tools, system, messages up to a block
+marked with cache_control) for a few minutes. A later request with the same
+prefix reads it at a tenth of the input price and starts generating sooner.
+Every instrumented client (usefulTools/llm_retry.py) marks requests before
+sending them:
+
+  * a system prompt long enough to be cached is marked automatically, which
+    covers CrewAI agents whose role/goal/backstory repeat on every call;
+  * text declared with cacheable_scope() is marked wherever it appears in the
+    system prompt or messages, also inside prompts built by CrewAI or LangChain;
+  * raw SDK callers can mark blocks themselves with cacheable().
+
+    system = [{"type": "text", "text": instructions}, cacheable(document_text)]
+
+    with cacheable_scope(host_block):
+        crew.kickoff()
+
+At most four blocks per request are marked (the API limit); explicit markers
+count towards it. Prefixes below the model's minimum length (MIN_CACHEABLE_TOKENS)
+are sent normally by the API. Cache reads and writes are recorded per call,
+see prompt_cache_stats() and the usage report (usefulTools/llm_usage.py).
+
+Environment overrides:
+    LLM_PROMPT_CACHE   set to "0" to stop marking requests (explicit cacheable() blocks are still sent)
+"""
+
+import contextlib
+import contextvars
+import functools
+import os
+
+from usefulTools.llm_usage import summarize, usage_tracker
+
+EPHEMERAL = {"type": "ephemeral"}
+MAX_CACHE_BREAKPOINTS = 4
+
+# Shortest cacheable prefix per model-name prefix; other models use DEFAULT_MIN_CACHEABLE_TOKENS
+MIN_CACHEABLE_TOKENS = {
+    "claude-3-5-haiku": 2048,
+    "claude-3-haiku": 2048,
+}
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+_declared = contextvars.ContextVar("llm_cacheable_prefixes", default=())
+
+
+def prompt_cache_enabled() -> bool:
+    return os.environ.get("LLM_PROMPT_CACHE", "1") != "0"
+
+
+def cacheable(text: str) -> dict:
+    """A text content block marked as the end of a cacheable prefix."""
+    return {"type": "text", "text": text, "cache_control": dict(EPHEMERAL)}
+
+
+@contextlib.contextmanager
+def cacheable_scope(*texts: str):
+    """Mark the given texts as cacheable in every LLM request made inside the block."""
+    token = _declared.set(_declared.get() + tuple(t.strip() for t in texts if t and t.strip()))
+    try:
+        yield
+    finally:
+        _declared.reset(token)
+
+
+def min_cacheable_tokens(model: str) -> int:
+    for prefix, tokens in MIN_CACHEABLE_TOKENS.items():
+        if (model or "").startswith(prefix):
+            return tokens
+    return DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+def _count_markers(request: dict) -> int:
+    count = sum(1 for tool in request.get("tools") or [] if isinstance(tool, dict) and "cache_control" in tool)
+    contents = [request.get("system")] + [m.get("content") for m in request.get("messages", [])]
+    for content in contents:
+        if isinstance(content, list):
+            count += sum(1 for block in content if isinstance(block, dict) and "cache_control" in block)
+    return count
+
+
+def _split_at_declared(text: str, declared) -> list:
+    """Text blocks for `text` with the first declared text ending a marked block, or None."""
+    ends = [text.find(d) + len(d) for d in declared if d in text]
+    if not ends:
+        return None
+    end = min(ends)
+    head, tail = text[:end], text[end:]
+    if not tail.strip():
+        return [cacheable(text)]
+    return [cacheable(head), {"type": "text", "text": tail}]
+
+
+def _mark_content(content, declared):
+    """Content with the first declared text marked, or None if it has none."""
+    if isinstance(content, str):
+        return _split_at_declared(content, declared)
+    if isinstance(content, list):
+        for i, block in enumerate(content):
+            if isinstance(block, dict) and block.get("type") == "text" and "cache_control" not in block:
+                split = _split_at_declared(block.get("text", ""), declared)
+                if split:
+                    return content[:i] + split + content[i + 1:]
+    return None
+
+
+def _text_chars(content) -> int:
+    if isinstance(content, str):
+        return len(content)
+    return sum(len(block.get("text", "")) for block in content or [] if isinstance(block, dict))
+
+
+def mark_cacheable_prefix(request: dict) -> dict:
+    """
+    Add cache_control markers to a messages.create request.
+
+    Args:
+        request: messages.create keyword arguments
+
+    Returns:
+        dict: A copy of the request with markers added (the input is not modified)
+    """
+    if not prompt_cache_enabled():
+        return request
+    budget = MAX_CACHE_BREAKPOINTS - _count_markers(request)
+    if budget <= 0:
+        return request
+    request = dict(request)
+    declared = _declared.get()
+
+    system = request.get("system")
+    if system:
+        marked = _mark_content(system, declared) if declared else None
+        if marked is None and _text_chars(system) // 4 >= min_cacheable_tokens(request.get("model")):
+            if isinstance(system, str):
+                marked = [cacheable(system)]
+            elif not any(isinstance(b, dict) and "cache_control" in b for b in system):
+                marked = system[:-1] + [dict(system[-1], cache_control=dict(EPHEMERAL))]
+        if marked is not None:
+            request["system"] = marked
+            budget -= 1
+
+    if declared and budget > 0 and request.get("messages"):
+        messages = list(request["messages"])
+        for i, message in enumerate(messages):
+            if budget <= 0:
+                break
+            marked = _mark_content(message.get("content"), declared)
+            if marked is not None:
+                messages[i] = dict(message, content=marked)
+                budget -= 1
+        request["messages"] = messages
+    return request
+
+
+def prompt_cached(func):
+    """Wrap a messages.create-style callable (sync or async) to mark cacheable prefixes."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **mark_cacheable_prefix(kwargs))
+    return wrapper
+
+
+def prompt_cache_stats(records=None) -> dict:
+    """
+    Prompt cache hit ratio and estimated latency saved.
+
+    Args:
+        records: Usage records to aggregate (default: every call in this process)
+
+    Returns:
+        dict: Cached input tokens read and written, the share of input tokens
+              read from the cache, calls that read it, and the latency saved
+    """
+    totals = summarize(list(usage_tracker.records) if records is None else records)["totals"]
+    return {
+        "prefix_read_tokens": totals["prefix_read_tokens"],
+        "prefix_write_tokens": totals["prefix_write_tokens"],
+        "prefix_hit_ratio": totals["prefix_hit_ratio"],
+        "prefix_hit_calls": totals["prefix_hit_calls"],
+        "latency_saved": totals["latency_saved"],
+    }
@@ -0,0 +1,260 @@
+"""
+Token-bucket rate limiting and daily quota tracking for search APIs.
+
+When several crews share the same Serper / SerpAPI / Google key they trip the
+providers' rate limits and get 429s back. Every search request now goes
+through send_with_rate_limit(). It does four things:
+
+  * waits for a token from a bucket keyed by (API key, endpoint), so the
+    request rate stays under the provider ceiling,
+  * honours Retry-After on 429/503 responses by pausing the whole bucket,
+    so other threads back off too instead of piling on,
+  * retries with jittered exponential backoff,
+  * counts requests per key and day in a small SQLite file, and refuses to
+    send once a configured daily quota is used up.
+
+Buckets are thread-safe; asyncio code (search_tools.search_many) sends its
+requests from worker threads, so waiting for a token never blocks the loop.
+
+Environment overrides (HOST is the upper-cased domain name, e.g. SERPER for
+google.serper.dev, SERPAPI for serpapi.com, GOOGLEAPIS for Custom Search;
+for an IP address it is the whole address, e.g. 127_0_0_1 for a local stub):
+    RATE_LIMIT_<HOST>_PER_SEC   sustained requests per second (default: 5)
+    RATE_LIMIT_<HOST>_BURST     bucket capacity (default: 10)
+    DAILY_QUOTA_<HOST>          maximum requests per day (default: unlimited)
+    SEARCH_QUOTA_PATH           location of the quota SQLite file
+"""
+
+import datetime
+import email.utils
+import hashlib
+import ipaddress
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+from usefulTools.http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_PER_SEC = 5.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_RETRIES = 4
+RETRY_STATUS_CODES = (429, 503)
+DEFAULT_QUOTA_PATH = os.environ.get(
+    "SEARCH_QUOTA_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "search_quota.sqlite3")
+)
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when a key has used up its configured daily quota."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if one is available; otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds (e.g. Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            # Refill from the end of the pause, not across it
+            self._updated = self._paused_until
+
+
+class QuotaTracker:
+    """Persistent per-day request counter keyed by API key fingerprint and endpoint."""
+
+    def __init__(self, path: str = DEFAULT_QUOTA_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS search_quota (
+                       key TEXT NOT NULL,
+                       day TEXT NOT NULL,
+                       count INTEGER NOT NULL,
+                       PRIMARY KEY (key, day)
+                   )"""
+            )
+            self._conn.commit()
+        return self._conn
+
+    def consume(self, key: str, limit: int = None) -> int:
+        """
+        Count one request against key for today.
+
+        Raises:
+            QuotaExceededError: If the request would go over limit
+        """
+        day = datetime.date.today().isoformat()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT count FROM search_quota WHERE key = ? AND day = ?", (key, day)
+            ).fetchone()
+            used = row[0] if row else 0
+            if limit is not None and used >= limit:
+                raise QuotaExceededError(f"Daily quota of {limit} requests reached for {key}")
+            conn.execute(
+                "INSERT INTO search_quota (key, day, count) VALUES (?, ?, 1) "
+                "ON CONFLICT(key, day) DO UPDATE SET count = count + 1",
+                (key, day)
+            )
+            conn.commit()
+        return used + 1
+
+    def usage(self, day: str = None) -> dict:
+        """Return {key: count} for the given ISO day (default: today)."""
+        day = day or datetime.date.today().isoformat()
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key, count FROM search_quota WHERE day = ?", (day,)
+            ).fetchall()
+        return dict(rows)
+
+
+def _host_setting(url: str) -> str:
+    """Environment name part for a URL's host: the domain name, or the whole IP address."""
+    host = urlparse(url).hostname or ""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        labels = host.split(".")
+        return (labels[-2] if len(labels) >= 2 else labels[0]).upper()
+    return host.replace(".", "_").replace(":", "_").upper()
+
+
+def _env_number(name: str, default, cast=float):
+    value = os.environ.get(name)
+    return cast(value) if value else default
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+quota_tracker = QuotaTracker()
+
+
+def limiter_key(api_key: str, url: str) -> str:
+    """Key identifying one (API key, endpoint) pair without storing the secret."""
+    parsed = urlparse(url)
+    fingerprint = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:12]
+    return f"{parsed.netloc}{parsed.path}#{fingerprint}"
+
+
+def get_bucket(api_key: str, url: str) -> TokenBucket:
+    """Return the shared bucket for an (API key, endpoint) pair."""
+    key = limiter_key(api_key, url)
+    with _buckets_lock:
+        if key not in _buckets:
+            setting = _host_setting(url)
+            _buckets[key] = TokenBucket(
+                rate=_env_number(f"RATE_LIMIT_{setting}_PER_SEC", DEFAULT_RATE_PER_SEC),
+                capacity=_env_number(f"RATE_LIMIT_{setting}_BURST", DEFAULT_BURST)
+            )
+        return _buckets[key]
+
+
+def parse_retry_after(value: str) -> float:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Full-jitter exponential backoff."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def send_with_rate_limit(method: str, url: str, api_key: str = "", max_retries: int = DEFAULT_MAX_RETRIES,
+                         **kwargs):
+    """
+    Send a request through the pooled HTTP client under rate and quota limits.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        api_key: The API key in use; requests are limited per key and endpoint
+        max_retries: Retries on 429/503 responses before giving up
+        **kwargs: Passed through to the HTTP client
+
+    Returns:
+        requests.Response: The final response (which may still be an error)
+
+    Raises:
+        QuotaExceededError: If the daily quota for this key is used up
+    """
+    bucket = get_bucket(api_key, url)
+    key = limiter_key(api_key, url)
+    daily_limit = _env_number(f"DAILY_QUOTA_{_host_setting(url)}", None, int)
+
+    for attempt in range(max_retries + 1):
+        bucket.acquire()
+        try:
+            quota_tracker.consume(key, daily_limit)
+        except sqlite3.Error as e:
+            logger.warning(f"Search quota tracking failed: {e}")
+
+        response = http_client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+            return response
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        delay = retry_after if retry_after is not None else backoff_delay(attempt)
+        # Pause the shared bucket so every caller on this key backs off together
+        bucket.pause(delay)
+        logger.warning(
+            f"{urlparse(url).netloc} returned {response.status_code}; "
+            f"retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})"
+        )
+
+    return response
@@ -0,0 +1,279 @@
+"""
+Disk-backed result cache for the search helpers in usefulTools/search_tools.py.
+
+Our crews re-issue near-identical Serper queries many times per run, so every
+search goes through this cache first. Entries are content-addressed on the
+endpoint, the canonicalized query and the request parameters (num, gl, hl, ...),
+expire after a TTL and are evicted least-recently-used once the store grows
+past its size limit.
+
+Environment overrides:
+    SEARCH_CACHE_PATH         location of the SQLite file
+    SEARCH_CACHE_TTL          time-to-live in seconds (default: one day)
+    SEARCH_CACHE_MAX_ENTRIES  maximum number of cached results
+    SEARCH_CACHE_DISABLED     set to "1" to bypass the cache entirely
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from usefulTools.single_flight import search_flight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "SEARCH_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "search_cache.sqlite3")
+)
+DEFAULT_TTL_SECONDS = int(os.environ.get("SEARCH_CACHE_TTL", 24 * 60 * 60))
+DEFAULT_MAX_ENTRIES = int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", 5000))
+
+
+_QUERY_TOKEN = re.compile(r'"[^"]*"|[()]|[^\s()]+')
+
+
+def _group_terms(tokens: list, position: int = 0, depth: int = 0) -> tuple:
+    """Terms up to the ")" closing this depth: words, OR groups (frozensets) and rendered (...) groups."""
+    terms = []
+    join_next = False
+    while position < len(tokens):
+        token = tokens[position]
+        position += 1
+        if token == ")":
+            if depth:
+                break
+            continue
+        # Google only treats upper-case OR and | as operators
+        if token in ("OR", "|"):
+            join_next = bool(terms)
+            continue
+        if token == "(":
+            inner, position = _group_terms(tokens, position, depth + 1)
+            if not inner:
+                continue
+            rendered = _render_terms(inner)
+            term = rendered if len(inner) == 1 else f"({rendered})"
+        else:
+            term = token.lower()
+        if join_next:
+            previous = terms.pop()
+            group = previous if isinstance(previous, frozenset) else frozenset([previous])
+            terms.append(group | {term})
+            join_next = False
+        else:
+            terms.append(term)
+    return terms, position
+
+
+def _render_terms(terms: list) -> str:
+    sites = sorted(t for t in terms if isinstance(t, str) and t.startswith("site:"))
+    rest = []
+    for term in terms:
+        if isinstance(term, frozenset):
+            rest.append("(" + " OR ".join(sorted(term)) + ")")
+        elif not term.startswith("site:"):
+            rest.append(term)
+    return " ".join(sites + rest)
+
+
+def canonicalize_query(query: str) -> str:
+    """
+    Reduce a search query to a canonical form for cache and single-flight keys.
+
+    Case and whitespace are normalized. site: operators are sorted and moved
+    to the front. The alternatives of each OR clause are sorted, so
+    "site:reddit.com podcast OR radio" and "radio OR  Podcast site:reddit.com"
+    map to the same key. A parenthesized group stays a single term, with its
+    contents canonicalized the same way, so "(a b) OR c" and "a (b OR c)"
+    keep different keys. The rendered groups are bracketed consistently.
+    """
+    terms, _ = _group_terms(_QUERY_TOKEN.findall(str(query)))
+    return _render_terms(terms)
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a query used when building cache keys."""
+    return canonicalize_query(query)
+
+
+def make_cache_key(endpoint: str, query: str, **params) -> str:
+    """
+    Build a stable cache key for a search request.
+
+    Args:
+        endpoint: Logical endpoint name, e.g. "serper/search" or "serper_dev_tool"
+        query: The raw search query
+        **params: Remaining request parameters (num, gl, hl, location, ...).
+                  Parameters set to None or "" are ignored.
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    material = {
+        "endpoint": endpoint,
+        "q": normalize_query(query),
+        "params": {k: v for k, v in sorted(params.items()) if v not in (None, "")},
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class SearchCache:
+    """SQLite-backed key/value store with TTL expiry and LRU eviction."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened on first use so importing search_tools never touches the disk
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS search_cache (
+                       key TEXT PRIMARY KEY,
+                       value TEXT NOT NULL,
+                       created_at REAL NOT NULL,
+                       last_access REAL NOT NULL
+                   )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_access ON search_cache (last_access)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str):
+        """Return the cached value for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, created_at = row
+            if now - created_at > self.ttl:
+                conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                conn.commit()
+                self.misses += 1
+                return None
+            conn.execute("UPDATE search_cache SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value) -> None:
+        """Store a JSON-serializable value and evict the oldest entries if over capacity."""
+        now = time.time()
+        encoded = json.dumps(value)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, encoded, now, now)
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM search_cache WHERE key IN "
+                "(SELECT key FROM search_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def delete(self, *keys: str) -> None:
+        """Remove the entries for the given keys."""
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("DELETE FROM search_cache WHERE key = ?", [(key,) for key in keys])
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM search_cache")
+            conn.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            (count,) = self._connect().execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": count}
+
+
+# Shared cache used by every search helper
+search_cache = SearchCache()
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("SEARCH_CACHE_DISABLED", "0") != "1"
+
+
+def cached_call(endpoint: str, query: str, fetch, cacheable=None, **params):
+    """
+    Return the cached result for a request, calling fetch() on a miss.
+
+    Concurrent misses for the same key are coalesced, so fetch() runs once
+    and every caller receives its result.
+
+    Args:
+        endpoint: Logical endpoint name used in the cache key
+        query: The search query
+        fetch: Zero-argument callable performing the real request. Its result
+               must be JSON-serializable.
+        cacheable: Optional predicate; results for which it returns False are
+                   passed through without being stored
+        **params: Request parameters that distinguish otherwise equal queries
+
+    Returns:
+        The cached or freshly fetched result
+    """
+    key = make_cache_key(endpoint, query, **params)
+    if not cache_enabled():
+        return search_flight.do(key, fetch)
+
+    try:
+        cached = search_cache.get(key)
+    except sqlite3.Error as e:
+        logger.warning(f"Search cache read failed, falling back to live search: {e}")
+        return search_flight.do(key, fetch)
+
+    if cached is not None:
+        logger.debug(f"Search cache hit for {endpoint}: {query}")
+        return cached
+
+    def fetch_and_store():
+        result = fetch()
+        if cacheable is not None and not cacheable(result):
+            return result
+        try:
+            search_cache.set(key, result)
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache write failed: {e}")
+        return result
+
+    # Concurrent identical misses share one network call
+    return search_flight.do(key, fetch_and_store)
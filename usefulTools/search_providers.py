@@ -0,0 +1,249 @@
+"""
+Provider abstraction over our search backends with hedged requests.
+
+The repo talks to four search APIs (Serper, SerpAPI, Tavily and Google Custom
+Search), each in isolation, so one slow or rate-limited provider stalls a
+whole crew. HedgedSearch sends a query to the primary provider and, if no
+answer has arrived after that provider's observed p95 latency, fires the same
+query at the next provider. The first non-empty answer wins. A provider that
+fails outright hands over to the next one immediately.
+
+Every provider returns its hits as SearchResult records (see
+usefulTools/search_results.py) with source set to the provider name.
+"""
+
+import concurrent.futures
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+from usefulTools.search_results import SearchResult, render_results
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEDGE_DELAY = float(os.environ.get("SEARCH_HEDGE_DELAY", 1.5))
+DEFAULT_PROVIDER_ORDER = os.environ.get("SEARCH_PROVIDERS", "serper,serpapi,tavily,google_cse")
+
+
+class SearchProvider:
+    """Base class for a search backend returning normalized results."""
+
+    name = "base"
+    api_key_setting = None
+
+    def __init__(self, latency_window: int = 50):
+        self._latencies = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """Whether the provider has the credentials it needs."""
+        return bool(getattr(config, self.api_key_setting, "")) if self.api_key_setting else True
+
+    def _search(self, query: str, num_results: int) -> list:
+        raise NotImplementedError
+
+    def search(self, query: str, num_results: int = 10) -> list:
+        """Run the query and record how long the provider took."""
+        start = time.perf_counter()
+        try:
+            return self._search(query, num_results)
+        finally:
+            with self._lock:
+                self._latencies.append(time.perf_counter() - start)
+
+    def p95_latency(self, default: float = DEFAULT_HEDGE_DELAY) -> float:
+        """95th percentile of recent latencies, or default before any samples."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < 5:
+            return default
+        return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+    def _normalize(self, title, link, snippet) -> SearchResult:
+        return SearchResult(
+            title=title or "No title",
+            link=link or "No link",
+            snippet=snippet or "No snippet",
+            source=self.name
+        )
+
+
+class SerperProvider(SearchProvider):
+    name = "serper"
+    api_key_setting = "SERPER_API_KEY"
+
+    def _search(self, query, num_results):
+        from usefulTools.search_tools import serper_post
+        data = serper_post({"q": query, "num": num_results})
+        return [
+            self._normalize(item.get("title"), item.get("link"), item.get("snippet"))
+            for item in data.get("organic", [])
+        ]
+
+
+class SerpAPIProvider(SearchProvider):
+    name = "serpapi"
+    api_key_setting = "SERPAPI_API_KEY"
+
+    def _search(self, query, num_results):
+        from usefulTools.search_tools import serpapi_search
+        data = serpapi_search(query, num=num_results)
+        return [
+            self._normalize(item.get("title"), item.get("link"), item.get("snippet"))
+            for item in data.get("organic_results", [])
+        ]
+
+
+class TavilyProvider(SearchProvider):
+    name = "tavily"
+    api_key_setting = "TAVILY_API_KEY"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._client = None
+
+    def available(self) -> bool:
+        try:
+            import tavily  # noqa: F401
+        except ImportError:
+            return False
+        return super().available()
+
+    def _search(self, query, num_results):
+        if self._client is None:
+            from tavily import TavilyClient
+            self._client = TavilyClient(config.TAVILY_API_KEY)
+        response = self._client.search(query=query, max_results=num_results)
+        return [
+            self._normalize(item.get("title"), item.get("url"), item.get("content"))
+            for item in response.get("results", [])
+        ]
+
+
+class GoogleCSEProvider(SearchProvider):
+    name = "google_cse"
+    api_key_setting = "GOOGLE_API_KEY"
+
+    def _search(self, query, num_results):
+        from googleCustomSearch import google_custom_search
+        return [
+            self._normalize(item.get("title"), item.get("link"), item.get("snippet"))
+            for item in google_custom_search(query, num_results=num_results)
+        ]
+
+
+PROVIDER_CLASSES = {
+    "serper": SerperProvider,
+    "serpapi": SerpAPIProvider,
+    "tavily": TavilyProvider,
+    "google_cse": GoogleCSEProvider,
+}
+
+
+class HedgedSearch:
+    """
+    Race an ordered list of providers, hedging after each one's p95 latency.
+
+    Args:
+        providers: Providers in order of preference
+        hedge_delay: Fixed delay before firing the next provider. When None,
+                     the p95 latency of the provider just started is used.
+        max_workers: Size of the thread pool used for in-flight requests
+    """
+
+    def __init__(self, providers, hedge_delay: float = None, max_workers: int = 8):
+        self.providers = list(providers)
+        self.hedge_delay = hedge_delay
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedged-search"
+        )
+
+    def search(self, query: str, num_results: int = 10) -> list:
+        """
+        Return the first non-empty normalized result list from any provider.
+
+        Raises:
+            RuntimeError: If every provider failed or returned nothing
+        """
+        if not self.providers:
+            raise RuntimeError("No search providers configured")
+
+        pending = {}
+        errors = []
+        next_index = 0
+
+        def launch():
+            nonlocal next_index
+            provider = self.providers[next_index]
+            next_index += 1
+            pending[self._executor.submit(provider.search, query, num_results)] = provider
+            return provider
+
+        current = launch()
+        while pending:
+            delay = self.hedge_delay if self.hedge_delay is not None else current.p95_latency()
+            timeout = delay if next_index < len(self.providers) else None
+            done, _ = concurrent.futures.wait(
+                pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+
+            if not done:
+                # Hedge: the outstanding requests are slower than usual
+                current = launch()
+                logger.debug(f"Hedging search '{query}' to {current.name}")
+                continue
+
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    errors.append(f"{provider.name}: {e}")
+                    continue
+                if results:
+                    return results
+                errors.append(f"{provider.name}: no results")
+
+            if not pending and next_index < len(self.providers):
+                current = launch()
+
+        raise RuntimeError(f"All search providers failed: {'; '.join(errors)}")
+
+
+def default_providers(order: str = DEFAULT_PROVIDER_ORDER) -> list:
+    """Instantiate the configured providers that have credentials available."""
+    providers = []
+    for name in order.split(","):
+        provider_class = PROVIDER_CLASSES.get(name.strip())
+        if provider_class is None:
+            continue
+        provider = provider_class()
+        if provider.available():
+            providers.append(provider)
+    return providers
+
+
+_hedged_search = None
+_hedged_search_lock = threading.Lock()
+
+
+def hedged_search(query: str, num_results: int = 10) -> list:
+    """Search using the process-wide HedgedSearch over the default providers."""
+    global _hedged_search
+    with _hedged_search_lock:
+        if _hedged_search is None:
+            _hedged_search = HedgedSearch(default_providers())
+    return _hedged_search.search(query, num_results)
+
+
+def hedged_search_wrapper(query: str) -> str:
+    """Wrapper to handle string input"""
+    try:
+        return render_results(hedged_search(query), empty_message="No results found or error in search.")
+    except Exception as e:
+        return f"An error occurred while searching: {str(e)}"
@@ -0,0 +1,116 @@
+"""
+Typed search result records shared by the search helpers.
+
+Search functions used to build their output by appending "Title: ..." lines
+to a list and joining everything into one string. Code that needed the data
+back had to re-parse that text. The helpers now build SearchResult records.
+Text for an LLM is produced only when needed, either per record with
+render() or for a whole list with render_results(). render_results() can
+also trim snippets to fit a token budget.
+"""
+
+from typing import NamedTuple, Optional
+
+# Rough characters-per-token ratio for English text; good enough for budgeting
+CHARS_PER_TOKEN = 4
+
+
+class SearchResult(NamedTuple):
+    """One search hit. Optional fields are None when not applicable."""
+    title: str
+    link: str
+    snippet: str
+    year: Optional[str] = None
+    citations: Optional[str] = None
+    member_count: Optional[str] = None
+    activity: Optional[str] = None
+    kind: str = "web"
+    source: str = "serper"
+
+    def render(self, snippet: Optional[str] = None) -> str:
+        """
+        Render the record in the layout the agents' prompts expect.
+
+        Args:
+            snippet: Optional replacement snippet (used when truncating)
+        """
+        snippet = self.snippet if snippet is None else snippet
+        if self.kind == "scholar":
+            lines = [
+                f"Title: {self.title}",
+                f"Link: {self.link}",
+                f"Year: {self.year or 'N/A'}",
+                f"Citations: {self.citations or 'N/A'}",
+                f"Snippet: {snippet}",
+            ]
+        elif self.kind == "facebook_group":
+            lines = [
+                f"Group Name: {self.title}",
+                f"Link: {self.link}",
+                f"Members: {self.member_count or 'Unknown'}",
+                f"Activity Level: {self.activity or 'Unknown'}",
+                f"Description: {snippet}",
+            ]
+        else:
+            lines = [
+                f"Title: {self.title}",
+                f"Link: {self.link}",
+                f"Snippet: {snippet}",
+            ]
+        lines.append("---")
+        return "\n".join(lines)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for budgeting rendered output."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def render_results(results, max_tokens: Optional[int] = None, empty_message: str = "No results found.") -> str:
+    """
+    Render a list of SearchResult records for LLM consumption.
+
+    Args:
+        results: Iterable of SearchResult
+        max_tokens: Optional budget for the whole output. Snippets are
+                    shortened evenly so the output fits, and trailing
+                    results are dropped if even empty snippets do not fit.
+        empty_message: Returned when there are no results
+
+    Returns:
+        str: The rendered results
+    """
+    results = list(results)
+    if not results:
+        return empty_message
+
+    if max_tokens is None:
+        return "\n".join(result.render() for result in results)
+
+    budget_chars = max_tokens * CHARS_PER_TOKEN
+    # Cost of each record without its snippet, plus the joining newline
+    skeletons = [len(result.render(snippet="")) + 1 for result in results]
+
+    while results and sum(skeletons) > budget_chars:
+        results.pop()
+        skeletons.pop()
+    if not results:
+        return empty_message
+
+    # Share the remaining characters out, shortest snippets first, so space a
+    # short snippet does not need goes to the longer ones
+    remaining = budget_chars - sum(skeletons)
+    allowance = [0] * len(results)
+    order = sorted(range(len(results)), key=lambda i: len(results[i].snippet))
+    for position, index in enumerate(order):
+        share = remaining // (len(order) - position)
+        allowance[index] = min(len(results[index].snippet), share)
+        remaining -= allowance[index]
+
+    rendered = []
+    for result, limit in zip(results, allowance):
+        snippet = result.snippet
+        if len(snippet) > limit:
+            snippet = snippet[:limit - 3].rstrip() + "..." if limit > 3 else ""
+        rendered.append(result.render(snippet=snippet))
+    return "\n".join(rendered)
@@ -1,5 +1,4 @@
 import os
-from crewai_tools import SerperDevTool
 from langchain_community.utilities import SerpAPIWrapper
 from langchain.tools import Tool
 # from serpapi import GoogleSearch
@@ -11,20 +10,27 @@ import config
 os.environ["SERPER_API_KEY"] = config.SERPER_API_KEY
 os.environ["SERPAPI_API_KEY"] = getattr(config, 'SERPAPI_API_KEY', '')  # Fallback for existing code
 
+import asyncio
+import concurrent.futures
+import functools
+import importlib.util
+import json
 import logging
-import requests
+import threading
+from pydantic import BaseModel, Field
 from typing import Optional
+from usefulTools.search_cache import cached_call
+from usefulTools.rate_limiter import send_with_rate_limit
+from usefulTools.search_providers import hedged_search_wrapper
+from usefulTools.search_results import SearchResult, render_results
+from usefulTools.snippet_extractors import extract_many
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# Try to import CrewAI SerperDevTool for enhanced functionality
-try:
-    from crewai_tools import SerperDevTool
-    CREWAI_AVAILABLE = True
-except ImportError:
-    CREWAI_AVAILABLE = False
+# CrewAI tools are slow to import, so only check that they are installed here;
+# the tool classes that need them are built on first use
+CREWAI_AVAILABLE = importlib.util.find_spec("crewai_tools") is not None
+if not CREWAI_AVAILABLE:
     print("CrewAI tools not available. Using basic Serper integration.")
 
 # Try to import LangChain GoogleSerperAPIWrapper
@@ -60,19 +66,9 @@ def parse_youtube_results(json_data):
 #     description="Useful for searching YouTube for video content related to the topic. Returns parsed results including title, link, channel info, views, and publish date."
 # )
 
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger(__name__)
-
 SERPAPI_API_KEY = os.environ.get("SERPAPI_API_KEY")
 
 
-import os
-import requests
-from langchain.tools import Tool
-from pydantic import BaseModel, Field
-from typing import Optional
-
-
 # Define input schemas
 class SerperSearchInput(BaseModel):
     """Input schema for the Internet Search tool."""
@@ -83,111 +79,102 @@ class SerperScholarInput(BaseModel):
     query: str = Field(..., description="The academic search query to execute")
     num_results: Optional[int] = Field(default=20, description="Number of results to return")
 
-def serper_search(query: str) -> str:
-    try:
-        url = "https://google.serper.dev/search"
-        payload = {
-            "q": query
-        }
+# Set SERPER_BASE_URL to point every Serper call at a stand-in such as
+# usefulTools/serper_stub_server.py for offline benchmarking
+SERPER_BASE_URL = os.environ.get("SERPER_BASE_URL", "https://google.serper.dev").rstrip("/")
+SERPER_SEARCH_URL = f"{SERPER_BASE_URL}/search"
+
+def serper_post(payload: dict, url: str = SERPER_SEARCH_URL) -> dict:
+    """
+    POST a query to Serper and return the decoded JSON response.
+
+    Responses are served from the shared search cache when an equivalent
+    request (same normalized query, num, gl, hl and endpoint) was seen recently.
+    """
+    params = {k: v for k, v in payload.items() if k != "q"}
+
+    def fetch():
         headers = {
             'X-API-KEY': config.SERPER_API_KEY,
             'Content-Type': 'application/json'
         }
-        
-        response = requests.post(url, headers=headers, json=payload)
+        response = send_with_rate_limit("POST", url, config.SERPER_API_KEY, headers=headers, json=payload)
         response.raise_for_status()
-        data = response.json()
-        
-        # Process and format the results
-        formatted_results = []
-        
-        # Handle organic results
-        for item in data.get('organic', []):
-            formatted_results.append(f"Title: {item.get('title', 'No title')}")
-            formatted_results.append(f"Link: {item.get('link', 'No link')}")
-            formatted_results.append(f"Snippet: {item.get('snippet', 'No snippet')}")
-            formatted_results.append("---")
-        
-        if not formatted_results:
-            return "No results found or error in search."
-            
-        return "\n".join(formatted_results)
-        
+        return response.json()
+
+    return cached_call(url, payload.get("q", ""), fetch, **params)
+
+SERPAPI_SEARCH_URL = "https://serpapi.com/search.json"
+
+def serpapi_search(query: str, engine: str = "google", **params) -> dict:
+    """
+    Run a SerpAPI query over the pooled HTTP client and return the raw JSON.
+
+    Extra keyword arguments (num, gl, hl, location, ...) are passed through
+    as SerpAPI request parameters.
+    """
+    request_params = {"engine": engine, **params}
+
+    def fetch():
+        response = send_with_rate_limit(
+            "GET",
+            SERPAPI_SEARCH_URL,
+            SERPAPI_API_KEY,
+            params={"q": query, "api_key": SERPAPI_API_KEY, **request_params}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    return cached_call(SERPAPI_SEARCH_URL, query, fetch, **request_params)
+
+def serper_search_results(query: str, **params) -> list:
+    """Run a web search and return the organic hits as SearchResult records."""
+    data = serper_post({"q": query, **params})
+    return [
+        SearchResult(
+            title=item.get('title', 'No title'),
+            link=item.get('link', 'No link'),
+            snippet=item.get('snippet', 'No snippet')
+        )
+        for item in data.get('organic', [])
+    ]
+
+def serper_search(query: str, max_tokens: Optional[int] = None) -> str:
+    try:
+        return render_results(
+            serper_search_results(query),
+            max_tokens=max_tokens,
+            empty_message="No results found or error in search."
+        )
     except Exception as e:
         return f"An error occurred while searching: {str(e)}"
 
-def serper_scholar_search(query: str, num_results: int = 20) -> str:
+def serper_scholar_results(query: str, num_results: int = 20) -> list:
+    """Run a scholarly search and return SearchResult records with year and citations."""
+    # Modify the query to target scholarly content
+    scholarly_query = f"{query} site:scholar.google.com"
+    data = serper_post({"q": scholarly_query, "num": num_results})
+
+    items = data.get('organic', [])
+    return [
+        SearchResult(
+            title=item.get('title', 'No title'),
+            link=item.get('link', 'No link'),
+            snippet=item.get('snippet', 'No snippet'),
+            year=fields.year,
+            citations=fields.citations,
+            kind="scholar"
+        )
+        for item, fields in zip(items, extract_many(items))
+    ]
+
+def serper_scholar_search(query: str, num_results: int = 20, max_tokens: Optional[int] = None) -> str:
     try:
-        # Modify the query to target scholarly content
-        scholarly_query = f"{query} site:scholar.google.com"
-        
-        url = "https://google.serper.dev/search"
-        payload = {
-            "q": scholarly_query,
-            "num": num_results
-        }
-        headers = {
-            'X-API-KEY': config.SERPER_API_KEY,
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Process and format the results
-        formatted_results = []
-        
-        # Handle organic results
-        for item in data.get('organic', []):
-            title = item.get('title', 'No title')
-            link = item.get('link', 'No link')
-            snippet = item.get('snippet', 'No snippet')
-            
-            # Extract year and citations from the title and snippet
-            year = "N/A"
-            citations = "N/A"
-            
-            # Look for year in title and snippet
-            for text in [title, snippet]:
-                if not year or year == "N/A":
-                    words = text.split()
-                    for word in words:
-                        # Clean the word from any punctuation
-                        clean_word = ''.join(c for c in word if c.isdigit())
-                        if clean_word.isdigit() and 1900 < int(clean_word) < 2025:
-                            year = clean_word
-                            break
-            
-            # Look for citations in snippet
-            snippet_lower = snippet.lower()
-            citation_patterns = ['cited by', 'citations:', 'citations -']
-            for pattern in citation_patterns:
-                if pattern in snippet_lower:
-                    try:
-                        pattern_index = snippet_lower.index(pattern)
-                        # Look at the next few words for a number
-                        following_text = snippet[pattern_index:pattern_index + 30].split()
-                        for word in following_text:
-                            clean_word = ''.join(c for c in word if c.isdigit())
-                            if clean_word.isdigit():
-                                citations = clean_word
-                                break
-                    except:
-                        continue
-            
-            formatted_results.append(f"Title: {title}")
-            formatted_results.append(f"Link: {link}")
-            formatted_results.append(f"Year: {year}")
-            formatted_results.append(f"Citations: {citations}")
-            formatted_results.append(f"Snippet: {snippet}")
-            formatted_results.append("---")
-        
-        if not formatted_results:
-            return "No scholarly results found or error in search."
-            
-        return "\n".join(formatted_results)
-        
+        return render_results(
+            serper_scholar_results(query, num_results),
+            max_tokens=max_tokens,
+            empty_message="No scholarly results found or error in search."
+        )
     except Exception as e:
         return f"An error occurred while searching scholar: {str(e)}"
 
@@ -214,16 +201,68 @@ serper_scholar_tool = Tool(
     description="Search for academic papers and scholarly content using Serper API."
 )
 
+hedged_search_tool = Tool(
+    name="Resilient Internet Search",
+    func=hedged_search_wrapper,
+    description=(
+        "Search the internet using the fastest available provider "
+        "(Serper, SerpAPI, Tavily or Google Custom Search)."
+    )
+)
+
 # =============================================================================
 # CREWAI SERPERDEVTOOL INTEGRATION
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
+def cached_serper_dev_tool_class():
+    """Define CachedSerperDevTool on first use, importing crewai_tools only then."""
+    from crewai_tools import SerperDevTool
+
+    class CachedSerperDevTool(SerperDevTool):
+        """
+        SerperDevTool that sends its queries through serper_post, so results are
+        shared with the search cache and reuse the pooled HTTP connections.
+        """
+
+        def _run(self, **kwargs) -> str:
+            query = kwargs.get('search_query') or kwargs.get('query') or ""
+            n_results = kwargs.get('n_results', self.n_results)
+            payload = {"q": query, "num": n_results}
+            if self.country:
+                payload["gl"] = self.country
+            if self.location:
+                payload["location"] = self.location
+            if self.locale:
+                payload["hl"] = self.locale
+
+            try:
+                data = serper_post(payload)
+            except Exception as e:
+                return f"An error occurred while searching: {str(e)}"
+
+            results = []
+            for item in data.get('organic', [])[:n_results]:
+                try:
+                    results.append("\n".join([
+                        f"Title: {item['title']}",
+                        f"Link: {item['link']}",
+                        f"Snippet: {item['snippet']}",
+                        "---"
+                    ]))
+                except KeyError:
+                    continue
+            content = "\n".join(results)
+            return f"\nSearch results: {content}\n"
+
+    return CachedSerperDevTool
+
 def create_serper_dev_tool(
     n_results: int = 10,
     country: str = "us", 
     locale: str = "en",
     location: str = None
-) -> SerperDevTool:
+) -> "SerperDevTool":
     """
     Create a SerperDevTool with custom parameters.
     
@@ -234,7 +273,7 @@ def create_serper_dev_tool(
         location: Specific location for results (optional)
     
     Returns:
-        SerperDevTool: Configured search tool
+        SerperDevTool: Configured search tool backed by the shared search cache
     """
     tool_params = {
         "n_results": n_results,
@@ -245,89 +284,25 @@ def create_serper_dev_tool(
     if location:
         tool_params["location"] = location
     
-    return SerperDevTool(**tool_params)
-
-# Create default SerperDevTool instances
-serper_dev_tool = create_serper_dev_tool()
-
-# Create specialized versions for Facebook group research
-facebook_serper_tool = create_serper_dev_tool(
-    n_results=15,
-    country="us",
-    locale="en"
-)
-
-# Create location-specific tools
-us_serper_tool = create_serper_dev_tool(
-    n_results=10,
-    country="us",
-    locale="en",
-    location="United States"
-)
-
-uk_serper_tool = create_serper_dev_tool(
-    n_results=10,
-    country="gb",
-    locale="en",
-    location="United Kingdom"
-)
-
-canada_serper_tool = create_serper_dev_tool(
-    n_results=10,
-    country="ca",
-    locale="en", 
-    location="Canada"
-)
-
-australia_serper_tool = create_serper_dev_tool(
-    n_results=10,
-    country="au",
-    locale="en",
-    location="Australia"
-)
+    return cached_serper_dev_tool_class()(**tool_params)
 
 # =============================================================================
-# LEGACY TOOLS (kept for backward compatibility)
+# LAZILY CONSTRUCTED TOOL REGISTRY
 # =============================================================================
-
-# Method 1: CrewAI SerperDevTool (Enhanced for Facebook Group Research)
-if CREWAI_AVAILABLE:
-    # General search tool for podcasting and broadcasting groups
-    facebook_group_search_tool = SerperDevTool(
-        n_results=10,
-        country="us",
-        locale="en",
-        location="United States"
-    )
-    
-    # Specialized search for international communities
-    international_search_tool = SerperDevTool(
-        n_results=15,
-        country="",  # No country restriction for global results
-        locale="en"
-    )
-    
-    # Business-focused search tool
-    business_search_tool = SerperDevTool(
-        n_results=12,
-        country="us",
-        locale="en",
-        location="New York"
-    )
-else:
-    # Fallback to basic serper search if CrewAI tools not available
-    facebook_group_search_tool = serper_search_tool
-    international_search_tool = serper_search_tool
-    business_search_tool = serper_search_tool
+# Building a SerperDevTool or a GoogleSerperAPIWrapper-backed tool is not free,
+# and most scripts only use one or two of them. The tools below are created on
+# first access, either through get_tool() or as a plain module attribute:
+#     from usefulTools.search_tools import us_serper_tool
 
 # Method 2: LangChain Integration for Custom Search
-if LANGCHAIN_SERPER_AVAILABLE:
+@functools.lru_cache(maxsize=None)
+def community_search_tool_classes():
+    """Define the Facebook group and podcast community tools on first use."""
     try:
         from crewai_tools import BaseTool
     except ImportError:
         from langchain.tools import BaseTool
-    from pydantic import Field
-    
+
     class FacebookGroupSearchTool(BaseTool):
         name: str = "Facebook Group Search"
         description: str = "Specialized search for Facebook groups related to podcasting and broadcasting"
@@ -354,86 +329,134 @@ if LANGCHAIN_SERPER_AVAILABLE:
             except Exception as e:
                 return f"Error performing community search: {str(e)}"
 
-    # Create instances of custom tools
-    facebook_group_finder = FacebookGroupSearchTool()
-    podcast_community_finder = PodcastCommunitySearchTool()
+    return FacebookGroupSearchTool, PodcastCommunitySearchTool
+
+_TOOL_FACTORIES = {
+    # Default SerperDevTool
+    "serper_dev_tool": lambda: create_serper_dev_tool(),
+
+    # Specialized version for Facebook group research
+    "facebook_serper_tool": lambda: create_serper_dev_tool(n_results=15, country="us", locale="en"),
+
+    # Location-specific tools
+    "us_serper_tool": lambda: create_serper_dev_tool(
+        n_results=10, country="us", locale="en", location="United States"
+    ),
+    "uk_serper_tool": lambda: create_serper_dev_tool(
+        n_results=10, country="gb", locale="en", location="United Kingdom"
+    ),
+    "canada_serper_tool": lambda: create_serper_dev_tool(
+        n_results=10, country="ca", locale="en", location="Canada"
+    ),
+    "australia_serper_tool": lambda: create_serper_dev_tool(
+        n_results=10, country="au", locale="en", location="Australia"
+    ),
+}
+
+# =============================================================================
+# LEGACY TOOLS (kept for backward compatibility)
+# =============================================================================
+
+# Method 1: CrewAI SerperDevTool (Enhanced for Facebook Group Research)
+if CREWAI_AVAILABLE:
+    _TOOL_FACTORIES.update({
+        # General search tool for podcasting and broadcasting groups
+        "facebook_group_search_tool": lambda: cached_serper_dev_tool_class()(
+            n_results=10, country="us", locale="en", location="United States"
+        ),
+        # Specialized search for international communities
+        "international_search_tool": lambda: cached_serper_dev_tool_class()(
+            n_results=15,
+            country="",  # No country restriction for global results
+            locale="en"
+        ),
+        # Business-focused search tool
+        "business_search_tool": lambda: cached_serper_dev_tool_class()(
+            n_results=12, country="us", locale="en", location="New York"
+        ),
+    })
+else:
+    # Fallback to basic serper search if CrewAI tools not available
+    _TOOL_FACTORIES.update({
+        "facebook_group_search_tool": lambda: serper_search_tool,
+        "international_search_tool": lambda: serper_search_tool,
+        "business_search_tool": lambda: serper_search_tool,
+    })
+
+if LANGCHAIN_SERPER_AVAILABLE:
+    _TOOL_FACTORIES.update({
+        "facebook_group_finder": lambda: community_search_tool_classes()[0](),
+        "podcast_community_finder": lambda: community_search_tool_classes()[1](),
+    })
 else:
     # Fallback implementations
-    facebook_group_finder = serper_search_tool
-    podcast_community_finder = serper_search_tool
+    _TOOL_FACTORIES.update({
+        "facebook_group_finder": lambda: serper_search_tool,
+        "podcast_community_finder": lambda: serper_search_tool,
+    })
+
+# Export the main search tool (this will be used in facebookGroupFinder.py)
+_TOOL_FACTORIES["search_tool"] = lambda: get_tool("facebook_group_search_tool")
+
+_tools = {}
+_tools_lock = threading.RLock()
+
+def get_tool(name: str):
+    """Return the named search tool, building it on first use."""
+    with _tools_lock:
+        if name not in _tools:
+            if name not in _TOOL_FACTORIES:
+                raise KeyError(f"Unknown search tool: {name}")
+            _tools[name] = _TOOL_FACTORIES[name]()
+        return _tools[name]
+
+def __getattr__(name: str):
+    if name in _TOOL_FACTORIES:
+        return get_tool(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_TOOL_FACTORIES))
+
+def facebook_group_results(query: str, num_results: int = 15, country: str = "us") -> list:
+    """Search for Facebook groups and return SearchResult records with member and activity estimates."""
+    # Enhance the query for Facebook group discovery
+    enhanced_query = f"site:facebook.com/groups {query} podcast OR broadcasting OR content OR media"
+
+    payload = {
+        "q": enhanced_query,
+        "num": num_results,
+        "gl": country,  # Geographic location
+        "hl": "en"      # Language
+    }
+    data = serper_post(payload)
+
+    items = data.get('organic', [])
+    return [
+        SearchResult(
+            title=item.get('title', 'No title'),
+            link=item.get('link', 'No link'),
+            snippet=item.get('snippet', 'No snippet'),
+            member_count=fields.member_count,
+            activity=fields.activity,
+            kind="facebook_group"
+        )
+        for item, fields in zip(items, extract_many(items))
+    ]
 
 # Enhanced Serper search specifically for Facebook groups
-def facebook_group_search(query: str, num_results: int = 15, country: str = "us") -> str:
+def facebook_group_search(query: str, num_results: int = 15, country: str = "us",
+                          max_tokens: Optional[int] = None) -> str:
     """
     Enhanced search function specifically designed for finding Facebook groups
     related to podcasting and broadcasting.
     """
     try:
-        url = "https://google.serper.dev/search"
-        
-        # Enhance the query for Facebook group discovery
-        enhanced_query = f"site:facebook.com/groups {query} podcast OR broadcasting OR content OR media"
-        
-        payload = {
-            "q": enhanced_query,
-            "num": num_results,
-            "gl": country,  # Geographic location
-            "hl": "en"      # Language
-        }
-        headers = {
-            'X-API-KEY': config.SERPER_API_KEY,
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Process and format the results specifically for Facebook groups
-        formatted_results = []
-        
-        for item in data.get('organic', []):
-            title = item.get('title', 'No title')
-            link = item.get('link', 'No link')
-            snippet = item.get('snippet', 'No snippet')
-            
-            # Extract potential member count from snippet
-            member_count = "Unknown"
-            snippet_lower = snippet.lower()
-            
-            # Look for member indicators
-            member_patterns = ['members', 'member', 'people']
-            for pattern in member_patterns:
-                if pattern in snippet_lower:
-                    words = snippet.split()
-                    for i, word in enumerate(words):
-                        if pattern in word.lower() and i > 0:
-                            # Look for number before the pattern
-                            prev_word = words[i-1].replace(',', '').replace('.', '')
-                            if prev_word.replace('k', '').replace('K', '').isdigit():
-                                member_count = prev_word
-                                break
-            
-            # Determine if it's likely an active group
-            activity_indicators = ['active', 'daily', 'weekly', 'recent', 'new posts', 'discussion']
-            activity_level = "Unknown"
-            for indicator in activity_indicators:
-                if indicator in snippet_lower:
-                    activity_level = "Active"
-                    break
-            
-            formatted_results.append(f"Group Name: {title}")
-            formatted_results.append(f"Link: {link}")
-            formatted_results.append(f"Members: {member_count}")
-            formatted_results.append(f"Activity Level: {activity_level}")
-            formatted_results.append(f"Description: {snippet}")
-            formatted_results.append("---")
-        
-        if not formatted_results:
-            return "No Facebook groups found for the given query."
-            
-        return "\n".join(formatted_results)
-        
+        return render_results(
+            facebook_group_results(query, num_results, country),
+            max_tokens=max_tokens,
+            empty_message="No Facebook groups found for the given query."
+        )
     except Exception as e:
         return f"An error occurred while searching for Facebook groups: {str(e)}"
 
@@ -442,8 +465,109 @@ def facebook_group_wrapper(query: str) -> str:
     """Wrapper for Facebook group search"""
     return facebook_group_search(query)
 
-# Export the main search tool (this will be used in facebookGroupFinder.py)
-search_tool = facebook_group_search_tool if CREWAI_AVAILABLE else serper_search_tool
+# =============================================================================
+# BATCHED MULTI-QUERY SEARCH
+# =============================================================================
+
+DEFAULT_SEARCH_CONCURRENCY = 8
+
+async def gather_calls(calls, max_concurrency: int = DEFAULT_SEARCH_CONCURRENCY) -> list:
+    """
+    Run blocking zero-argument callables concurrently in worker threads.
+
+    At most max_concurrency calls run at once; results are returned in the
+    same order as calls.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(call):
+        async with semaphore:
+            return await asyncio.to_thread(call)
+
+    return await asyncio.gather(*(run_one(call) for call in calls))
+
+def run_coroutine(coro):
+    """Run a coroutine to completion from synchronous code, even inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Already inside an event loop (e.g. FastAPI, Jupyter): run on a helper thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+async def search_many(queries, search_fn=serper_search, max_concurrency: int = DEFAULT_SEARCH_CONCURRENCY) -> list:
+    """
+    Run several searches concurrently and return their results in input order.
+
+    Args:
+        queries: Iterable of query strings, or dicts of keyword arguments for
+                 search_fn (e.g. {"query": "...", "country": "gb"})
+        search_fn: Blocking search function to call for each query
+        max_concurrency: Maximum number of searches in flight at once
+
+    Returns:
+        list: One result per query, in the same order as queries
+
+    Example:
+        results = asyncio.run(search_many(
+            [{"query": focus, "country": c} for c in ("us", "gb", "ca", "au")],
+            search_fn=facebook_group_search
+        ))
+    """
+    calls = [
+        functools.partial(search_fn, **query) if isinstance(query, dict) else functools.partial(search_fn, query)
+        for query in queries
+    ]
+    return await gather_calls(calls, max_concurrency)
+
+def search_many_sync(queries, search_fn=serper_search, max_concurrency: int = DEFAULT_SEARCH_CONCURRENCY) -> list:
+    """Blocking counterpart of search_many for scripts and CrewAI tools."""
+    return run_coroutine(search_many(queries, search_fn, max_concurrency))
+
+def multi_region_search(query: str, tools=None, max_concurrency: int = DEFAULT_SEARCH_CONCURRENCY) -> list:
+    """
+    Send one query to several location-specific SerperDevTools at once.
+
+    Defaults to the US, UK, Canada and Australia tools; returns one result
+    string per tool, in the same order.
+    """
+    tools = tools or [
+        get_tool(name) for name in ("us_serper_tool", "uk_serper_tool", "canada_serper_tool", "australia_serper_tool")
+    ]
+    calls = [functools.partial(tool._run, search_query=query) for tool in tools]
+    return run_coroutine(gather_calls(calls, max_concurrency))
+
+def parse_query_list(queries) -> list:
+    """Accept a list, a JSON array string, or newline-separated queries."""
+    if isinstance(queries, (list, tuple)):
+        return [str(q).strip() for q in queries if str(q).strip()]
+    text = str(queries).strip()
+    if text.startswith("["):
+        try:
+            return [str(q).strip() for q in json.loads(text) if str(q).strip()]
+        except json.JSONDecodeError:
+            pass
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+def multi_search_wrapper(queries) -> str:
+    """Wrapper that runs a list of queries concurrently and joins the results"""
+    query_list = parse_query_list(queries)
+    if not query_list:
+        return "No queries provided."
+    results = search_many_sync(query_list)
+    return "\n\n".join(
+        f"=== Results for: {query} ===\n{result}" for query, result in zip(query_list, results)
+    )
+
+multi_search_tool = Tool(
+    name="Multi Search",
+    func=multi_search_wrapper,
+    description=(
+        "Run several internet searches at once using Serper API. "
+        "Input is a list of queries, either as a JSON array or one query per line."
+    )
+)
 
 # Additional tools for specialized searches
 youtube_tool = serper_search_tool  # Placeholder for YouTube search
@@ -0,0 +1,141 @@
+"""
+Semantic tier for the LLM response cache.
+
+Some prompts differ only in whitespace, in the order of guest details or in
+small template edits. The exact cache in usefulTools/llm_cache.py misses
+these. This tier embeds the prompt text with a small CPU embedding model and
+keeps the vectors in the local Chroma store (db/chroma.sqlite3). If a new
+prompt is at least as similar as the configured threshold to one already
+answered with the same model and parameters, the earlier answer is served.
+
+The tier is optional and only used at call sites that opt in:
+    cached_messages_create(client, semantic=True, ...)
+    get_llm("ClaudeSonnet", semantic_cache=True)
+Keep it to low-stakes prompts where a near-duplicate answer is acceptable.
+The embedding model only reads the first ~256 tokens of the prompt, so it is
+no use for prompts that start with a long fixed template (CrewAI agent and
+task prompts, say) and differ only further down: those all look identical.
+
+Vectors only point at entries in the exact cache. When an exact entry
+expires or is evicted, the semantic match simply misses.
+
+Environment overrides:
+    LLM_SEMANTIC_CACHE            set to "1" to enable the tier (default: off)
+    LLM_SEMANTIC_CACHE_THRESHOLD  minimum cosine similarity for a hit (default: 0.95)
+    LLM_SEMANTIC_CACHE_MODEL      sentence-transformers model (default: all-MiniLM-L6-v2)
+    LLM_SEMANTIC_CACHE_PATH       Chroma persistence directory (default: db/)
+"""
+
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+try:
+    import chromadb
+    from chromadb.utils import embedding_functions
+    CHROMADB_AVAILABLE = True
+except ImportError:
+    CHROMADB_AVAILABLE = False
+
+DEFAULT_SEMANTIC_CACHE_PATH = os.environ.get(
+    "LLM_SEMANTIC_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db")
+)
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("LLM_SEMANTIC_CACHE_THRESHOLD", 0.95))
+DEFAULT_SEMANTIC_CACHE_MODEL = os.environ.get("LLM_SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+COLLECTION_NAME = "llm_semantic_cache"
+
+
+def semantic_cache_enabled() -> bool:
+    return CHROMADB_AVAILABLE and os.environ.get("LLM_SEMANTIC_CACHE", "0") == "1"
+
+
+def _embedding_function(model_name: str):
+    try:
+        return embedding_functions.SentenceTransformerEmbeddingFunction(model_name=model_name, device="cpu")
+    except (ImportError, ValueError):
+        # Chroma's bundled ONNX MiniLM model also runs on CPU
+        logger.info("sentence-transformers not installed; using Chroma's default embedding model")
+        return embedding_functions.DefaultEmbeddingFunction()
+
+
+class SemanticLLMCache:
+    """Nearest-neighbour index from prompt embeddings to exact-cache keys."""
+
+    def __init__(self, path: str = DEFAULT_SEMANTIC_CACHE_PATH, threshold: float = DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+                 model_name: str = DEFAULT_SEMANTIC_CACHE_MODEL, collection_name: str = COLLECTION_NAME):
+        self.path = path
+        self.threshold = threshold
+        self.model_name = model_name
+        self.collection_name = collection_name
+        self._collection = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_collection(self):
+        with self._lock:
+            if self._collection is None:
+                client = chromadb.PersistentClient(path=self.path)
+                self._collection = client.get_or_create_collection(
+                    name=self.collection_name,
+                    embedding_function=_embedding_function(self.model_name),
+                    metadata={"hnsw:space": "cosine"}
+                )
+            return self._collection
+
+    def lookup(self, prompt: str, namespace: str):
+        """
+        Find the exact-cache key of the closest earlier prompt.
+
+        Args:
+            prompt: Prompt text to embed
+            namespace: Model and parameter fingerprint; only prompts sent with
+                       identical settings are considered
+
+        Returns:
+            str or None: The exact-cache key, if similarity >= threshold
+        """
+        collection = self._get_collection()
+        result = collection.query(query_texts=[prompt], n_results=1, where={"namespace": namespace})
+        distances = result.get("distances") or [[]]
+        metadatas = result.get("metadatas") or [[]]
+        if distances[0] and 1.0 - distances[0][0] >= self.threshold:
+            self.hits += 1
+            logger.debug(f"Semantic LLM cache hit (similarity {1.0 - distances[0][0]:.3f})")
+            return metadatas[0][0]["key"]
+        self.misses += 1
+        return None
+
+    def add(self, prompt: str, namespace: str, key: str) -> None:
+        """Index a prompt whose response is stored under key in the exact cache."""
+        self._get_collection().upsert(
+            ids=[key],
+            documents=[prompt],
+            metadatas=[{"namespace": namespace, "key": key, "created_at": time.time()}]
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            chromadb.PersistentClient(path=self.path).delete_collection(self.collection_name)
+            self._collection = None
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hits / total if total else 0.0}
+
+
+_semantic_cache = None
+_semantic_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> SemanticLLMCache:
+    """Shared SemanticLLMCache, created on first use."""
+    global _semantic_cache
+    with _semantic_cache_lock:
+        if _semantic_cache is None:
+            _semantic_cache = SemanticLLMCache()
+        return _semantic_cache
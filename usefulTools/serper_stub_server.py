@@ -0,0 +1,229 @@
+"""
+Local stand-in for google.serper.dev used for offline benchmarking.
+
+Serves the Serper /search contract from a recorded fixture corpus, so
+search-heavy crews can be benchmarked and load-tested without API credits or
+network access. Latency and failures are configurable and seeded, so runs
+are repeatable.
+
+Point the search helpers at it by setting SERPER_BASE_URL before importing
+usefulTools.search_tools:
+
+    python usefulTools/serper_stub_server.py --port 8765 --latency lognormal:0.4:0.5
+    SERPER_BASE_URL=http://127.0.0.1:8765 python podcastPersonalityFinder/facebookGroupFinder.py
+
+Fixture corpus format (JSON):
+    {
+        "queries": {"<query>": {<recorded Serper response>}, ...},
+        "default": {<response used for unknown queries>}     (optional)
+    }
+Queries are matched on their canonical form (see search_cache.canonicalize_query).
+Unknown queries get "default" if present, otherwise a deterministic
+synthetic response derived from the query text.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from usefulTools.search_cache import canonicalize_query
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "serper_search_fixtures.json")
+
+
+class LatencyModel:
+    """
+    Seeded latency distribution.
+
+    Spec strings:
+        "0"                     no added latency
+        "0.2"                   constant 200 ms
+        "uniform:0.1:0.5"       uniform between 100 and 500 ms
+        "lognormal:0.3:0.6"     lognormal with median 300 ms and sigma 0.6
+    """
+
+    def __init__(self, spec: str = "0", seed: int = 0):
+        self.spec = spec
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        parts = spec.split(":")
+        self.kind = parts[0] if len(parts) > 1 else "constant"
+        self.args = [float(p) for p in (parts[1:] if len(parts) > 1 else parts)]
+
+    def sample(self) -> float:
+        with self._lock:
+            if self.kind == "uniform":
+                return self._rng.uniform(self.args[0], self.args[1])
+            if self.kind == "lognormal":
+                return self._rng.lognormvariate(math.log(self.args[0]), self.args[1])
+            return self.args[0]
+
+
+class FaultInjector:
+    """Return injected error statuses at a given rate, reproducibly."""
+
+    def __init__(self, error_rate: float = 0.0, statuses=(429, 500), retry_after: float = 1.0, seed: int = 0):
+        self.error_rate = error_rate
+        self.statuses = tuple(statuses)
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def pick(self):
+        """Return an error status to send, or None to answer normally."""
+        with self._lock:
+            if self.error_rate and self._rng.random() < self.error_rate:
+                return self._rng.choice(self.statuses)
+        return None
+
+
+class FixtureCorpus:
+    """Recorded Serper responses looked up by canonical query."""
+
+    def __init__(self, path: str = None):
+        self.queries = {}
+        self.default = None
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.queries = {canonicalize_query(q): r for q, r in data.get("queries", {}).items()}
+            self.default = data.get("default")
+
+    def lookup(self, query: str, num: int = 10) -> dict:
+        response = self.queries.get(canonicalize_query(query))
+        if response is None:
+            response = self.default if self.default is not None else self._synthesize(query, num)
+        return response
+
+    @staticmethod
+    def _synthesize(query: str, num: int) -> dict:
+        digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        organic = []
+        for position in range(1, num + 1):
+            token = digest[(position * 4) % len(digest):][:8] or digest[:8]
+            organic.append({
+                "title": f"{query} - result {position}",
+                "link": f"https://example.com/{token}/{position}",
+                "snippet": f"Synthetic snippet {position} for '{query}'. {int(token, 16) % 5000} members, active daily.",
+                "position": position,
+            })
+        return {"searchParameters": {"q": query, "num": num}, "organic": organic}
+
+
+def parse_search_payload(payload) -> tuple:
+    """(query, num, None) for a valid /search body, else (None, None, error message)."""
+    if not isinstance(payload, dict):
+        return None, None, "Request body must be a JSON object"
+    query = payload.get("q", "")
+    if not isinstance(query, str):
+        return None, None, "q must be a string"
+    num = payload.get("num", 10)
+    if isinstance(num, bool):
+        return None, None, "num must be an integer"
+    try:
+        num = int(num)
+    except (TypeError, ValueError):
+        return None, None, "num must be an integer"
+    if not 1 <= num <= 100:
+        return None, None, "num must be between 1 and 100"
+    return query, num, None
+
+
+def make_handler(corpus: FixtureCorpus, latency: LatencyModel, faults: FaultInjector):
+    class SerperStubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status: int, body: dict, headers: dict = None):
+            encoded = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def do_POST(self):
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+            except ValueError:
+                self._send_json(400, {"message": "Invalid Content-Length", "statusCode": 400})
+                return
+            raw = self.rfile.read(length) if length > 0 else b"{}"
+
+            if self.path.rstrip("/") != "/search":
+                self._send_json(404, {"message": "Not found"})
+                return
+            if not self.headers.get("X-API-KEY"):
+                self._send_json(403, {"message": "Unauthorized."})
+                return
+            try:
+                payload = json.loads(raw or b"{}")
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self._send_json(400, {"message": "Invalid JSON body", "statusCode": 400})
+                return
+            query, num, problem = parse_search_payload(payload)
+            if problem:
+                self._send_json(400, {"message": problem, "statusCode": 400})
+                return
+
+            time.sleep(latency.sample())
+
+            status = faults.pick()
+            if status is not None:
+                headers = {"Retry-After": str(faults.retry_after)} if status == 429 else None
+                self._send_json(status, {"message": "Injected error", "statusCode": status}, headers)
+                return
+
+            response = dict(corpus.lookup(query, num))
+            response["organic"] = response.get("organic", [])[:num]
+            self._send_json(200, response)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SerperStubHandler
+
+
+def create_server(host: str = "127.0.0.1", port: int = 8765, fixtures: str = DEFAULT_FIXTURES,
+                  latency: str = "0", error_rate: float = 0.0, seed: int = 0) -> ThreadingHTTPServer:
+    """Build (but do not start) a stand-in server; call serve_forever() on the result."""
+    handler = make_handler(
+        FixtureCorpus(fixtures),
+        LatencyModel(latency, seed),
+        FaultInjector(error_rate, seed=seed)
+    )
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Serper-compatible stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES, help="Path to the fixture corpus JSON")
+    parser.add_argument("--latency", default="0", help="e.g. 0.2, uniform:0.1:0.5, lognormal:0.3:0.6")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 429/500")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.fixtures, args.latency, args.error_rate, args.seed)
+    print(f"Serper stand-in listening on http://{args.host}:{server.server_port}")
+    print(f"Use it with: SERPER_BASE_URL=http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+In-flight request coalescing ("single-flight") for the search helpers.
+
+When several agents or crews running in threads issue the same search at the
+same moment, only the first caller performs the request. Every other caller
+with the same key waits for that call and receives its result (or its
+exception). Once the call completes the key is released, so later calls go
+through the search cache as usual.
+"""
+
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key onto one execution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn):
+        """
+        Run fn() for key unless an identical call is already in flight.
+
+        Args:
+            key: Identifier of the request, e.g. a search cache key
+            fn: Zero-argument callable performing the work
+
+        Returns:
+            The result of fn(), possibly computed by another thread
+
+        Raises:
+            Whatever fn() raised, in every caller sharing the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+
+# Shared instance used by usefulTools/search_cache.py
+search_flight = SingleFlight()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Regression test: cancelling a coroutine that waits on the LLM governor must not leak its slot.
+"""
+
+import asyncio
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from usefulTools.llm_governor import CREW, LLMGovernor
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    governor = LLMGovernor(max_concurrency=1)
+
+    async def scenario():
+        holder = await governor.acquire_async(CREW)
+        waiter = asyncio.create_task(governor.acquire_async(CREW))
+        await asyncio.sleep(0.05)
+        assert governor.metrics()["queue_depth"]["crew"] == 1
+
+        waiter.cancel()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+        governor.release(holder)
+
+        # The slot is free again, so a fresh acquire goes straight through
+        permit = await asyncio.wait_for(governor.acquire_async(CREW), timeout=2)
+        governor.release(permit)
+
+    asyncio.run(scenario())
+    metrics = governor.metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["queue_depth"]["crew"] == 0
+
+
+def test_permit_granted_after_cancellation_is_released():
+    governor = LLMGovernor(max_concurrency=1)
+
+    async def scenario():
+        holder = await governor.acquire_async(CREW)
+        waiter = asyncio.create_task(governor.acquire_async(CREW))
+        await asyncio.sleep(0.05)
+        # Free the slot and cancel in the same step, so the worker may get the permit first
+        governor.release(holder)
+        waiter.cancel()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert governor.metrics()["in_flight"] == 0
+
+
+if __name__ == "__main__":
+    test_cancelled_waiter_does_not_leak_slot()
+    test_permit_granted_after_cancellation_is_released()
+    print("✓ Cancelled governor waits release their slots")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Regression test: a half-open probe that is cancelled must not leave the circuit breaker stuck open.
+"""
+
+import asyncio
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from usefulTools.llm_retry import get_breaker, llm_retry
+
+
+def _half_open_breaker(name):
+    breaker = get_breaker(name)
+    breaker.reset_timeout = 0.05
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    time.sleep(0.1)
+    assert breaker.state == "half_open"
+    return breaker
+
+
+def test_cancelled_async_probe_releases_breaker():
+    breaker = _half_open_breaker("test-async-probe")
+
+    @llm_retry(breaker="test-async-probe", max_retries=0)
+    async def call(delay):
+        await asyncio.sleep(delay)
+        return "ok"
+
+    async def scenario():
+        probe = asyncio.create_task(call(1))
+        await asyncio.sleep(0.05)
+        probe.cancel()
+        try:
+            await probe
+        except asyncio.CancelledError:
+            pass
+        # The next call becomes the probe and closes the breaker
+        return await call(0)
+
+    assert asyncio.run(scenario()) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_interrupted_sync_probe_releases_breaker():
+    breaker = _half_open_breaker("test-sync-probe")
+
+    @llm_retry(breaker="test-sync-probe", max_retries=0)
+    def call(interrupt):
+        if interrupt:
+            raise KeyboardInterrupt
+        return "ok"
+
+    try:
+        call(True)
+    except KeyboardInterrupt:
+        pass
+    assert call(False) == "ok"
+    assert breaker.state == "closed"
+
+
+if __name__ == "__main__":
+    test_cancelled_async_probe_releases_breaker()
+    test_interrupted_sync_probe_releases_breaker()
+    print("✓ Cancelled half-open probes release the circuit breaker")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Regression test: closing a stream mid-way frees its governor slot and the circuit breaker's probe.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from usefulTools.llm_governor import get_governor
+from usefulTools.llm_retry import get_breaker
+from usefulTools.llm_streaming import stream_text
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self.text_stream = iter(chunks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_final_message(self):
+        return None
+
+
+class _FakeClient:
+    def __init__(self, chunks):
+        self.messages = self
+        self.chunks = chunks
+
+    def stream(self, **request):
+        return _FakeStream(self.chunks)
+
+
+def _half_open_breaker(name):
+    breaker = get_breaker(name)
+    breaker.reset_timeout = 0.05
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    time.sleep(0.1)
+    assert breaker.state == "half_open"
+    return breaker
+
+
+def _request():
+    return {"model": "claude-3-5-haiku-20241022", "max_tokens": 16, "messages": [{"role": "user", "content": "hi"}]}
+
+
+def test_closing_stream_frees_slot():
+    chunks = stream_text(_FakeClient(["a", "b", "c"]), breaker="test-stream-slot", **_request())
+    assert next(chunks) == "a"
+    assert get_governor().metrics()["in_flight"] == 1
+    chunks.close()
+    assert get_governor().metrics()["in_flight"] == 0
+
+
+def test_closing_probe_mid_stream_releases_breaker():
+    breaker = _half_open_breaker("test-stream-probe")
+    chunks = stream_text(_FakeClient(["a", "b"]), breaker="test-stream-probe", **_request())
+    assert next(chunks) == "a"
+    chunks.close()
+    # The API was answering, so the probe counts as a success
+    assert breaker.state == "closed"
+    assert get_governor().metrics()["in_flight"] == 0
+
+
+def test_interrupted_probe_before_first_token_releases_breaker():
+    breaker = _half_open_breaker("test-stream-interrupted")
+
+    def interrupted():
+        raise KeyboardInterrupt
+        yield
+
+    client = _FakeClient([])
+    client.chunks = interrupted()
+    try:
+        list(stream_text(client, breaker="test-stream-interrupted", **_request()))
+    except KeyboardInterrupt:
+        pass
+    assert get_governor().metrics()["in_flight"] == 0
+    # The next stream becomes the probe and closes the breaker
+    assert list(stream_text(_FakeClient(["ok"]), breaker="test-stream-interrupted", **_request())) == ["ok"]
+    assert breaker.state == "closed"
+
+
+if __name__ == "__main__":
+    test_closing_stream_frees_slot()
+    test_closing_probe_mid_stream_releases_breaker()
+    test_interrupted_probe_before_first_token_releases_breaker()
+    print("✓ Closed streams release their slot and circuit breaker probe")
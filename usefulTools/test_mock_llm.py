@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Regression test: responses recorded inside cacheable_scope() replay on the mock client.
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from usefulTools.llm_retry import wrap_anthropic_client
+from usefulTools.mock_llm import MockAnthropicClient, MockResponder, record_responses
+from usefulTools.prompt_cache import cacheable_scope
+
+
+class _RecordedClient:
+    """Stands in for the real SDK client during recording."""
+
+    def __init__(self):
+        self.messages = self
+        self.requests = []
+
+    def create(self, **request):
+        self.requests.append(request)
+        return SimpleNamespace(content=[SimpleNamespace(text="recorded analysis")],
+                               usage=SimpleNamespace(input_tokens=10, output_tokens=2))
+
+
+def test_record_replay_round_trip_with_cacheable_scope():
+    transcript = "HOST: Welcome back to the show.\nGUEST: Thanks for having me."
+    request = {
+        "model": "claude-3-5-sonnet-20240620",
+        "max_tokens": 64,
+        "system": "You are a podcast editor.",
+        "messages": [{"role": "user", "content": f"Transcript chunk:\n{transcript}\n\nSuggest visuals."}],
+    }
+    path = os.path.join(tempfile.mkdtemp(), "recordings.jsonl")
+    os.environ["LLM_MOCK_RECORDINGS"] = path
+
+    real = _RecordedClient()
+    record_responses(wrap_anthropic_client(real))
+    with cacheable_scope(transcript):
+        real.messages.create(**request)
+    # The request really was split into marked blocks on its way out
+    assert isinstance(real.requests[0]["messages"][0]["content"], list)
+
+    responder = MockResponder(path=path)
+    mock = wrap_anthropic_client(MockAnthropicClient(responder))
+    with cacheable_scope(transcript):
+        response = mock.messages.create(**request)
+    assert response.content[0].text == "recorded analysis"
+    assert responder.replayed == 1 and responder.stubbed == 0
+
+
+if __name__ == "__main__":
+    test_record_replay_round_trip_with_cacheable_scope()
+    print("✓ Recordings made under cacheable_scope replay on the mock client")